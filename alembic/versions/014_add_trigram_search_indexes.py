@@ -0,0 +1,37 @@
+"""Add pg_trgm GIN indexes for ILIKE search on list endpoints
+
+Revision ID: 014
+Revises: 013
+Create Date: 2026-10-16
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '014'
+down_revision = '013'
+branch_labels = None
+depends_on = None
+
+# (index name, table, column) served by substring ILIKE searches
+TRIGRAM_INDEXES = [
+    ('ix_entry_points_name_trgm', 'entry_points', 'name'),
+    ('ix_entry_points_description_trgm', 'entry_points', 'description'),
+    ('ix_files_relative_path_trgm', 'files', 'relative_path'),
+    ('ix_repositories_name_trgm', 'repositories', 'name'),
+    ('ix_repositories_description_trgm', 'repositories', 'description'),
+]
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for name, table, column in TRIGRAM_INDEXES:
+        op.execute(
+            f'CREATE INDEX IF NOT EXISTS {name} ON "{table}" '
+            f'USING gin ({column} gin_trgm_ops)'
+        )
+
+
+def downgrade() -> None:
+    for name, _table, _column in reversed(TRIGRAM_INDEXES):
+        op.execute(f"DROP INDEX IF EXISTS {name}")
@@ -0,0 +1,32 @@
+"""Cover content_hash in the files (repo_id, relative_path) unique index
+
+Revision ID: 015
+Revises: 014
+Create Date: 2026-10-16
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '015'
+down_revision = '014'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # INCLUDE content_hash so incremental re-parse hash checks are index-only
+    # scans; recreated in place rather than adding a second index on the key
+    op.drop_index('ix_files_repo_path', table_name='files', if_exists=True)
+    op.create_index(
+        'ix_files_repo_path',
+        'files',
+        ['repo_id', 'relative_path'],
+        unique=True,
+        postgresql_include=['content_hash'],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_files_repo_path', table_name='files', if_exists=True)
+    op.create_index('ix_files_repo_path', 'files', ['repo_id', 'relative_path'], unique=True)
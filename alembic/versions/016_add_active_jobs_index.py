@@ -0,0 +1,31 @@
+"""Add partial index for active parsing job counts
+
+Revision ID: 016
+Revises: 015
+Create Date: 2026-10-16
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '016'
+down_revision = '015'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Small index covering only queued/running jobs for the status counts query
+    op.create_index(
+        'ix_jobs_active',
+        'parsing_jobs',
+        ['status'],
+        unique=False,
+        postgresql_where=sa.text("status IN ('pending', 'parsing')"),
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_jobs_active', table_name='parsing_jobs', if_exists=True)
@@ -0,0 +1,38 @@
+"""Replace entry point (repo_id, type) index with (repo_id, type, framework)
+
+Revision ID: 017
+Revises: 016
+Create Date: 2026-10-16
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '017'
+down_revision = '016'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Serves list_filtered; its (repo_id, entry_point_type) prefix makes
+    # ix_entry_points_repo_type redundant
+    op.create_index(
+        'ix_entry_points_lookup',
+        'entry_points',
+        ['repo_id', 'entry_point_type', 'framework'],
+        unique=False,
+        if_not_exists=True,
+    )
+    op.drop_index('ix_entry_points_repo_type', table_name='entry_points', if_exists=True)
+
+
+def downgrade() -> None:
+    op.create_index(
+        'ix_entry_points_repo_type',
+        'entry_points',
+        ['repo_id', 'entry_point_type'],
+        unique=False,
+        if_not_exists=True,
+    )
+    op.drop_index('ix_entry_points_lookup', table_name='entry_points', if_exists=True)
@@ -0,0 +1,51 @@
+"""Add indexes for cross-file reference resolution
+
+Revision ID: 018
+Revises: 017
+Create Date: 2026-10-16
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '018'
+down_revision = '017'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Name lookup for resolve_cross_file_references without a heap fetch;
+    # same key as ix_symbols_name, which it replaces
+    op.create_index(
+        'ix_symbols_repo_name',
+        'symbols',
+        ['repo_id', 'name'],
+        unique=False,
+        postgresql_include=['file_id', 'id'],
+        if_not_exists=True,
+    )
+    op.drop_index('ix_symbols_name', table_name='symbols', if_exists=True)
+
+    # Only the references still waiting for a target
+    op.create_index(
+        'ix_references_repo_unresolved',
+        'references',
+        ['repo_id'],
+        unique=False,
+        postgresql_where=sa.text('target_symbol_id IS NULL'),
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_references_repo_unresolved', table_name='references', if_exists=True)
+    op.create_index(
+        'ix_symbols_name',
+        'symbols',
+        ['repo_id', 'name'],
+        unique=False,
+        if_not_exists=True,
+    )
+    op.drop_index('ix_symbols_repo_name', table_name='symbols', if_exists=True)
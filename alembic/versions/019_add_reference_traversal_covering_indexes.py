@@ -0,0 +1,58 @@
+"""Replace reference source/target indexes with covering indexes
+
+Revision ID: 019
+Revises: 018
+Create Date: 2026-10-16
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '019'
+down_revision = '018'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Each get_downstream/get_upstream hop becomes an index-only scan;
+    # same keys as ix_references_source/ix_references_target, which they replace
+    op.create_index(
+        'ix_references_source_target',
+        'references',
+        ['source_symbol_id'],
+        unique=False,
+        postgresql_include=[
+            'target_symbol_id', 'target_file_path', 'target_symbol_name', 'reference_type',
+        ],
+        if_not_exists=True,
+    )
+    op.create_index(
+        'ix_references_target_source',
+        'references',
+        ['target_symbol_id'],
+        unique=False,
+        postgresql_include=['source_symbol_id', 'reference_type'],
+        if_not_exists=True,
+    )
+    op.drop_index('ix_references_source', table_name='references', if_exists=True)
+    op.drop_index('ix_references_target', table_name='references', if_exists=True)
+
+
+def downgrade() -> None:
+    op.create_index(
+        'ix_references_source',
+        'references',
+        ['source_symbol_id'],
+        unique=False,
+        if_not_exists=True,
+    )
+    op.create_index(
+        'ix_references_target',
+        'references',
+        ['target_symbol_id'],
+        unique=False,
+        if_not_exists=True,
+    )
+    op.drop_index('ix_references_target_source', table_name='references', if_exists=True)
+    op.drop_index('ix_references_source_target', table_name='references', if_exists=True)
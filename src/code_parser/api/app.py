@@ -1,9 +1,9 @@
 """FastAPI application factory."""
 
 from contextlib import asynccontextmanager
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Awaitable, Callable
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 
 from code_parser import __version__
@@ -20,6 +20,7 @@ from code_parser.api.routes.health import set_worker_manager
 from code_parser.config import get_settings
 from code_parser.database.connection import init_database, get_session_manager
 from code_parser.logging import configure_logging, get_logger
+from code_parser.repositories.request_cache import request_cache_scope
 from code_parser.workers import WorkerManager
 
 logger = get_logger(__name__)
@@ -72,6 +73,14 @@ def create_app() -> FastAPI:
         allow_headers=["*"],
     )
 
+    @app.middleware("http")
+    async def request_cache_middleware(
+        request: Request, call_next: Callable[[Request], Awaitable[Response]]
+    ) -> Response:
+        """Deduplicate identical repository reads within a request."""
+        with request_cache_scope():
+            return await call_next(request)
+
     # Register routers
     app.include_router(health_router)
     app.include_router(repositories_router, prefix="/api/v1")
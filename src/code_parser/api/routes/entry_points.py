@@ -131,15 +131,12 @@ async def list_entry_points(
                 detail=f"Invalid entry_point_type: {entry_point_type}. Must be one of: HTTP, EVENT, SCHEDULER",
             )
     
-    # Get entry points
-    if entry_point_type:
-        entry_points = await entry_point_repo.get_by_type(
-            repo_id, EntryPointType(entry_point_type.lower())
-        )
-    elif framework:
-        entry_points = await entry_point_repo.get_by_framework(repo_id, framework)
-    else:
-        entry_points = await entry_point_repo.get_by_repo(repo_id)
+    # Get entry points (both filters apply when given)
+    entry_points = await entry_point_repo.list_filtered(
+        repo_id,
+        entry_point_type=EntryPointType(entry_point_type.lower()) if entry_point_type else None,
+        framework=framework or None,
+    )
     
     # Convert models to response format, handling metadata field
     results = []
@@ -4,7 +4,7 @@ from fastapi import APIRouter, HTTPException
 from sqlalchemy import text
 
 from code_parser import __version__
-from code_parser.api.dependencies import DbSession
+from code_parser.api.dependencies import DbSession, JobRepo
 from code_parser.api.schemas import HealthResponse
 from code_parser.workers import WorkerManager
 
@@ -21,23 +21,27 @@ def set_worker_manager(manager: WorkerManager) -> None:
 
 
 @router.get("/health", response_model=HealthResponse)
-async def health_check(session: DbSession) -> HealthResponse:
+async def health_check(session: DbSession, job_repository: JobRepo) -> HealthResponse:
     """
     Health check endpoint.
     
     Returns the status of the service, database connectivity,
-    and worker status.
+    and worker status including the parsing job queue depth.
     """
     # Check database
+    job_counts: dict[str, int] = {}
     try:
         await session.execute(text("SELECT 1"))
         db_status = "healthy"
+        job_counts = await job_repository.get_status_counts()
     except Exception as e:
         db_status = f"unhealthy: {e}"
 
     # Check workers
     worker_status = {
         "running": _worker_manager.is_running if _worker_manager else False,
+        "pending_jobs": job_counts.get("pending", 0),
+        "running_jobs": job_counts.get("parsing", 0),
     }
 
     overall_status = "healthy" if db_status == "healthy" else "degraded"
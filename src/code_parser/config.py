@@ -33,6 +33,10 @@ class Settings(BaseSettings):
     # Parsing settings
     max_file_size_bytes: int = 1_000_000  # 1MB
     parse_timeout_seconds: int = 30
+    # Kotlin parse result cache; disabled unless a directory is set. Entries
+    # are unpickled, so the directory must only be writable by this service
+    parse_cache_dir: str | None = None
+    parse_cache_max_bytes: int = 512_000_000  # 512MB, oldest entries evicted first
 
     # AI / LLM settings
     claude_bedrock_url: str = ""  # Set via CLAUDE_BEDROCK_URL env var or CodeCircle AI Settings
@@ -2,7 +2,9 @@
 
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
+from typing import Any
 
+import orjson
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
     AsyncSession,
@@ -16,6 +18,11 @@ from code_parser.logging import get_logger
 logger = get_logger(__name__)
 
 
+def _json_serializer(value: Any) -> str:
+    """Serialize JSONB values with orjson (non-str keys coerced like json.dumps)."""
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
 class DatabaseSessionManager:
     """
     Manages database connections and sessions.
@@ -32,6 +39,12 @@ class DatabaseSessionManager:
             max_overflow=20,
             pool_pre_ping=True,
             pool_recycle=3600,
+            # Room for every repository statement shape (default is 500)
+            query_cache_size=2000,
+            # Rows per multi-VALUES batch for executemany inserts
+            insertmanyvalues_page_size=1000,
+            json_serializer=_json_serializer,
+            json_deserializer=orjson.loads,
         )
         self._session_factory = async_sessionmaker(
             bind=self._engine,
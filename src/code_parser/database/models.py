@@ -95,6 +95,18 @@ class RepositoryModel(Base):
         Index("ix_repositories_status", "status"),
         Index("ix_repositories_org_id", "org_id"),
         Index("ix_repositories_org_path", "org_id", "root_path", unique=True),
+        Index(
+            "ix_repositories_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_repositories_description_trgm",
+            "description",
+            postgresql_using="gin",
+            postgresql_ops={"description": "gin_trgm_ops"},
+        ),
     )
 
 
@@ -123,8 +135,20 @@ class FileModel(Base):
     )
 
     __table_args__ = (
-        Index("ix_files_repo_path", "repo_id", "relative_path", unique=True),
+        Index(
+            "ix_files_repo_path",
+            "repo_id",
+            "relative_path",
+            unique=True,
+            postgresql_include=["content_hash"],
+        ),
         Index("ix_files_content_hash", "content_hash"),
+        Index(
+            "ix_files_relative_path_trgm",
+            "relative_path",
+            postgresql_using="gin",
+            postgresql_ops={"relative_path": "gin_trgm_ops"},
+        ),
     )
 
 
@@ -178,7 +202,7 @@ class SymbolModel(Base):
     __table_args__ = (
         Index("ix_symbols_qualified_name", "repo_id", "qualified_name"),
         Index("ix_symbols_kind", "repo_id", "kind"),
-        Index("ix_symbols_name", "repo_id", "name"),
+        Index("ix_symbols_repo_name", "repo_id", "name", postgresql_include=["file_id", "id"]),
         Index("ix_symbols_file", "file_id"),
         Index("ix_symbols_position", "repo_id", "start_line", "end_line"),
     )
@@ -216,10 +240,28 @@ class ReferenceModel(Base):
     )
 
     __table_args__ = (
-        Index("ix_references_source", "source_symbol_id"),
-        Index("ix_references_target", "target_symbol_id"),
+        Index(
+            "ix_references_source_target",
+            "source_symbol_id",
+            postgresql_include=[
+                "target_symbol_id",
+                "target_file_path",
+                "target_symbol_name",
+                "reference_type",
+            ],
+        ),
+        Index(
+            "ix_references_target_source",
+            "target_symbol_id",
+            postgresql_include=["source_symbol_id", "reference_type"],
+        ),
         Index("ix_references_target_path", "repo_id", "target_file_path"),
         Index("ix_references_type", "repo_id", "reference_type"),
+        Index(
+            "ix_references_repo_unresolved",
+            "repo_id",
+            postgresql_where=target_symbol_id.is_(None),
+        ),
     )
 
 
@@ -246,6 +288,11 @@ class ParsingJobModel(Base):
 
     __table_args__ = (
         Index("ix_jobs_pending", "status", "created_at", postgresql_where=(status == "pending")),
+        Index(
+            "ix_jobs_active",
+            "status",
+            postgresql_where=status.in_(["pending", "parsing"]),
+        ),
     )
 
 
@@ -320,9 +367,21 @@ class EntryPointModel(Base):
     file: Mapped["FileModel"] = relationship()
 
     __table_args__ = (
-        Index("ix_entry_points_repo_type", "repo_id", "entry_point_type"),
+        Index("ix_entry_points_lookup", "repo_id", "entry_point_type", "framework"),
         Index("ix_entry_points_symbol", "symbol_id"),
         Index("ix_entry_points_framework", "repo_id", "framework"),
+        Index(
+            "ix_entry_points_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_entry_points_description_trgm",
+            "description",
+            postgresql_using="gin",
+            postgresql_ops={"description": "gin_trgm_ops"},
+        ),
     )
 
 
@@ -1,11 +1,14 @@
 """Code parsers using tree-sitter for AST analysis."""
 
-from code_parser.parsers.base import LanguageParser
+from code_parser.parsers.base import LanguageParser, SourceEdit
+from code_parser.parsers.parallel import parse_files
 from code_parser.parsers.registry import ParserRegistry, get_parser_registry
 
 __all__ = [
     "LanguageParser",
     "ParserRegistry",
+    "SourceEdit",
     "get_parser_registry",
+    "parse_files",
 ]
 
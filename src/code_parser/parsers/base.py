@@ -1,10 +1,45 @@
 """Base parser abstraction for language-specific implementations."""
 
+import hashlib
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from functools import lru_cache
 
 from code_parser.core import Language, ParsedFile, Reference, Symbol
 
 
+@lru_cache(maxsize=4096)
+def _dot_path(file_path: str, extensions: frozenset[str]) -> str:
+    """
+    Convert a file path to dot notation, dropping the first matching extension.
+
+    Example: "src/utils/helpers.py" -> "src.utils.helpers"
+    """
+    path = file_path
+    for ext in extensions:
+        if path.endswith(ext):
+            path = path[: -len(ext)]
+            break
+    return path.replace("/", ".").replace("\\", ".")
+
+
+@dataclass(frozen=True, slots=True)
+class SourceEdit:
+    """
+    A single text edit, described the way tree-sitter's Tree.edit expects.
+
+    Byte offsets index the UTF-8 encoded source; points are (row, column)
+    pairs with 0-indexed rows and byte columns.
+    """
+
+    start_byte: int
+    old_end_byte: int
+    new_end_byte: int
+    start_point: tuple[int, int]
+    old_end_point: tuple[int, int]
+    new_end_point: tuple[int, int]
+
+
 class LanguageParser(ABC):
     """
     Abstract base class for language-specific parsers.
@@ -41,6 +76,18 @@ class LanguageParser(ABC):
         """
         ...
 
+    def parse_path(self, path: str, relative_path: str) -> ParsedFile:
+        """
+        Read and parse a source file from disk.
+
+        The content hash is the SHA-256 of the raw bytes; bytes that are not
+        valid UTF-8 are replaced before parsing.
+        """
+        with open(path, "rb") as f:
+            raw = f.read()
+        content_hash = hashlib.sha256(raw).hexdigest()
+        return self.parse(raw.decode("utf-8", errors="replace"), relative_path, content_hash)
+
     def _build_qualified_name(self, file_path: str, *parts: str) -> str:
         """
         Build a qualified name from file path and symbol parts.
@@ -48,14 +95,7 @@ class LanguageParser(ABC):
         Example: "src/utils/helpers.py" + "MyClass" + "my_method"
                  -> "src.utils.helpers.MyClass.my_method"
         """
-        # Convert file path to module-like notation
-        module_path = file_path.replace("/", ".").replace("\\", ".")
-        # Remove extension
-        for ext in self.file_extensions:
-            if module_path.endswith(ext):
-                module_path = module_path[: -len(ext)]
-                break
-
+        module_path = _dot_path(file_path, self.file_extensions)
         if parts:
             return f"{module_path}.{'.'.join(parts)}"
         return module_path
@@ -82,12 +122,10 @@ class LanguageParser(ABC):
         
         # tree-sitter points are (row, column) where row is 0-indexed
         # We convert to 1-indexed lines
-        start_line = start_point[0] + 1 if start_point[0] is not None else None
-        end_line = end_point[0] + 1 if end_point[0] is not None else None
-        start_column = start_point[1] if start_point[1] is not None else None
-        end_column = end_point[1] if end_point[1] is not None else None
+        start_row, start_column = start_point
+        end_row, end_column = end_point
         
-        return (start_line, end_line, start_column, end_column)
+        return (start_row + 1, end_row + 1, start_column, end_column)
 
 
 class ParseContext:
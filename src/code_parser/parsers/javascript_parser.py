@@ -1,5 +1,7 @@
 """JavaScript language parser using tree-sitter."""
 
+import re
+
 import tree_sitter_javascript as ts_javascript
 from tree_sitter import Language, Node, Parser
 
@@ -13,6 +15,13 @@ from code_parser.core import (
 )
 from code_parser.parsers.base import LanguageParser, ParseContext
 
+# One JSDoc line with the comment delimiters and leading "*" stripped
+_JSDOC_LINE = re.compile(
+    rb"^[ \t\r\f\v]*(?:/\*\*)?[ \t\r\f\v]*(?:\*(?!/))?[ \t\r\f\v]*"
+    rb"(.*?)[ \t\r\f\v]*(?:\*/)?[ \t\r\f\v]*$",
+    re.MULTILINE,
+)
+
 
 class JavaScriptParser(LanguageParser):
     """
@@ -536,19 +545,13 @@ class JavaScriptParser(LanguageParser):
         for i in range(node_index - 1, -1, -1):
             prev_sibling = parent.children[i]
             if prev_sibling.type == "comment":
-                comment_text = self._get_node_text(prev_sibling, source_bytes)
-                if comment_text.strip().startswith("/**"):
-                    # Extract JSDoc content
-                    lines = comment_text.split("\n")
-                    jsdoc_lines = []
-                    for line in lines:
-                        line = line.strip()
-                        line = line.removeprefix("/**").removesuffix("*/").strip()
-                        line = line.removeprefix("*").strip()
-                        if line:
-                            jsdoc_lines.append(line)
-                    if jsdoc_lines:
-                        return "\n".join(jsdoc_lines)
+                # Only JSDoc blocks are interesting; test the raw bytes before decoding
+                if not source_bytes.startswith(b"/**", prev_sibling.start_byte, prev_sibling.end_byte):
+                    continue
+                comment_bytes = source_bytes[prev_sibling.start_byte : prev_sibling.end_byte]
+                jsdoc_lines = [line for line in _JSDOC_LINE.findall(comment_bytes) if line]
+                if jsdoc_lines:
+                    return b"\n".join(jsdoc_lines).decode("utf-8", errors="replace")
         
         return None
     
@@ -1,7 +1,16 @@
 """Kotlin language parser using tree-sitter."""
 
+import hashlib
+import mmap
+import os
+import pickle
+import tempfile
+import threading
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+
 import tree_sitter_kotlin as ts_kotlin
-from tree_sitter import Language, Node, Parser
+from tree_sitter import Language, Node, Parser, Query, QueryCursor, Tree
 
 from code_parser.core import (
     Language as CodeLanguage,
@@ -11,33 +20,107 @@ from code_parser.core import (
     Symbol,
     SymbolKind,
 )
-from code_parser.parsers.base import LanguageParser, ParseContext
+from code_parser.parsers.base import LanguageParser, ParseContext, SourceEdit, _dot_path
+
+# Walk actions returned by node handlers
+_DESCEND = 0  # Visit the node's children
+_SKIP = 1  # Do not visit the node's children
+_ENTER_SCOPE = 2  # Handler pushed a scope; visit only its body child
+
+# Built once: the set is part of the dot-path cache key and caches its hash
+_FILE_EXTENSIONS = frozenset({".kt", ".kts"})
+
+# Bump when the extracted output changes so stale cache entries are ignored
+_CACHE_FORMAT = 3
+
+# Class member patterns, matched against a class body (methods, properties)
+# or a primary constructor (parameters)
+_MEMBER_QUERY = """
+(function_declaration name: (identifier) @method.name)
+(property_declaration
+  (variable_declaration (identifier) @field.name (user_type) @field.type))
+(class_parameter (identifier) @field.name (user_type) @field.type)
+"""
+_METHOD_PATTERN = 0
+
+# Shared metadata for symbols without any; Symbol consumers only read metadata
+_EMPTY_METADATA: dict[str, str | int | bool | list] = {}
+
+
+def _grammar_version() -> str | None:
+    """Return the installed tree-sitter-kotlin version, or None if unknown."""
+    try:
+        return f"{version('tree-sitter-kotlin')}/{_CACHE_FORMAT}"
+    except PackageNotFoundError:
+        return None
 
 
 class KotlinParseContext(ParseContext):
     """Extended context for Kotlin parsing with type resolution."""
 
-    def __init__(self, file_path: str, source_bytes: bytes) -> None:
+    def __init__(self, file_path: str, source_bytes: bytes, dotted_file_path: str) -> None:
         super().__init__(file_path, source_bytes)
-        # Import map: short_name -> full_path
-        # e.g., "RiskAssessmentService" -> "com.toasttab.service.ccfraud.service.RiskAssessmentService"
-        self.imports: dict[str, str] = {}
-        # Field/parameter types: field_name -> type_name
-        # e.g., "riskAssessmentService" -> "RiskAssessmentService"
-        self.field_types: dict[str, str] = {}
-        # Methods in current class (for resolving same-class calls)
-        self.class_methods: set[str] = set()
+        # File path in dot notation (source of file-level references)
+        self.dotted_file_path = dotted_file_path
+        # (path, symbol_name) of each scope on the stack, split once on push
+        self._scope_splits: list[tuple[str, str]] = []
+        # KDoc always starts with "/**"; without one in the file, lookups are skipped
+        self.may_have_kdoc: bool = b"/**" in source_bytes
+        # References already recorded; chained calls repeat the same edge
+        self._seen_references: set[Reference] = set()
+        # Import map: short_name -> full_path (keys are raw source bytes)
+        # e.g., b"RiskAssessmentService" -> "com.toasttab.service.ccfraud.service.RiskAssessmentService"
+        self.imports: dict[bytes, str] = {}
+        # Field/parameter types: field_name -> type_name (raw source bytes)
+        # e.g., b"riskAssessmentService" -> b"RiskAssessmentService"
+        self.field_types: dict[bytes, bytes] = {}
+        # Methods in current class, as raw source bytes (for resolving same-class calls)
+        self.class_methods: set[bytes] = set()
         # Current class qualified name (for resolving sibling methods)
         self.current_class_qualified_name: str | None = None
         # Package declaration (for same-package type resolution)
         # e.g., "com.toasttab.service.ccfraud.service"
         self.package_name: str | None = None
+        # Set once the walk enters a declaration; names are resolved from then on
+        self.resolving: bool = False
+        # An import was collected after resolution started (invalid/unusual code)
+        self.late_import: bool = False
+        # imports/package_name are already complete and must not be updated
+        self.imports_complete: bool = False
+        # Resolved call targets / type paths; only valid for the current class context
+        self.resolve_call_cache: dict[bytes, tuple[str, str]] = {}
+        self.resolve_type_cache: dict[bytes, str] = {}
+
+    def add_reference(self, reference: Reference) -> None:
+        """Add an extracted reference, skipping exact duplicates."""
+        if reference not in self._seen_references:
+            self._seen_references.add(reference)
+            self.references.append(reference)
+
+    def push_scope(self, qualified_name: str) -> None:
+        """Enter a nested scope and split its qualified name once."""
+        super().push_scope(qualified_name)
+        path, dot, name = qualified_name.rpartition(".")
+        self._scope_splits.append((path, name) if dot else (qualified_name, qualified_name))
+
+    def pop_scope(self) -> str | None:
+        """Exit the current scope."""
+        if self._scope_splits:
+            self._scope_splits.pop()
+        return super().pop_scope()
+
+    @property
+    def current_scope_split(self) -> tuple[str, str]:
+        """(path, symbol_name) of the current scope; only valid inside a scope."""
+        return self._scope_splits[-1]
 
     def clear_class_context(self) -> None:
-        """Clear class-specific context when exiting a class."""
+        """Clear class-specific context when entering or exiting a class."""
         self.field_types.clear()
         self.class_methods.clear()
         self.current_class_qualified_name = None
+        self.resolve_call_cache.clear()
+        self.resolve_type_cache.clear()
 
 
 class KotlinParser(LanguageParser):
@@ -49,9 +132,78 @@ class KotlinParser(LanguageParser):
     qualified paths using import and type information.
     """
 
-    def __init__(self) -> None:
+    # Keywords, literals, and common primitives never resolved from call arguments
+    _SKIP_ARG_KEYWORDS: frozenset[bytes] = frozenset(
+        {b"true", b"false", b"null", b"this", b"it", b"super"}
+    )
+
+    def __init__(self, cache_dir: Path | None = None) -> None:
         self._language = Language(ts_kotlin.language())
-        self._parser = Parser(self._language)
+        # tree-sitter parsers and query cursors are not thread-safe; each
+        # thread gets its own, created on first use
+        self._local = threading.local()
+        # Optional on-disk cache of parse results, keyed by the SHA-256 of the
+        # source bytes. Entries are unpickled, so cache_dir must only be
+        # writable by this service; its size is bounded with prune_parse_cache.
+        # Disabled when the grammar version cannot be determined (entries
+        # could not be invalidated)
+        self._grammar_version = _grammar_version()
+        self._cache_dir = cache_dir if self._grammar_version else None
+        # Node kinds are compared by integer id rather than by type name
+        kind = self._kind_id
+        self._class_kind = kind("class_declaration")
+        # Comment kinds checked for KDoc (None when the grammar lacks the kind)
+        self._kdoc_kind = kind("kdoc")
+        self._line_comment_kind = kind("line_comment")
+        # Node kind -> handler returning a walk action
+        self._handlers = {
+            kind("package_header"): self._process_package_header,
+            self._class_kind: self._process_class,
+            kind("object_declaration"): self._process_object,
+            kind("companion_object"): self._process_companion_object,
+            kind("function_declaration"): self._process_function,
+            kind("import"): self._process_import,
+            kind("call_expression"): self._process_call,
+        }
+        # Handlers indexed directly by kind id; ids past the table (ERROR nodes
+        # use 65535) have no handler
+        self._dispatch = tuple(
+            self._handlers.get(kind_id) for kind_id in range(self._language.node_kind_count)
+        )
+        # Class member query; matches are limited to declarations directly
+        # inside the node it runs on via the cursor's max start depth
+        self._member_query = Query(self._language, _MEMBER_QUERY)
+        # Scope-introducing node kind -> body node kind walked inside the scope
+        self._scope_bodies = {
+            self._class_kind: kind("class_body"),
+            kind("object_declaration"): kind("class_body"),
+            kind("companion_object"): kind("class_body"),
+            kind("function_declaration"): kind("function_body"),
+        }
+        # Identifier kinds picked up from call arguments
+        self._argument_id_kinds = frozenset(
+            kind_id
+            for kind_id in (kind("simple_identifier"), kind("identifier"))
+            if kind_id is not None
+        )
+
+    def _get_parser(self) -> Parser:
+        """Get the calling thread's tree-sitter parser."""
+        parser = getattr(self._local, "parser", None)
+        if parser is None:
+            parser = self._local.parser = Parser(self._language)
+        return parser
+
+    def _get_member_cursor(self) -> QueryCursor:
+        """Get the calling thread's cursor for the class member query."""
+        cursor = getattr(self._local, "member_cursor", None)
+        if cursor is None:
+            cursor = self._local.member_cursor = QueryCursor(self._member_query)
+        return cursor
+
+    def _kind_id(self, type_name: str) -> int | None:
+        """Get the grammar's id for a named node type (None if it does not exist)."""
+        return self._language.id_for_node_kind(type_name, True)
 
     @property
     def language(self) -> CodeLanguage:
@@ -59,20 +211,169 @@ class KotlinParser(LanguageParser):
 
     @property
     def file_extensions(self) -> frozenset[str]:
-        return frozenset({".kt", ".kts"})
+        return _FILE_EXTENSIONS
 
     def parse(self, source_code: str, file_path: str, content_hash: str) -> ParsedFile:
         """Parse Kotlin source code and extract symbols and references."""
-        source_bytes = source_code.encode("utf-8")
-        tree = self._parser.parse(source_bytes)
+        return self.parse_bytes(source_code.encode("utf-8"), file_path, content_hash)
 
-        ctx = KotlinParseContext(file_path, source_bytes)
-        
-        # First pass: collect imports
-        self._collect_imports(tree.root_node, ctx)
-        
-        # Second pass: process everything
-        self._process_node(tree.root_node, ctx)
+    def parse_bytes(self, source_bytes: bytes, file_path: str, content_hash: str) -> ParsedFile:
+        """
+        Parse UTF-8 encoded Kotlin source and extract symbols and references.
+
+        For callers that already hold the file's bytes; skips the decode and
+        re-encode a str round trip through parse() would cost.
+        """
+        if self._cache_dir is None:
+            return self._parse_source(source_bytes, file_path, content_hash)
+
+        cache_path = self._cache_path(hashlib.sha256(source_bytes).hexdigest())
+        cached = self._load_cached(cache_path, file_path, content_hash)
+        if cached is not None:
+            return cached
+
+        parsed = self._parse_source(source_bytes, file_path, content_hash)
+        self._store_cached(cache_path, parsed)
+        return parsed
+
+    def parse_path(self, path: str, relative_path: str) -> ParsedFile:
+        """
+        Read and parse a Kotlin file from disk.
+
+        The file is memory-mapped and hashed before it is copied out, so a
+        parse cache hit returns without reading the source into memory or
+        running tree-sitter.
+        """
+        with open(path, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                raw: bytes | mmap.mmap = b""
+            else:
+                raw = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            content_hash = hashlib.sha256(raw).hexdigest()
+            cache_path = None
+            if self._cache_dir is not None:
+                cache_path = self._cache_path(content_hash)
+                cached = self._load_cached(cache_path, relative_path, content_hash)
+                if cached is not None:
+                    return cached
+            source_bytes = raw[:]
+        finally:
+            if isinstance(raw, mmap.mmap):
+                raw.close()
+
+        parsed = self._parse_source(source_bytes, relative_path, content_hash)
+        if cache_path is not None:
+            self._store_cached(cache_path, parsed)
+        return parsed
+
+    def _cache_path(self, source_hash: str) -> Path:
+        """Get the cache file for the SHA-256 hex digest of a file's source."""
+        return self._cache_dir / source_hash[:2] / f"{source_hash[2:]}.pkl"
+
+    def _load_cached(
+        self, cache_path: Path, file_path: str, content_hash: str
+    ) -> ParsedFile | None:
+        """Load a cached parse result if it is valid for this grammar and file."""
+        try:
+            with open(cache_path, "rb") as f:
+                grammar_version, parsed = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception:
+            # Corrupt or incompatible entry; it is overwritten after re-parsing
+            return None
+
+        # Qualified names depend on the file path, so identical content at
+        # another path is a miss; so is a caller-supplied hash that differs
+        if (
+            grammar_version != self._grammar_version
+            or parsed.relative_path != file_path
+            or parsed.content_hash != content_hash
+        ):
+            return None
+        return parsed
+
+    def _store_cached(self, cache_path: Path, parsed: ParsedFile) -> None:
+        """Write a parse result to the cache atomically; failures are ignored."""
+        try:
+            cache_path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=cache_path.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    pickle.dump(
+                        (self._grammar_version, parsed), f, protocol=pickle.HIGHEST_PROTOCOL
+                    )
+                os.replace(tmp_path, cache_path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except OSError:
+            pass
+
+    def _parse_source(
+        self, source_bytes: bytes, file_path: str, content_hash: str
+    ) -> ParsedFile:
+        """Run tree-sitter and extract symbols and references (uncached)."""
+        tree = self._get_parser().parse(source_bytes)
+        return self._extract(tree, source_bytes, file_path, content_hash)
+
+    def parse_incremental(
+        self,
+        new_source: str,
+        file_path: str,
+        content_hash: str,
+        edit: SourceEdit,
+        old_tree: Tree | None,
+    ) -> tuple[ParsedFile, Tree]:
+        """
+        Re-parse edited Kotlin source, reusing the previous syntax tree.
+
+        The edit is applied to old_tree in place, so old_tree must not be
+        used after this call; tree-sitter reuses its subtrees outside the
+        edited range. Returns the parsed file together with the new tree,
+        which callers pass back in on the next edit. Without an old tree
+        this is a full parse. Results are always extracted from the new tree
+        and, when the parse cache is enabled, stored in it, so a later
+        parse() of the same source returns the same result.
+        """
+        source_bytes = new_source.encode("utf-8")
+        if old_tree is None:
+            tree = self._get_parser().parse(source_bytes)
+        else:
+            old_tree.edit(
+                start_byte=edit.start_byte,
+                old_end_byte=edit.old_end_byte,
+                new_end_byte=edit.new_end_byte,
+                start_point=edit.start_point,
+                old_end_point=edit.old_end_point,
+                new_end_point=edit.new_end_point,
+            )
+            tree = self._get_parser().parse(source_bytes, old_tree)
+        parsed = self._extract(tree, source_bytes, file_path, content_hash)
+        if self._cache_dir is not None:
+            self._store_cached(self._cache_path(hashlib.sha256(source_bytes).hexdigest()), parsed)
+        return parsed, tree
+
+    def _extract(
+        self, tree: Tree, source_bytes: bytes, file_path: str, content_hash: str
+    ) -> ParsedFile:
+        """Extract symbols and references from a parsed syntax tree."""
+        # Package and imports are collected during the same walk; they precede
+        # all declarations in valid Kotlin, so they are known before any call
+        # is resolved
+        dotted_file_path = self._file_path_to_dot_notation(file_path)
+        ctx = KotlinParseContext(file_path, source_bytes, dotted_file_path)
+        self._walk(tree.root_node, ctx)
+
+        if ctx.late_import:
+            # Calls were resolved before every import was seen; walk again
+            # with the complete import map
+            imports, package_name = ctx.imports, ctx.package_name
+            ctx = KotlinParseContext(file_path, source_bytes, dotted_file_path)
+            ctx.imports, ctx.package_name = imports, package_name
+            ctx.imports_complete = True
+            self._walk(tree.root_node, ctx)
 
         return ParsedFile(
             relative_path=file_path,
@@ -83,77 +384,104 @@ class KotlinParser(LanguageParser):
             errors=tuple(ctx.errors),
         )
 
-    def _collect_imports(self, node: Node, ctx: KotlinParseContext) -> None:
-        """First pass: collect package declaration and all imports."""
-        # Collect package declaration
-        if node.type == "package_header":
-            for child in node.children:
-                if child.type == "qualified_identifier":
-                    ctx.package_name = self._get_node_text(child, ctx.source_bytes)
-        
-        # Collect imports
-        if node.type == "import":
-            for child in node.children:
-                if child.type == "qualified_identifier":
-                    import_path = self._get_node_text(child, ctx.source_bytes)
-                    short_name = import_path.split(".")[-1]
-                    ctx.imports[short_name] = import_path
-        
-        for child in node.children:
-            self._collect_imports(child, ctx)
-
-    def _process_node(self, node: Node, ctx: KotlinParseContext) -> None:
-        """Recursively process AST nodes."""
-        node_type = node.type
-        
-        # Class declaration (includes interface, data class, enum)
-        if node_type == "class_declaration":
-            self._process_class(node, ctx)
-            return
-        
-        # Object declaration (Kotlin singleton)
-        if node_type == "object_declaration":
-            self._process_object(node, ctx)
-            return
-        
-        # Companion object
-        if node_type == "companion_object":
-            self._process_companion_object(node, ctx)
-            return
-        
-        # Function declaration
-        if node_type == "function_declaration":
-            self._process_function(node, ctx)
-            return
-        
-        # Import (already collected, but still create symbol)
-        if node_type == "import":
-            self._process_import(node, ctx)
-        
-        # Call expression
-        if node_type == "call_expression":
-            self._process_call(node, ctx)
-        
-        # Recurse into children
-        for child in node.children:
-            self._process_node(child, ctx)
+    def _walk(self, root: Node, ctx: KotlinParseContext) -> None:
+        """
+        Walk the AST with a single tree cursor, dispatching interesting nodes.
 
-    def _process_class(self, node: Node, ctx: KotlinParseContext) -> None:
+        Handlers return a walk action. Scope handlers push their scope and
+        only their body child is walked; the scope is popped once the cursor
+        climbs back out of the scope node.
+        """
+        dispatch = self._dispatch
+        kind_count = len(dispatch)
+        scope_bodies = self._scope_bodies
+        class_kind = self._class_kind
+        cursor = root.walk()
+        # The loop runs once per visited node; bind the cursor methods once
+        goto_first_child = cursor.goto_first_child
+        goto_next_sibling = cursor.goto_next_sibling
+        goto_parent = cursor.goto_parent
+        depth = 0
+        # (depth, body node kind, is_class) for each scope node being walked
+        scopes: list[tuple[int, int | None, bool]] = []
+        # Depth and body kind of the innermost scope (-2 never matches a depth)
+        scope_depth, scope_body = -2, None
+
+        while True:
+            node = cursor.node
+            kind_id = node.kind_id
+            action = _DESCEND
+            if scope_depth == depth - 1 and kind_id != scope_body:
+                # Only the body of a scope node is walked
+                action = _SKIP
+            else:
+                handler = dispatch[kind_id] if kind_id < kind_count else None
+                if handler is not None:
+                    action = handler(node, ctx)
+                    if action == _ENTER_SCOPE:
+                        ctx.resolving = True
+                        scope_depth, scope_body = depth, scope_bodies[kind_id]
+                        scopes.append((depth, scope_body, kind_id == class_kind))
+
+            if action != _SKIP and goto_first_child():
+                depth += 1
+                continue
+
+            # Leave the current node, climbing until a sibling is found
+            while True:
+                if scope_depth == depth:
+                    _, _, is_class = scopes.pop()
+                    ctx.pop_scope()
+                    if is_class:
+                        ctx.clear_class_context()
+                    scope_depth, scope_body = scopes[-1][:2] if scopes else (-2, None)
+                if goto_next_sibling():
+                    break
+                if depth == 0 or not goto_parent():
+                    return
+                depth -= 1
+
+    def _process_package_header(self, node: Node, ctx: KotlinParseContext) -> int:
+        """Record the package declaration for same-package type resolution."""
+        if not ctx.imports_complete:
+            package = self._first_child_of_type(node, "qualified_identifier")
+            if package is not None:
+                ctx.package_name = self._get_node_text(package, ctx.source_bytes)
+        return _SKIP
+
+    def _process_class(self, node: Node, ctx: KotlinParseContext) -> int:
         """Extract class/interface/enum declaration."""
         name = None
         is_interface = False
-        modifiers = []
-        
+        modifiers_node = None
+        constructor = None
+        delegation_specifiers = None
+        body = None
+
+        # Single pass over the declaration's children
         for child in node.children:
-            if child.type == "identifier":
+            child_type = child.type
+            if child_type == "identifier":
                 name = self._get_node_text(child, ctx.source_bytes)
-            elif child.type == "interface":
+            elif child_type == "interface":
                 is_interface = True
-            elif child.type == "modifiers":
-                modifiers = self._get_node_text(child, ctx.source_bytes).split()
-        
+            elif child_type == "modifiers":
+                modifiers_node = child
+            elif child_type == "primary_constructor":
+                constructor = child
+            elif child_type == "delegation_specifiers":
+                delegation_specifiers = child
+            elif child_type == "class_body":
+                body = child
+
         if not name:
-            return
+            return _SKIP
+
+        modifiers = (
+            self._get_node_text(modifiers_node, ctx.source_bytes).split()
+            if modifiers_node is not None
+            else []
+        )
 
         source_code = self._get_node_text(node, ctx.source_bytes)
 
@@ -171,12 +499,11 @@ class KotlinParser(LanguageParser):
             kind = SymbolKind.CLASS
 
         # Extract inheritance from delegation_specifiers
-        for child in node.children:
-            if child.type == "delegation_specifiers":
-                self._extract_inheritance(child, qualified_name, ctx)
+        if delegation_specifiers is not None:
+            self._extract_inheritance(delegation_specifiers, qualified_name, ctx)
 
         # Extract signature (everything before the body)
-        signature = self._extract_signature_before_body(node, ctx.source_bytes, "class_body")
+        signature = self._extract_signature_before_body(node, ctx.source_bytes, body)
         
         # Extract position information
         start_line, end_line, start_column, end_column = self._extract_position(node)
@@ -187,12 +514,13 @@ class KotlinParser(LanguageParser):
             metadata["modifiers"] = modifiers
         
         # Extract annotations
-        annotations = self._extract_annotations(node, ctx.source_bytes)
-        if annotations:
-            metadata["annotations"] = annotations
+        if modifiers_node is not None:
+            annotations = self._annotations_from_modifiers(modifiers_node, ctx.source_bytes)
+            if annotations:
+                metadata["annotations"] = annotations
         
         # Extract KDoc
-        kdoc = self._extract_kdoc(node, ctx.source_bytes)
+        kdoc = self._extract_kdoc(node, ctx.source_bytes) if ctx.may_have_kdoc else None
         if kdoc:
             metadata["kdoc"] = kdoc
 
@@ -204,7 +532,7 @@ class KotlinParser(LanguageParser):
                 source_code=source_code,
                 signature=signature,
                 parent_qualified_name=ctx.current_scope,
-                metadata=metadata,
+                metadata=metadata or _EMPTY_METADATA,
                 start_line=start_line,
                 end_line=end_line,
                 start_column=start_column,
@@ -213,90 +541,54 @@ class KotlinParser(LanguageParser):
         )
 
         # Set up class context
+        ctx.clear_class_context()
         ctx.current_class_qualified_name = qualified_name
-        ctx.field_types.clear()
-        ctx.class_methods.clear()
         
         # Collect constructor parameters (fields)
-        self._collect_constructor_params(node, ctx)
+        if constructor is not None:
+            self._collect_constructor_params(constructor, ctx)
         
-        # Collect property declarations
-        for child in node.children:
-            if child.type == "class_body":
-                self._collect_properties(child, ctx)
-                self._collect_method_names(child, ctx)
+        # Collect property declarations and method names
+        if body is not None:
+            self._collect_class_members(body, ctx)
 
-        # Process class body
+        # Class body is walked inside this scope; class context is cleared on exit
         ctx.push_scope(qualified_name)
-        for child in node.children:
-            if child.type == "class_body":
-                for body_child in child.children:
-                    self._process_node(body_child, ctx)
-        ctx.pop_scope()
-        
-        # Clear class context
-        ctx.clear_class_context()
-
-    def _collect_constructor_params(self, class_node: Node, ctx: KotlinParseContext) -> None:
-        """Collect constructor parameters and their types."""
-        for child in class_node.children:
-            if child.type == "primary_constructor":
-                for param_container in child.children:
-                    if param_container.type == "class_parameters":
-                        for param in param_container.children:
-                            if param.type == "class_parameter":
-                                self._extract_param_type(param, ctx)
-
-    def _extract_param_type(self, param_node: Node, ctx: KotlinParseContext) -> None:
-        """Extract parameter name and type."""
-        name = None
-        type_name = None
-        for child in param_node.children:
-            if child.type == "identifier":
-                name = self._get_node_text(child, ctx.source_bytes)
-            elif child.type == "user_type":
-                type_name = self._get_node_text(child, ctx.source_bytes)
-        
-        if name and type_name:
-            ctx.field_types[name] = type_name
+        return _ENTER_SCOPE
+
+    def _collect_constructor_params(self, constructor: Node, ctx: KotlinParseContext) -> None:
+        """Collect primary constructor parameters and their types."""
+        # primary_constructor > class_parameters > class_parameter
+        self._collect_members(constructor, 2, ctx)
+
+    def _collect_class_members(self, class_body: Node, ctx: KotlinParseContext) -> None:
+        """Collect property types and method names declared in a class body."""
+        self._collect_members(class_body, 1, ctx)
+
+    def _collect_members(self, node: Node, max_depth: int, ctx: KotlinParseContext) -> None:
+        """Run the member query on a node, recording method names and field types."""
+        source_bytes = ctx.source_bytes
+        cursor = self._get_member_cursor()
+        cursor.set_max_start_depth(max_depth)
+        for pattern_index, captures in cursor.matches(node):
+            if pattern_index == _METHOD_PATTERN:
+                method = captures["method.name"][0]
+                ctx.class_methods.add(source_bytes[method.start_byte:method.end_byte])
+            else:
+                name = captures["field.name"][0]
+                type_node = captures["field.type"][0]
+                if name.end_byte > name.start_byte:
+                    ctx.field_types[source_bytes[name.start_byte:name.end_byte]] = (
+                        source_bytes[type_node.start_byte:type_node.end_byte]
+                    )
 
-    def _collect_properties(self, class_body: Node, ctx: KotlinParseContext) -> None:
-        """Collect property declarations and their types."""
-        for child in class_body.children:
-            if child.type == "property_declaration":
-                name = None
-                type_name = None
-                for prop_child in child.children:
-                    if prop_child.type == "variable_declaration":
-                        for vc in prop_child.children:
-                            if vc.type == "identifier":
-                                name = self._get_node_text(vc, ctx.source_bytes)
-                    elif prop_child.type == "user_type":
-                        type_name = self._get_node_text(prop_child, ctx.source_bytes)
-                
-                if name and type_name:
-                    ctx.field_types[name] = type_name
-
-    def _collect_method_names(self, class_body: Node, ctx: KotlinParseContext) -> None:
-        """Collect method names in the current class."""
-        for child in class_body.children:
-            if child.type == "function_declaration":
-                for fc in child.children:
-                    if fc.type == "identifier":
-                        method_name = self._get_node_text(fc, ctx.source_bytes)
-                        ctx.class_methods.add(method_name)
-                        break
-
-    def _process_object(self, node: Node, ctx: KotlinParseContext) -> None:
+    def _process_object(self, node: Node, ctx: KotlinParseContext) -> int:
         """Extract object declaration (Kotlin singleton)."""
-        name = None
-        for child in node.children:
-            if child.type == "identifier":
-                name = self._get_node_text(child, ctx.source_bytes)
-                break
+        identifier = self._first_child_of_type(node, "identifier")
+        name = self._get_node_text(identifier, ctx.source_bytes) if identifier else None
         
         if not name:
-            return
+            return _SKIP
 
         source_code = self._get_node_text(node, ctx.source_bytes)
 
@@ -313,7 +605,7 @@ class KotlinParser(LanguageParser):
         annotations = self._extract_annotations(node, ctx.source_bytes)
         if annotations:
             metadata["annotations"] = annotations
-        kdoc = self._extract_kdoc(node, ctx.source_bytes)
+        kdoc = self._extract_kdoc(node, ctx.source_bytes) if ctx.may_have_kdoc else None
         if kdoc:
             metadata["kdoc"] = kdoc
 
@@ -332,22 +624,14 @@ class KotlinParser(LanguageParser):
             )
         )
 
-        # Process object body
+        # Object body is walked inside this scope
         ctx.push_scope(qualified_name)
-        for child in node.children:
-            if child.type == "class_body":
-                for body_child in child.children:
-                    self._process_node(body_child, ctx)
-        ctx.pop_scope()
+        return _ENTER_SCOPE
 
-    def _process_companion_object(self, node: Node, ctx: KotlinParseContext) -> None:
+    def _process_companion_object(self, node: Node, ctx: KotlinParseContext) -> int:
         """Extract companion object."""
-        name = "Companion"
-        
-        for child in node.children:
-            if child.type == "identifier":
-                name = self._get_node_text(child, ctx.source_bytes)
-                break
+        identifier = self._first_child_of_type(node, "identifier")
+        name = self._get_node_text(identifier, ctx.source_bytes) if identifier else "Companion"
 
         source_code = self._get_node_text(node, ctx.source_bytes)
 
@@ -364,7 +648,7 @@ class KotlinParser(LanguageParser):
         annotations = self._extract_annotations(node, ctx.source_bytes)
         if annotations:
             metadata["annotations"] = annotations
-        kdoc = self._extract_kdoc(node, ctx.source_bytes)
+        kdoc = self._extract_kdoc(node, ctx.source_bytes) if ctx.may_have_kdoc else None
         if kdoc:
             metadata["kdoc"] = kdoc
 
@@ -384,25 +668,39 @@ class KotlinParser(LanguageParser):
         )
 
         ctx.push_scope(qualified_name)
-        for child in node.children:
-            if child.type == "class_body":
-                for body_child in child.children:
-                    self._process_node(body_child, ctx)
-        ctx.pop_scope()
+        return _ENTER_SCOPE
 
-    def _process_function(self, node: Node, ctx: KotlinParseContext) -> None:
+    def _process_function(self, node: Node, ctx: KotlinParseContext) -> int:
         """Extract function declaration."""
         name = None
-        modifiers = []
-        
+        modifiers_node = None
+        return_type_node = None
+        params_node = None
+        body = None
+
+        # Single pass over the declaration's children
         for child in node.children:
-            if child.type == "identifier":
+            child_type = child.type
+            if child_type == "identifier":
                 name = self._get_node_text(child, ctx.source_bytes)
-            elif child.type == "modifiers":
-                modifiers = self._get_node_text(child, ctx.source_bytes).split()
-        
+            elif child_type == "modifiers":
+                modifiers_node = child
+            elif child_type == "type":
+                if return_type_node is None:
+                    return_type_node = child
+            elif child_type == "function_value_parameters":
+                params_node = child
+            elif child_type == "function_body":
+                body = child
+
         if not name:
-            return
+            return _SKIP
+
+        modifiers = (
+            self._get_node_text(modifiers_node, ctx.source_bytes).split()
+            if modifiers_node is not None
+            else []
+        )
 
         source_code = self._get_node_text(node, ctx.source_bytes)
 
@@ -414,7 +712,7 @@ class KotlinParser(LanguageParser):
         else:
             qualified_name = self._build_qualified_name(ctx.file_path, name)
 
-        signature = self._extract_signature_before_body(node, ctx.source_bytes, "function_body")
+        signature = self._extract_signature_before_body(node, ctx.source_bytes, body)
         
         # Extract position information
         start_line, end_line, start_column, end_column = self._extract_position(node)
@@ -425,22 +723,25 @@ class KotlinParser(LanguageParser):
             metadata["modifiers"] = modifiers
         
         # Extract annotations
-        annotations = self._extract_annotations(node, ctx.source_bytes)
-        if annotations:
-            metadata["annotations"] = annotations
+        if modifiers_node is not None:
+            annotations = self._annotations_from_modifiers(modifiers_node, ctx.source_bytes)
+            if annotations:
+                metadata["annotations"] = annotations
         
         # Extract return type
-        return_type = self._extract_return_type(node, ctx.source_bytes)
-        if return_type:
-            metadata["return_type"] = return_type
+        if return_type_node is not None:
+            return_type = self._get_node_text(return_type_node, ctx.source_bytes)
+            if return_type:
+                metadata["return_type"] = return_type
         
         # Extract parameters
-        parameters = self._extract_parameters(node, ctx.source_bytes)
-        if parameters:
-            metadata["parameters"] = parameters
+        if params_node is not None:
+            parameters = self._extract_parameters(params_node, ctx.source_bytes)
+            if parameters:
+                metadata["parameters"] = parameters
         
         # Extract KDoc
-        kdoc = self._extract_kdoc(node, ctx.source_bytes)
+        kdoc = self._extract_kdoc(node, ctx.source_bytes) if ctx.may_have_kdoc else None
         if kdoc:
             metadata["kdoc"] = kdoc
 
@@ -452,7 +753,7 @@ class KotlinParser(LanguageParser):
                 source_code=source_code,
                 signature=signature,
                 parent_qualified_name=ctx.current_scope,
-                metadata=metadata,
+                metadata=metadata or _EMPTY_METADATA,
                 start_line=start_line,
                 end_line=end_line,
                 start_column=start_column,
@@ -462,7 +763,7 @@ class KotlinParser(LanguageParser):
 
         # Add MEMBER reference from parent class/object to this method for traversal
         if is_method and ctx.current_scope:
-            parent_path, parent_name = self._split_scope(ctx.current_scope)
+            parent_path, parent_name = ctx.current_scope_split
             method_path, method_name = self._split_scope(qualified_name)
             ctx.add_reference(
                 Reference(
@@ -474,30 +775,36 @@ class KotlinParser(LanguageParser):
                 )
             )
 
+        # Function body is walked inside this scope
         ctx.push_scope(qualified_name)
-        for child in node.children:
-            if child.type == "function_body":
-                self._process_node(child, ctx)
-        ctx.pop_scope()
+        return _ENTER_SCOPE
 
-    def _process_import(self, node: Node, ctx: KotlinParseContext) -> None:
-        """Extract import statement."""
+    def _process_import(self, node: Node, ctx: KotlinParseContext) -> int:
+        """Extract import statement and record it in the import map."""
         source_code = self._get_node_text(node, ctx.source_bytes)
         
-        import_path = None
-        for child in node.children:
-            if child.type == "qualified_identifier":
-                import_path = self._get_node_text(child, ctx.source_bytes)
-                break
+        path_node = self._first_child_of_type(node, "qualified_identifier")
+        path_bytes = self._get_node_bytes(path_node, ctx.source_bytes) if path_node else None
         
-        if not import_path:
-            return
+        if not path_bytes:
+            return _DESCEND
+        import_path = path_bytes.decode("utf-8", errors="replace")
+
+        if not ctx.imports_complete:
+            if ctx.resolving:
+                ctx.late_import = True
+            ctx.imports[path_bytes[path_bytes.rfind(b".") + 1:]] = import_path
+
+        # Imported symbol name and the path it is imported from
+        last_dot = import_path.rfind(".")
+        target_name = import_path[last_dot + 1:]
+        target_class_path = import_path[:last_dot] if last_dot != -1 else import_path
 
         qualified_name = self._build_qualified_name(ctx.file_path, f"import:{import_path}")
         
         ctx.add_symbol(
             Symbol(
-                name=import_path.split(".")[-1],
+                name=target_name,
                 qualified_name=qualified_name,
                 kind=SymbolKind.IMPORT,
                 source_code=source_code,
@@ -505,9 +812,7 @@ class KotlinParser(LanguageParser):
         )
 
         # For imports: source is the file, target is the imported symbol
-        source_file_path = self._file_path_to_dot_notation(ctx.file_path)
-        target_class_path = ".".join(import_path.split(".")[:-1]) if "." in import_path else import_path
-        target_name = import_path.split(".")[-1]
+        source_file_path = ctx.dotted_file_path
         
         ctx.add_reference(
             Reference(
@@ -518,30 +823,35 @@ class KotlinParser(LanguageParser):
                 reference_type=ReferenceType.IMPORT,
             )
         )
+        return _DESCEND
 
-    def _process_call(self, node: Node, ctx: KotlinParseContext) -> None:
+    def _process_call(self, node: Node, ctx: KotlinParseContext) -> int:
         """Extract function call as reference with resolved path and symbol name."""
         if not ctx.current_scope:
-            return
+            return _DESCEND
 
         # Get the called expression
         call_target = None
         for child in node.children:
             if child.type == "identifier":
-                call_target = self._get_node_text(child, ctx.source_bytes)
+                call_target = self._get_node_bytes(child, ctx.source_bytes)
                 break
             elif child.type == "navigation_expression":
-                call_target = self._get_node_text(child, ctx.source_bytes)
+                call_target = self._get_node_bytes(child, ctx.source_bytes)
                 break
 
         if not call_target:
-            return
+            return _DESCEND
 
         # Resolve the call target to path and symbol name
-        target_path, target_symbol_name = self._resolve_call_target(call_target, ctx)
+        resolved = ctx.resolve_call_cache.get(call_target)
+        if resolved is None:
+            resolved = self._resolve_call_target(call_target, ctx)
+            ctx.resolve_call_cache[call_target] = resolved
+        target_path, target_symbol_name = resolved
 
         # Extract source path and name from current scope
-        source_path, source_name = self._split_scope(ctx.current_scope)
+        source_path, source_name = ctx.current_scope_split
 
         ctx.add_reference(
             Reference(
@@ -556,6 +866,7 @@ class KotlinParser(LanguageParser):
         # NEW: Extract identifiers from method arguments (for DSL patterns)
         # Example: .process(unlinkedRefundFraudProcessor) -> creates reference to processor class
         self._process_call_arguments(node, ctx)
+        return _DESCEND
 
     def _process_call_arguments(self, node: Node, ctx: KotlinParseContext) -> None:
         """
@@ -571,42 +882,54 @@ class KotlinParser(LanguageParser):
             return
             
         # Find value_arguments node
-        for child in node.children:
-            if child.type == "value_arguments":
-                self._extract_argument_identifiers(child, ctx)
+        arguments = self._first_child_of_type(node, "value_arguments")
+        if arguments is not None:
+            self._extract_argument_identifiers(arguments, ctx)
     
-    def _extract_argument_identifiers(self, node: Node, ctx: KotlinParseContext) -> None:
-        """Recursively extract identifier nodes from arguments and create references."""
-        # Check for both simple_identifier and identifier (tree-sitter uses "identifier" for simple args)
-        if node.type in ("simple_identifier", "identifier"):
-            identifier_name = self._get_node_text(node, ctx.source_bytes)
-            
-            # Skip keywords, literals, and common primitives
-            skip_keywords = {"true", "false", "null", "this", "it", "super"}
-            if identifier_name in skip_keywords:
-                return
-            
-            # Check if it's a field/parameter with a known type
-            if identifier_name in ctx.field_types:
-                type_name = ctx.field_types[identifier_name]
-                target_path = self._resolve_type_to_path(type_name, ctx)
+    def _extract_argument_identifiers(self, root: Node, ctx: KotlinParseContext) -> None:
+        """Extract identifier nodes from arguments (including nested expressions) and create references."""
+        # Bind everything the loop touches to locals; the scope cannot change
+        # while walking an argument list
+        id_kinds = self._argument_id_kinds
+        skip_keywords = self._SKIP_ARG_KEYWORDS
+        field_types = ctx.field_types
+        type_cache = ctx.resolve_type_cache
+        source_bytes = ctx.source_bytes
+        add_reference = ctx.add_reference
+        source_path, source_name = ctx.current_scope_split
+        cursor = root.walk()
+        while True:
+            node = cursor.node
+            # Check for both simple_identifier and identifier (tree-sitter uses "identifier" for simple args)
+            if node.kind_id in id_kinds:
+                identifier_name = source_bytes[node.start_byte:node.end_byte]
                 
-                source_path, source_name = self._split_scope(ctx.current_scope)
-                ctx.add_reference(
-                    Reference(
-                        source_file_path=source_path,
-                        source_symbol_name=source_name,
-                        target_file_path=target_path,
-                        target_symbol_name=type_name,
-                        reference_type=ReferenceType.CALL,  # Arguments are implicitly called/used
+                # Check if it's a field/parameter with a known type
+                if identifier_name not in skip_keywords and identifier_name in field_types:
+                    type_name = field_types[identifier_name]
+                    target_path = type_cache.get(type_name)
+                    if target_path is None:
+                        target_path = self._resolve_type_to_path(type_name, ctx)
+                        type_cache[type_name] = target_path
+                    
+                    add_reference(
+                        Reference(
+                            source_file_path=source_path,
+                            source_symbol_name=source_name,
+                            target_file_path=target_path,
+                            target_symbol_name=type_name.decode("utf-8", errors="replace"),
+                            reference_type=ReferenceType.CALL,  # Arguments are implicitly called/used
+                        )
                     )
-                )
-        
-        # Recurse into children to handle nested expressions
-        for child in node.children:
-            self._extract_argument_identifiers(child, ctx)
+            
+            # Descend into children to handle nested expressions
+            if cursor.goto_first_child():
+                continue
+            while not cursor.goto_next_sibling():
+                if not cursor.goto_parent():
+                    return
     
-    def _resolve_type_to_path(self, type_name: str, ctx: KotlinParseContext) -> str:
+    def _resolve_type_to_path(self, type_name: bytes, ctx: KotlinParseContext) -> str:
         """
         Resolve a type name to its full qualified path using imports and package context.
         
@@ -621,19 +944,24 @@ class KotlinParser(LanguageParser):
         if type_name in ctx.imports:
             return ctx.imports[type_name]
         
+        type_text = type_name.decode("utf-8", errors="replace")
+
         # Check if it's in the same package (no import needed)
         if ctx.package_name:
-            return f"{ctx.package_name}.{type_name}"
+            return f"{ctx.package_name}.{type_text}"
         
         # Fall back to just the type name (will still create reference for searching)
-        return type_name
+        return type_text
     
     def _resolve_call_target(
-        self, call_target: str, ctx: KotlinParseContext
+        self, call_target: bytes, ctx: KotlinParseContext
     ) -> tuple[str, str]:
         """
         Resolve a call target to (path, symbol_name).
         
+        The target is the raw source bytes of the called expression; lookups
+        are done on bytes and only the returned names are decoded.
+        
         Returns:
             tuple of (target_path, target_symbol_name) for use with get_symbol_details API
         
@@ -646,16 +974,10 @@ class KotlinParser(LanguageParser):
               -> ("logger", "info")
         """
         # Check if it's a navigation expression (object.method)
-        if "." in call_target:
-            # Split into parts - handle chained calls like Response.ok(data).build
-            parts = call_target.split(".")
-            first_part = parts[0]
-            
-            # Remove any method call syntax from first part
-            first_part_clean = first_part.split("(")[0]
-            
-            # Get the method name (last part, without args)
-            method_name = parts[-1].split("(")[0]
+        if b"." in call_target:
+            # Handle chained calls like Response.ok(data).build
+            first_part_clean, method_bytes = self._parse_nav_expr(call_target)
+            method_name = method_bytes.decode("utf-8", errors="replace")
             
             # Check if first part is a known field/parameter
             if first_part_clean in ctx.field_types:
@@ -664,12 +986,13 @@ class KotlinParser(LanguageParser):
                 if type_name in ctx.imports:
                     full_path = ctx.imports[type_name]
                     return (full_path, method_name)
+                type_text = type_name.decode("utf-8", errors="replace")
                 # If not in imports, assume same package (no import needed)
-                elif ctx.package_name:
-                    full_path = f"{ctx.package_name}.{type_name}"
+                if ctx.package_name:
+                    full_path = f"{ctx.package_name}.{type_text}"
                     return (full_path, method_name)
                 # Fall back to just the type name
-                return (type_name, method_name)
+                return (type_text, method_name)
             
             # Check if first part is directly in imports (static call)
             if first_part_clean in ctx.imports:
@@ -677,48 +1000,72 @@ class KotlinParser(LanguageParser):
                 return (full_path, method_name)
             
             # Can't resolve - return as-is (first part as path, last as method)
-            return (first_part_clean, method_name)
+            return (first_part_clean.decode("utf-8", errors="replace"), method_name)
         
         # Simple call (no dot) - check if it's a sibling method
-        method_name = call_target.split("(")[0]
+        paren = call_target.find(b"(")
+        method_bytes = call_target[:paren] if paren != -1 else call_target
+        method_name = method_bytes.decode("utf-8", errors="replace")
         
-        if method_name in ctx.class_methods and ctx.current_class_qualified_name:
+        if method_bytes in ctx.class_methods and ctx.current_class_qualified_name:
             # It's a call to a sibling method in the same class
             # Path is the class, symbol is the method
             return (ctx.current_class_qualified_name, method_name)
         
         # Check if it's an imported function (top-level function)
-        if method_name in ctx.imports:
+        if method_bytes in ctx.imports:
             # For imported functions, the import path IS the full path
             # Split to get package path and function name
-            import_path = ctx.imports[method_name]
-            if "." in import_path:
+            import_path = ctx.imports[method_bytes]
+            last_dot = import_path.rfind(".")
+            if last_dot != -1:
                 # Package path without the function name
-                package_path = import_path.rsplit(".", 1)[0]
-                return (package_path, method_name)
+                return (import_path[:last_dot], method_name)
             return (import_path, method_name)
         
         # Can't resolve - return method name as both path and name
         return (method_name, method_name)
 
+    def _parse_nav_expr(self, call_target: bytes) -> tuple[bytes, bytes]:
+        """
+        Split a navigation expression into (receiver, method_name).
+
+        The receiver is the text before the first "." (without call
+        arguments) and the method is the last segment, e.g.
+        "Response.ok(data).build" -> ("Response", "build").
+        """
+        first_end = call_target.find(b".")
+        paren = call_target.find(b"(", 0, first_end)
+        if paren != -1:
+            first_end = paren
+
+        last_start = call_target.rfind(b".") + 1
+        paren = call_target.find(b"(", last_start)
+        last_end = paren if paren != -1 else len(call_target)
+        return call_target[:first_end], call_target[last_start:last_end]
+
     def _extract_inheritance(self, node: Node, class_qualified_name: str, ctx: KotlinParseContext) -> None:
         """Extract superclass/interface references from delegation specifiers."""
         source_path, source_name = self._split_scope(class_qualified_name)
         
         for child in node.children:
             if child.type == "delegation_specifier":
-                type_name = self._find_identifier_recursive(child, ctx.source_bytes)
+                identifier = self._first_descendant_of_type(child, "identifier")
+                type_name = (
+                    self._get_node_bytes(identifier, ctx.source_bytes) if identifier else None
+                )
                 if type_name:
                     # Try to resolve the type to its import path
                     if type_name in ctx.imports:
                         target_path = ctx.imports[type_name]
                     else:
-                        target_path = type_name
+                        target_path = type_name.decode("utf-8", errors="replace")
                     
                     # Split target path if it's a full import path
-                    if "." in target_path:
-                        target_file_path = ".".join(target_path.split(".")[:-1])
-                        target_symbol = target_path.split(".")[-1]
+                    last_dot = target_path.rfind(".")
+                    if last_dot != -1:
+                        target_file_path = target_path[:last_dot]
+                        target_symbol = target_path[last_dot + 1:]
                     else:
                         target_file_path = target_path
                         target_symbol = target_path
@@ -733,21 +1080,32 @@ class KotlinParser(LanguageParser):
                         )
                     )
 
-    def _find_identifier_recursive(self, node: Node, source_bytes: bytes) -> str | None:
-        """Find first identifier in a node tree."""
-        if node.type == "identifier":
-            return self._get_node_text(node, source_bytes)
+    def _first_child_of_type(self, node: Node, type_name: str) -> Node | None:
+        """Find the first direct child of the given type."""
         for child in node.children:
-            result = self._find_identifier_recursive(child, source_bytes)
-            if result:
-                return result
+            if child.type == type_name:
+                return child
         return None
 
-    def _extract_signature_before_body(self, node: Node, source_bytes: bytes, body_type: str) -> str:
+    def _first_descendant_of_type(self, node: Node, type_name: str) -> Node | None:
+        """Find the first node of the given type in pre-order, starting at node itself."""
+        cursor = node.walk()
+        while True:
+            if cursor.node.type == type_name:
+                return cursor.node
+            if cursor.goto_first_child():
+                continue
+            while not cursor.goto_next_sibling():
+                # Never climb above the starting node
+                if cursor.depth == 0 or not cursor.goto_parent():
+                    return None
+
+    def _extract_signature_before_body(
+        self, node: Node, source_bytes: bytes, body: Node | None
+    ) -> str:
         """Extract signature (everything before the body)."""
-        for child in node.children:
-            if child.type == body_type:
-                return source_bytes[node.start_byte:child.start_byte].decode("utf-8").strip()
+        if body is not None:
+            return source_bytes[node.start_byte:body.start_byte].decode("utf-8").strip()
         text = self._get_node_text(node, source_bytes)
         if "{" in text:
             return text[:text.index("{")].strip()
@@ -756,89 +1114,81 @@ class KotlinParser(LanguageParser):
     def _get_node_text(self, node: Node, source_bytes: bytes) -> str:
         """Extract text from node."""
         return source_bytes[node.start_byte:node.end_byte].decode("utf-8", errors="replace")
+
+    def _get_node_bytes(self, node: Node, source_bytes: bytes) -> bytes:
+        """Extract raw source bytes of a node (for lookups that need no decoding)."""
+        return source_bytes[node.start_byte:node.end_byte]
     
     def _extract_annotations(self, node: Node, source_bytes: bytes) -> list[str]:
         """Extract annotations from a node."""
+        modifiers = self._first_child_of_type(node, "modifiers")
+        if modifiers is None:
+            return []
+        return self._annotations_from_modifiers(modifiers, source_bytes)
+
+    def _annotations_from_modifiers(self, modifiers: Node, source_bytes: bytes) -> list[str]:
+        """Extract annotations from a modifiers node."""
         annotations: list[str] = []
-        for child in node.children:
-            if child.type == "modifiers":
-                for modifier_child in child.children:
-                    if modifier_child.type == "annotation":
-                        ann_text = self._get_node_text(modifier_child, source_bytes)
-                        if not ann_text.startswith("@"):
-                            ann_text = "@" + ann_text
-                        annotations.append(ann_text)
+        for modifier_child in modifiers.children:
+            if modifier_child.type == "annotation":
+                ann_text = self._get_node_text(modifier_child, source_bytes)
+                if not ann_text.startswith("@"):
+                    ann_text = "@" + ann_text
+                annotations.append(ann_text)
         return annotations
     
-    def _extract_return_type(self, node: Node, source_bytes: bytes) -> str | None:
-        """Extract return type from a function declaration."""
-        for child in node.children:
-            if child.type == "type":
-                return self._get_node_text(child, source_bytes)
-        return None
-    
-    def _extract_parameters(self, node: Node, source_bytes: bytes) -> list[dict[str, str | None]]:
-        """Extract parameter information from a function declaration."""
+    def _extract_parameters(
+        self, params: Node, source_bytes: bytes
+    ) -> list[dict[str, str | None]]:
+        """Extract parameter information from function_value_parameters."""
         parameters: list[dict[str, str | None]] = []
-        for child in node.children:
-            if child.type == "function_value_parameters":
-                for param_child in child.children:
-                    if param_child.type == "parameter":
-                        name = None
-                        type_name = None
-                        default = None
-                        for pc in param_child.children:
-                            if pc.type == "identifier":
-                                name = self._get_node_text(pc, source_bytes)
-                            elif pc.type == "type":
-                                type_name = self._get_node_text(pc, source_bytes)
-                            elif pc.type == "default_value":
-                                default = self._get_node_text(pc, source_bytes)
-                        
-                        if name:
-                            param_info: dict[str, str | None] = {
-                                "name": name,
-                                "type": type_name,
-                                "default": default,
-                            }
-                            parameters.append(param_info)
+        for param_child in params.children:
+            if param_child.type == "parameter":
+                name = None
+                type_name = None
+                default = None
+                for pc in param_child.children:
+                    if pc.type == "identifier":
+                        name = self._get_node_text(pc, source_bytes)
+                    elif pc.type == "type":
+                        type_name = self._get_node_text(pc, source_bytes)
+                    elif pc.type == "default_value":
+                        default = self._get_node_text(pc, source_bytes)
+                
+                if name:
+                    param_info: dict[str, str | None] = {
+                        "name": name,
+                        "type": type_name,
+                        "default": default,
+                    }
+                    parameters.append(param_info)
         return parameters
     
     def _extract_kdoc(self, node: Node, source_bytes: bytes) -> str | None:
         """Extract KDoc comment preceding a node."""
-        parent = node.parent
-        if not parent:
-            return None
-        
-        # Find the node's index in parent's children
-        node_index = -1
-        for i, child in enumerate(parent.children):
-            if child == node:
-                node_index = i
-                break
-        
-        if node_index <= 0:
-            return None
-        
         # Check previous siblings for KDoc
-        for i in range(node_index - 1, -1, -1):
-            prev_sibling = parent.children[i]
-            if prev_sibling.type == "kdoc":
+        prev_sibling = node.prev_sibling
+        while prev_sibling is not None:
+            sibling_kind = prev_sibling.kind_id
+            if sibling_kind == self._kdoc_kind:
                 return self._get_node_text(prev_sibling, source_bytes).strip()
-            elif prev_sibling.type == "line_comment":
+            # Comments start at their delimiter; check it before decoding
+            elif sibling_kind == self._line_comment_kind and source_bytes.startswith(
+                b"/**", prev_sibling.start_byte, prev_sibling.end_byte
+            ):
                 comment_text = self._get_node_text(prev_sibling, source_bytes)
-                if comment_text.strip().startswith("/**"):
-                    # Extract KDoc content
-                    lines = comment_text.split("\n")
-                    kdoc_lines = []
-                    for line in lines:
-                        line = line.strip()
-                        line = line.removeprefix("/**").removesuffix("*/").strip()
-                        line = line.removeprefix("*").strip()
-                        if line:
-                            kdoc_lines.append(line)
-                    if kdoc_lines:
-                        return "\n".join(kdoc_lines)
+                # Extract KDoc content
+                lines = comment_text.split("\n")
+                kdoc_lines = []
+                for line in lines:
+                    line = line.strip()
+                    line = line.removeprefix("/**").removesuffix("*/").strip()
+                    line = line.removeprefix("*").strip()
+                    if line:
+                        kdoc_lines.append(line)
+                if kdoc_lines:
+                    return "\n".join(kdoc_lines)
+            prev_sibling = prev_sibling.prev_sibling
         
         return None
 
@@ -849,14 +1199,7 @@ class KotlinParser(LanguageParser):
         Example: "src/main/kotlin/com/toasttab/MyClass.kt" 
                  -> "src.main.kotlin.com.toasttab.MyClass"
         """
-        # Remove extension
-        path = file_path
-        for ext in self.file_extensions:
-            if path.endswith(ext):
-                path = path[:-len(ext)]
-                break
-        # Convert slashes to dots
-        return path.replace("/", ".").replace("\\", ".")
+        return _dot_path(file_path, self.file_extensions)
 
     def _split_scope(self, qualified_name: str) -> tuple[str, str]:
         """
@@ -869,3 +1212,34 @@ class KotlinParser(LanguageParser):
             parts = qualified_name.rsplit(".", 1)
             return (parts[0], parts[1])
         return (qualified_name, qualified_name)
+
+
+def prune_parse_cache(cache_dir: Path, max_bytes: int) -> int:
+    """
+    Delete the oldest Kotlin parse cache entries until the cache fits in max_bytes.
+
+    Entries are evicted in the order they were written. Returns the number
+    of entries removed.
+    """
+    entries: list[tuple[float, int, Path]] = []
+    total = 0
+    for path in cache_dir.glob("*/*.pkl"):
+        try:
+            stat = path.stat()
+        except OSError:
+            continue
+        entries.append((stat.st_mtime, stat.st_size, path))
+        total += stat.st_size
+
+    removed = 0
+    entries.sort()
+    for _, size, path in entries:
+        if total <= max_bytes:
+            break
+        try:
+            path.unlink()
+        except OSError:
+            continue
+        total -= size
+        removed += 1
+    return removed
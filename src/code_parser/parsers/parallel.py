@@ -0,0 +1,75 @@
+"""Parse many files in parallel worker processes."""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
+from pathlib import Path
+
+from code_parser.core import ParsedFile
+from code_parser.parsers.registry import (
+    ParserRegistry,
+    create_parser_registry,
+    get_parser_registry,
+)
+
+
+def parse_files(
+    jobs: list[tuple[str, str]],
+    max_workers: int | None = None,
+    parse_cache_dir: Path | None = None,
+) -> list[ParsedFile | None]:
+    """
+    Parse many files, spreading them over worker processes.
+
+    Each job is an (absolute path, relative path) pair; the relative path
+    selects the parser and names the file's symbols. Every worker keeps
+    one parser registry for all of its files. Results are returned in input
+    order: None for a file no parser handles, and a ParsedFile carrying the
+    error for a file that fails to parse. parse_cache_dir enables the
+    parsers' on-disk result caches.
+    """
+    if len(jobs) <= 1 or max_workers == 1:
+        registry = _registry(parse_cache_dir)
+        return [_parse_job(registry, path, relative_path) for path, relative_path in jobs]
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        workers = max_workers or os.cpu_count() or 1
+        # A few chunks per worker balances load without one IPC round trip per file
+        chunksize = max(1, len(jobs) // (workers * 4))
+        return list(
+            executor.map(
+                partial(_parse_in_worker, parse_cache_dir), jobs, chunksize=chunksize
+            )
+        )
+
+
+@lru_cache
+def _registry(parse_cache_dir: Path | None) -> ParserRegistry:
+    """Get this process's registry for a parse cache directory."""
+    if parse_cache_dir is None:
+        return get_parser_registry()
+    return create_parser_registry(parse_cache_dir)
+
+
+def _parse_in_worker(parse_cache_dir: Path | None, job: tuple[str, str]) -> ParsedFile | None:
+    """Parse one file in a worker process."""
+    path, relative_path = job
+    return _parse_job(_registry(parse_cache_dir), path, relative_path)
+
+
+def _parse_job(registry: ParserRegistry, path: str, relative_path: str) -> ParsedFile | None:
+    """Parse one file, turning failures into a ParsedFile with an error."""
+    parser = registry.get_parser_for_file(relative_path)
+    if parser is None:
+        return None
+    try:
+        return parser.parse_path(path, relative_path)
+    except Exception as e:
+        return ParsedFile(
+            relative_path=relative_path,
+            language=parser.language,
+            content_hash="",
+            symbols=(),
+            references=(),
+            errors=(str(e),),
+        )
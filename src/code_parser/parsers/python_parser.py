@@ -1,7 +1,10 @@
 """Python language parser using tree-sitter."""
 
+import hashlib
+import threading
+
 import tree_sitter_python as ts_python
-from tree_sitter import Language, Parser, Node
+from tree_sitter import Language, Node, Parser, Query, QueryCursor, Tree
 
 from code_parser.core import (
     Language as CodeLanguage,
@@ -11,7 +14,64 @@ from code_parser.core import (
     Symbol,
     SymbolKind,
 )
-from code_parser.parsers.base import LanguageParser, ParseContext
+from code_parser.parsers.base import LanguageParser, ParseContext, SourceEdit, _dot_path
+
+# Walk actions returned by node handlers
+_DESCEND = 0  # Visit the node's children
+_SKIP = 1  # Do not visit the node's children
+_ENTER_SCOPE = 2  # Handler pushed a scope; visit only its body child
+_ONLY_BODY = 3  # Visit only the node's body child, without a new scope
+
+# Every node type that has a handler; the walk only visits these
+_HANDLED_NODES_QUERY = """
+[
+  (function_definition)
+  (class_definition)
+  (import_statement)
+  (import_from_statement)
+  (call)
+] @node
+"""
+
+# Built once: the set is part of the dot-path cache key and caches its hash
+_FILE_EXTENSIONS = frozenset({".py"})
+
+# Docstring delimiters; triple quotes are stripped in preference to single ones
+_TRIPLE_QUOTES = ('"""', "'''")
+_QUOTES = ('"', "'")
+
+
+def _document_order(node: Node) -> tuple[int, int]:
+    """Sort key placing nodes by start, enclosing nodes before the nodes inside them."""
+    return (node.start_byte, -node.end_byte)
+
+
+class PythonParseContext(ParseContext):
+    """Parse context that keeps per-file and per-scope names precomputed."""
+
+    def __init__(self, file_path: str, source_bytes: bytes, dotted_file_path: str) -> None:
+        super().__init__(file_path, source_bytes)
+        # File path in dot notation (source of file-level references)
+        self.dotted_file_path = dotted_file_path
+        # (path, symbol_name) of each scope on the stack, split once on push
+        self._scope_splits: list[tuple[str, str]] = []
+
+    def push_scope(self, qualified_name: str) -> None:
+        """Enter a nested scope and split its qualified name once."""
+        super().push_scope(qualified_name)
+        path, dot, name = qualified_name.rpartition(".")
+        self._scope_splits.append((path, name) if dot else (qualified_name, qualified_name))
+
+    def pop_scope(self) -> str | None:
+        """Exit the current scope."""
+        if self._scope_splits:
+            self._scope_splits.pop()
+        return super().pop_scope()
+
+    @property
+    def current_scope_split(self) -> tuple[str, str]:
+        """(path, symbol_name) of the current scope; only valid inside a scope."""
+        return self._scope_splits[-1]
 
 
 class PythonParser(LanguageParser):
@@ -24,7 +84,67 @@ class PythonParser(LanguageParser):
 
     def __init__(self) -> None:
         self._language = Language(ts_python.language())
-        self._parser = Parser(self._language)
+        # tree-sitter parsers are not thread-safe; each thread gets its own,
+        # created on first use
+        self._local = threading.local()
+        # Node kinds are compared by integer id rather than by type name
+        kind = self._kind_id
+        function_kind = kind("function_definition")
+        class_kind = kind("class_definition")
+        self._call_kind = kind("call")
+        self._identifier_kind = kind("identifier")
+        self._attribute_kind = kind("attribute")
+        self._dotted_name_kind = kind("dotted_name")
+        self._aliased_import_kind = kind("aliased_import")
+        self._decorated_definition_kind = kind("decorated_definition")
+        self._decorator_kind = kind("decorator")
+        self._typed_parameter_kind = kind("typed_parameter")
+        self._expression_statement_kind = kind("expression_statement")
+        self._string_kinds = frozenset((kind("string"), kind("concatenated_string")))
+        # Parameter field ids, resolved once instead of by name per parameter;
+        # current grammars have no "default" field (its id is then None)
+        field = self._language.field_id_for_name
+        self._name_field = field("name")
+        self._type_field = field("type")
+        self._default_field = field("default")
+        # Node kind -> handler returning a walk action
+        self._handlers = {
+            function_kind: self._process_function,
+            class_kind: self._process_class,
+            kind("import_statement"): self._process_import,
+            kind("import_from_statement"): self._process_import_from,
+            self._call_kind: self._process_call,
+        }
+        # Handlers indexed directly by kind id
+        self._dispatch = tuple(
+            self._handlers.get(kind_id) for kind_id in range(self._language.node_kind_count)
+        )
+        # Collects the handled nodes of a tree in one pass
+        self._handled_nodes_query = Query(self._language, _HANDLED_NODES_QUERY)
+        # Node kind -> field name of the only child walked below it
+        self._body_fields = {
+            function_kind: "body",
+            class_kind: "body",
+            self._call_kind: "arguments",
+        }
+
+    def _get_parser(self) -> Parser:
+        """Get the calling thread's tree-sitter parser."""
+        parser = getattr(self._local, "parser", None)
+        if parser is None:
+            parser = self._local.parser = Parser(self._language)
+        return parser
+
+    def _get_handled_nodes_cursor(self) -> QueryCursor:
+        """Get the calling thread's cursor for the handled-nodes query."""
+        cursor = getattr(self._local, "handled_nodes_cursor", None)
+        if cursor is None:
+            cursor = self._local.handled_nodes_cursor = QueryCursor(self._handled_nodes_query)
+        return cursor
+
+    def _kind_id(self, type_name: str) -> int:
+        """Get the grammar's id for a named node type."""
+        return self._language.id_for_node_kind(type_name, True)
 
     @property
     def language(self) -> CodeLanguage:
@@ -32,17 +152,64 @@ class PythonParser(LanguageParser):
 
     @property
     def file_extensions(self) -> frozenset[str]:
-        return frozenset({".py"})
+        return _FILE_EXTENSIONS
 
     def parse(self, source_code: str, file_path: str, content_hash: str) -> ParsedFile:
         """Parse Python source code and extract symbols and references."""
-        source_bytes = source_code.encode("utf-8")
-        tree = self._parser.parse(source_bytes)
-
-        ctx = ParseContext(file_path, source_bytes)
+        return self.parse_bytes(source_code.encode("utf-8"), file_path, content_hash)
+
+    def parse_bytes(self, source_bytes: bytes, file_path: str, content_hash: str) -> ParsedFile:
+        """
+        Parse UTF-8 encoded Python source and extract symbols and references.
+
+        For callers that already hold the file's bytes; skips the decode and
+        re-encode a str round trip through parse() would cost.
+        """
+        tree = self._get_parser().parse(source_bytes)
+        return self._extract(tree, source_bytes, file_path, content_hash)
+
+    def parse_incremental(
+        self,
+        new_source: str,
+        file_path: str,
+        content_hash: str,
+        edit: SourceEdit,
+        old_tree: Tree | None,
+    ) -> tuple[ParsedFile, Tree]:
+        """
+        Re-parse edited Python source, reusing the previous syntax tree.
+
+        The edit is applied to old_tree in place, so old_tree must not be
+        used after this call; tree-sitter reuses its subtrees outside the
+        edited range. Returns the parsed file together with the new tree,
+        which callers pass back in on the next edit. Without an old tree
+        this is a full parse.
+        """
+        source_bytes = new_source.encode("utf-8")
+        if old_tree is None:
+            tree = self._get_parser().parse(source_bytes)
+        else:
+            old_tree.edit(
+                start_byte=edit.start_byte,
+                old_end_byte=edit.old_end_byte,
+                new_end_byte=edit.new_end_byte,
+                start_point=edit.start_point,
+                old_end_point=edit.old_end_point,
+                new_end_point=edit.new_end_point,
+            )
+            tree = self._get_parser().parse(source_bytes, old_tree)
+        return self._extract(tree, source_bytes, file_path, content_hash), tree
+
+    def _extract(
+        self, tree: Tree, source_bytes: bytes, file_path: str, content_hash: str
+    ) -> ParsedFile:
+        """Extract symbols and references from a parsed syntax tree."""
+        ctx = PythonParseContext(
+            file_path, source_bytes, self._file_path_to_dot_notation(file_path)
+        )
 
         # Process the AST
-        self._process_node(tree.root_node, ctx)
+        self._walk(tree.root_node, ctx)
 
         return ParsedFile(
             relative_path=file_path,
@@ -53,31 +220,73 @@ class PythonParser(LanguageParser):
             errors=tuple(ctx.errors),
         )
 
-    def _process_node(self, node: Node, ctx: ParseContext) -> None:
-        """Recursively process AST nodes to extract symbols and references."""
-        match node.type:
-            case "function_definition":
-                self._process_function(node, ctx)
-            case "class_definition":
-                self._process_class(node, ctx)
-            case "import_statement":
-                self._process_import(node, ctx)
-            case "import_from_statement":
-                self._process_import_from(node, ctx)
-            case "call":
-                self._process_call(node, ctx)
-            case _:
-                # Recurse into children for other node types
-                for child in node.children:
-                    self._process_node(child, ctx)
-
-    def _process_function(self, node: Node, ctx: ParseContext) -> None:
+    def parse_path(self, path: str, relative_path: str) -> ParsedFile:
+        """Read and parse a Python file from disk, without decoding it to str first."""
+        with open(path, "rb") as f:
+            raw = f.read()
+        content_hash = hashlib.sha256(raw).hexdigest()
+        return self.parse_bytes(raw, relative_path, content_hash)
+
+    def _walk(self, root: Node, ctx: PythonParseContext) -> None:
+        """
+        Dispatch the handled nodes of a tree in document order.
+
+        A query collects every node that has a handler in one pass, so nodes
+        no handler cares about are never visited from Python. Walk actions
+        are applied by byte range: a node is only dispatched if it lies in the
+        walked part (body, or arguments for calls) of each enclosing handled
+        node, and a scope pushed by a handler is popped once the sweep moves
+        past the end of its node.
+        """
+        dispatch = self._dispatch
+        body_fields = self._body_fields
+        nodes = self._get_handled_nodes_cursor().captures(root).get("node", [])
+        # Enclosing nodes must come before the nodes inside them
+        nodes.sort(key=_document_order)
+        # (end byte, walked start byte, walked end byte, pushed a scope) for
+        # each enclosing handled node; nothing is walked in an empty range
+        enclosing: list[tuple[int, int, int, bool]] = []
+
+        for node in nodes:
+            start_byte = node.start_byte
+            end_byte = node.end_byte
+            # Leave the handled nodes that end before this one
+            while enclosing and enclosing[-1][0] <= start_byte:
+                if enclosing.pop()[3]:
+                    ctx.pop_scope()
+            if enclosing:
+                _, walked_start, walked_end, _ = enclosing[-1]
+                if start_byte < walked_start or end_byte > walked_end:
+                    # Not walked, and neither is anything inside it
+                    enclosing.append((end_byte, 0, -1, False))
+                    continue
+
+            kind_id = node.kind_id
+            action = dispatch[kind_id](node, ctx)
+            if action == _DESCEND:
+                enclosing.append((end_byte, start_byte, end_byte, False))
+            elif action == _SKIP:
+                enclosing.append((end_byte, 0, -1, False))
+            else:
+                body = node.child_by_field_name(body_fields[kind_id])
+                pushed_scope = action == _ENTER_SCOPE
+                if body is not None:
+                    enclosing.append((end_byte, body.start_byte, body.end_byte, pushed_scope))
+                else:
+                    enclosing.append((end_byte, 0, -1, pushed_scope))
+
+        while enclosing:
+            if enclosing.pop()[3]:
+                ctx.pop_scope()
+
+    def _process_function(self, node: Node, ctx: PythonParseContext) -> int:
         """Extract function or method definition."""
         name_node = node.child_by_field_name("name")
         if not name_node:
-            return
+            return _SKIP
 
-        name = self._get_node_text(name_node, ctx.source_bytes)
+        source_bytes = ctx.source_bytes
+        name = self._get_node_text(name_node, source_bytes)
         
         # Determine if this is a method (inside a class) or standalone function
         is_method = ctx.current_scope is not None and self._is_inside_class(ctx)
@@ -89,8 +298,9 @@ class PythonParser(LanguageParser):
         else:
             qualified_name = self._build_qualified_name(ctx.file_path, name)
 
-        # Extract signature
-        signature = self._extract_function_signature(node, ctx.source_bytes)
+        # Extract signature (reusing the already decoded name and return type)
+        return_type = self._extract_return_type(node, source_bytes)
+        signature = self._extract_function_signature(node, source_bytes, name, return_type)
 
         # Extract decorators as metadata
         # Check if the function is inside a decorated_definition node
@@ -98,13 +308,13 @@ class PythonParser(LanguageParser):
         decorators = []
         source_node = node  # Default to function node
         
-        if parent_node and parent_node.type == "decorated_definition":
-            decorators = self._extract_decorators(parent_node, ctx.source_bytes)
+        if parent_node and parent_node.kind_id == self._decorated_definition_kind:
+            decorators = self._extract_decorators(parent_node, source_bytes)
             # Extract source from parent to include decorators
             source_node = parent_node
         
         # Extract source code (including decorators if present)
-        source_code = self._get_node_text(source_node, ctx.source_bytes)
+        source_code = self._get_node_text(source_node, source_bytes)
         
         # Extract position information
         start_line, end_line, start_column, end_column = self._extract_position(source_node)
@@ -115,17 +325,16 @@ class PythonParser(LanguageParser):
             metadata["decorators"] = decorators
         
         # Extract type hints from signature
-        return_type = self._extract_return_type(node, ctx.source_bytes)
         if return_type:
             metadata["return_type"] = return_type
         
         # Extract parameter information
-        parameters = self._extract_parameters(node, ctx.source_bytes)
+        parameters = self._extract_parameters(node, source_bytes)
         if parameters:
             metadata["parameters"] = parameters
         
         # Extract docstring
-        docstring = self._extract_docstring(node, ctx.source_bytes)
+        docstring = self._extract_docstring(node, source_bytes)
         if docstring:
             metadata["docstring"] = docstring
 
@@ -146,7 +355,7 @@ class PythonParser(LanguageParser):
 
         # Add MEMBER reference from parent class to this method for traversal
         if is_method and ctx.current_scope:
-            parent_path, parent_name = self._split_qualified_name(ctx.current_scope)
+            parent_path, parent_name = ctx.current_scope_split
             method_path, method_name = self._split_qualified_name(qualified_name)
             ctx.add_reference(
                 Reference(
@@ -160,19 +369,16 @@ class PythonParser(LanguageParser):
 
         # Process function body for calls
         ctx.push_scope(qualified_name)
-        body = node.child_by_field_name("body")
-        if body:
-            for child in body.children:
-                self._process_node(child, ctx)
-        ctx.pop_scope()
+        return _ENTER_SCOPE
 
-    def _process_class(self, node: Node, ctx: ParseContext) -> None:
+    def _process_class(self, node: Node, ctx: PythonParseContext) -> int:
         """Extract class definition and its members."""
         name_node = node.child_by_field_name("name")
         if not name_node:
-            return
+            return _SKIP
 
-        name = self._get_node_text(name_node, ctx.source_bytes)
+        source_bytes = ctx.source_bytes
+        name = self._get_node_text(name_node, source_bytes)
 
         # Build qualified name
         if ctx.current_scope:
@@ -197,7 +403,7 @@ class PythonParser(LanguageParser):
             )
 
         # Extract signature (class name + bases)
-        signature = self._extract_class_signature(node, ctx.source_bytes)
+        signature = self._extract_class_signature(node, source_bytes, name)
 
         # Extract decorators as metadata
         # Check if the class is inside a decorated_definition node
@@ -205,13 +411,13 @@ class PythonParser(LanguageParser):
         decorators = []
         source_node = node  # Default to class node
         
-        if parent_node and parent_node.type == "decorated_definition":
-            decorators = self._extract_decorators(parent_node, ctx.source_bytes)
+        if parent_node and parent_node.kind_id == self._decorated_definition_kind:
+            decorators = self._extract_decorators(parent_node, source_bytes)
             # Extract source from parent to include decorators
             source_node = parent_node
         
         # Extract source code (including decorators if present)
-        source_code = self._get_node_text(source_node, ctx.source_bytes)
+        source_code = self._get_node_text(source_node, source_bytes)
         
         # Extract position information
         start_line, end_line, start_column, end_column = self._extract_position(source_node)
@@ -226,7 +432,7 @@ class PythonParser(LanguageParser):
             metadata["base_classes"] = bases
         
         # Extract docstring
-        docstring = self._extract_docstring(node, ctx.source_bytes)
+        docstring = self._extract_docstring(node, source_bytes)
         if docstring:
             metadata["docstring"] = docstring
 
@@ -247,53 +453,53 @@ class PythonParser(LanguageParser):
 
         # Process class body
         ctx.push_scope(qualified_name)
-        body = node.child_by_field_name("body")
-        if body:
-            for child in body.children:
-                self._process_node(child, ctx)
-        ctx.pop_scope()
+        return _ENTER_SCOPE
 
-    def _process_import(self, node: Node, ctx: ParseContext) -> None:
+    def _process_import(self, node: Node, ctx: PythonParseContext) -> int:
         """Extract import statement."""
         source_code = self._get_node_text(node, ctx.source_bytes)
 
         for child in node.children:
-            if child.type == "dotted_name":
+            child_kind = child.kind_id
+            if child_kind == self._dotted_name_kind:
                 module_name = self._get_node_text(child, ctx.source_bytes)
                 self._add_import_symbol_and_reference(module_name, source_code, ctx)
-            elif child.type == "aliased_import":
+            elif child_kind == self._aliased_import_kind:
                 name_node = child.child_by_field_name("name")
                 if name_node:
                     module_name = self._get_node_text(name_node, ctx.source_bytes)
                     self._add_import_symbol_and_reference(module_name, source_code, ctx)
+        return _SKIP
 
-    def _process_import_from(self, node: Node, ctx: ParseContext) -> None:
+    def _process_import_from(self, node: Node, ctx: PythonParseContext) -> int:
         """Extract from ... import ... statement."""
         source_code = self._get_node_text(node, ctx.source_bytes)
 
         # Get the module being imported from
         module_node = node.child_by_field_name("module_name")
         if not module_node:
-            return
+            return _SKIP
 
         module_name = self._get_node_text(module_node, ctx.source_bytes)
 
         # Get imported names
         for child in node.children:
-            if child.type in ("dotted_name", "identifier"):
+            child_kind = child.kind_id
+            if child_kind == self._dotted_name_kind or child_kind == self._identifier_kind:
                 if child != module_node:
                     imported_name = self._get_node_text(child, ctx.source_bytes)
                     full_name = f"{module_name}.{imported_name}"
                     self._add_import_symbol_and_reference(full_name, source_code, ctx)
-            elif child.type == "aliased_import":
+            elif child_kind == self._aliased_import_kind:
                 name_node = child.child_by_field_name("name")
                 if name_node:
                     imported_name = self._get_node_text(name_node, ctx.source_bytes)
                     full_name = f"{module_name}.{imported_name}"
                     self._add_import_symbol_and_reference(full_name, source_code, ctx)
+        return _SKIP
 
     def _add_import_symbol_and_reference(
-        self, module_name: str, source_code: str, ctx: ParseContext
+        self, module_name: str, source_code: str, ctx: PythonParseContext
     ) -> None:
         """Add both an import symbol and a reference for an import."""
         # Create import symbol
@@ -309,122 +515,103 @@ class PythonParser(LanguageParser):
         ctx.add_symbol(symbol)
 
         # Create import reference
-        source_file_path = self._file_path_to_dot_notation(ctx.file_path)
+        source_file_path = ctx.dotted_file_path
         
         # Split module name into path and name
-        if "." in module_name:
-            target_path = ".".join(module_name.split(".")[:-1])
-            target_name = module_name.split(".")[-1]
-        else:
-            target_path = module_name
-            target_name = module_name
+        target_path, target_name = self._split_qualified_name(module_name)
 
+        # Positional in field order (type, source path/name, target path/name)
         ctx.add_reference(
-            Reference(
-                source_file_path=source_file_path,
-                source_symbol_name="<file>",
-                target_file_path=target_path,
-                target_symbol_name=target_name,
-                reference_type=ReferenceType.IMPORT,
-            )
+            Reference(ReferenceType.IMPORT, source_file_path, "<file>", target_path, target_name)
         )
 
-    def _process_call(self, node: Node, ctx: ParseContext) -> None:
+    def _process_call(self, node: Node, ctx: PythonParseContext) -> int:
         """Extract function/method call as a reference."""
         func_node = node.child_by_field_name("function")
         if not func_node:
-            return
+            return _SKIP
 
         # Get the called function name
         call_name = self._resolve_call_name(func_node, ctx.source_bytes)
         if not call_name:
-            return
+            return _SKIP
 
         # Only record calls if we're inside a function/method scope
         if ctx.current_scope:
-            source_path, source_name = self._split_qualified_name(ctx.current_scope)
+            source_path, source_name = ctx.current_scope_split
             
             # Split call name into target path and name
-            if "." in call_name:
-                target_path = ".".join(call_name.split(".")[:-1])
-                target_name = call_name.split(".")[-1]
+            dot = call_name.rfind(".")
+            if dot >= 0:
+                target_path = call_name[:dot]
+                target_name = call_name[dot + 1 :]
             else:
                 target_path = source_path  # Same module call
                 target_name = call_name
 
+            # Positional in field order (type, source path/name, target path/name);
+            # keyword construction is measurably slower for the most frequent edge
             ctx.add_reference(
-                Reference(
-                    source_file_path=source_path,
-                    source_symbol_name=source_name,
-                    target_file_path=target_path,
-                    target_symbol_name=target_name,
-                    reference_type=ReferenceType.CALL,
-                )
+                Reference(ReferenceType.CALL, source_path, source_name, target_path, target_name)
             )
 
         # Continue processing arguments for nested calls
-        args = node.child_by_field_name("arguments")
-        if args:
-            for child in args.children:
-                self._process_node(child, ctx)
+        return _ONLY_BODY
 
     def _resolve_call_name(self, node: Node, source_bytes: bytes) -> str | None:
         """Resolve the name of a called function."""
-        match node.type:
-            case "identifier":
-                return self._get_node_text(node, source_bytes)
-            case "attribute":
-                # Handle method calls like obj.method()
-                return self._get_node_text(node, source_bytes)
-            case _:
-                return None
-
-    def _extract_function_signature(self, node: Node, source_bytes: bytes) -> str:
+        node_kind = node.kind_id
+        if node_kind == self._identifier_kind:
+            return self._get_node_text(node, source_bytes)
+        if node_kind == self._attribute_kind:
+            # Handle method calls like obj.method()
+            return self._get_node_text(node, source_bytes)
+        return None
+
+    def _extract_function_signature(
+        self, node: Node, source_bytes: bytes, name: str, return_type: str | None
+    ) -> str:
         """Extract function signature (def name(params) -> return_type)."""
         parts = []
 
         # Get decorators
         for child in node.children:
-            if child.type == "decorator":
+            if child.kind_id == self._decorator_kind:
                 parts.append(self._get_node_text(child, source_bytes))
 
         # Get the def line (up to the colon)
-        name_node = node.child_by_field_name("name")
         params_node = node.child_by_field_name("parameters")
-        return_type = node.child_by_field_name("return_type")
 
-        if name_node and params_node:
-            sig = f"def {self._get_node_text(name_node, source_bytes)}{self._get_node_text(params_node, source_bytes)}"
+        if params_node:
+            sig = f"def {name}{self._get_node_text(params_node, source_bytes)}"
             if return_type:
-                sig += f" -> {self._get_node_text(return_type, source_bytes)}"
+                sig += f" -> {return_type}"
             parts.append(sig)
 
         return "\n".join(parts)
 
-    def _extract_class_signature(self, node: Node, source_bytes: bytes) -> str:
+    def _extract_class_signature(self, node: Node, source_bytes: bytes, name: str) -> str:
         """Extract class signature (class Name(bases))."""
         parts = []
 
         # Get decorators
         for child in node.children:
-            if child.type == "decorator":
+            if child.kind_id == self._decorator_kind:
                 parts.append(self._get_node_text(child, source_bytes))
 
         # Get the class line
-        name_node = node.child_by_field_name("name")
-        if name_node:
-            sig = f"class {self._get_node_text(name_node, source_bytes)}"
+        sig = f"class {name}"
 
-            # Add base classes if present
-            superclass = node.child_by_field_name("superclasses")
-            if superclass:
-                sig += self._get_node_text(superclass, source_bytes)
+        # Add base classes if present
+        superclass = node.child_by_field_name("superclasses")
+        if superclass:
+            sig += self._get_node_text(superclass, source_bytes)
 
-            parts.append(sig)
+        parts.append(sig)
 
         return "\n".join(parts)
 
-    def _extract_base_classes(self, node: Node, ctx: ParseContext) -> list[str]:
+    def _extract_base_classes(self, node: Node, ctx: PythonParseContext) -> list[str]:
         """Extract base class names from a class definition."""
         bases: list[str] = []
         superclass_node = node.child_by_field_name("superclasses")
@@ -432,7 +619,8 @@ class PythonParser(LanguageParser):
             return bases
 
         for child in superclass_node.children:
-            if child.type in ("identifier", "attribute"):
+            child_kind = child.kind_id
+            if child_kind == self._identifier_kind or child_kind == self._attribute_kind:
                 base_name = self._get_node_text(child, ctx.source_bytes)
                 bases.append(base_name)
 
@@ -441,12 +629,13 @@ class PythonParser(LanguageParser):
     def _extract_decorators(self, node: Node, source_bytes: bytes) -> list[str]:
         """Extract decorator names from a function/class definition."""
         decorators: list[str] = []
+        decorator_name_kinds = (self._identifier_kind, self._attribute_kind, self._call_kind)
         for child in node.children:
-            if child.type == "decorator":
+            if child.kind_id == self._decorator_kind:
                 # Get just the decorator name/path (identifier, attribute, or call)
                 # Need to include the @ symbol for pattern matching
                 for subchild in child.children:
-                    if subchild.type in ("identifier", "attribute", "call"):
+                    if subchild.kind_id in decorator_name_kinds:
                         dec_text = self._get_node_text(subchild, source_bytes)
                         # Prepend @ if not present
                         if not dec_text.startswith("@"):
@@ -469,23 +658,30 @@ class PythonParser(LanguageParser):
         if not params_node:
             return parameters
         
+        get_text = self._get_node_text
+        name_field, type_field, default_field = self._name_field, self._type_field, self._default_field
+        typed_parameter_kind = self._typed_parameter_kind
+        identifier_kind = self._identifier_kind
         for child in params_node.children:
-            if child.type == "typed_parameter":
+            child_kind = child.kind_id
+            if child_kind == typed_parameter_kind:
                 # Parameter with type annotation
-                name_node = child.child_by_field_name("name")
-                type_node = child.child_by_field_name("type")
-                default_node = child.child_by_field_name("default")
+                name_node = child.child_by_field_id(name_field)
+                type_node = child.child_by_field_id(type_field)
+                default_node = (
+                    child.child_by_field_id(default_field) if default_field is not None else None
+                )
                 
                 param_info: dict[str, str | None] = {
-                    "name": self._get_node_text(name_node, source_bytes) if name_node else None,
-                    "type": self._get_node_text(type_node, source_bytes) if type_node else None,
-                    "default": self._get_node_text(default_node, source_bytes) if default_node else None,
+                    "name": get_text(name_node, source_bytes) if name_node else None,
+                    "type": get_text(type_node, source_bytes) if type_node else None,
+                    "default": get_text(default_node, source_bytes) if default_node else None,
                 }
                 parameters.append(param_info)
-            elif child.type == "identifier":
+            elif child_kind == identifier_kind:
                 # Simple parameter without type annotation
                 param_info = {
-                    "name": self._get_node_text(child, source_bytes),
+                    "name": get_text(child, source_bytes),
                     "type": None,
                     "default": None,
                 }
@@ -496,61 +692,56 @@ class PythonParser(LanguageParser):
     def _extract_docstring(self, node: Node, source_bytes: bytes) -> str | None:
         """Extract docstring from a function or class definition."""
         body = node.child_by_field_name("body")
-        if not body or not body.children:
+        if not body:
             return None
         
-        # Docstring is typically the first statement in the body
-        first_stmt = body.children[0]
-        if first_stmt.type == "expression_statement":
+        # Docstring is typically the first statement in the body; fetch only
+        # that child instead of building the list of every statement
+        first_stmt = body.child(0)
+        if first_stmt is not None and first_stmt.kind_id == self._expression_statement_kind:
             # Check if it's a string literal
             for child in first_stmt.children:
-                if child.type in ("string", "concatenated_string"):
+                if child.kind_id in self._string_kinds:
                     docstring_text = self._get_node_text(child, source_bytes)
                     # Remove quotes (simple approach - handles triple quotes)
                     docstring_text = docstring_text.strip()
-                    if docstring_text.startswith('"""'):
+                    if docstring_text.startswith(_TRIPLE_QUOTES):
                         docstring_text = docstring_text[3:]
-                    elif docstring_text.startswith("'''"):
-                        docstring_text = docstring_text[3:]
-                    elif docstring_text.startswith('"'):
-                        docstring_text = docstring_text[1:]
-                    elif docstring_text.startswith("'"):
+                    elif docstring_text.startswith(_QUOTES):
                         docstring_text = docstring_text[1:]
                     
-                    if docstring_text.endswith('"""'):
+                    if docstring_text.endswith(_TRIPLE_QUOTES):
                         docstring_text = docstring_text[:-3]
-                    elif docstring_text.endswith("'''"):
-                        docstring_text = docstring_text[:-3]
-                    elif docstring_text.endswith('"'):
-                        docstring_text = docstring_text[:-1]
-                    elif docstring_text.endswith("'"):
+                    elif docstring_text.endswith(_QUOTES):
                         docstring_text = docstring_text[:-1]
                     
                     return docstring_text.strip()
         
         return None
 
-    def _is_inside_class(self, ctx: ParseContext) -> bool:
+    def _is_inside_class(self, ctx: PythonParseContext) -> bool:
         """Check if current scope is a class."""
         # This is a simplification - in practice we'd track scope types
         return ctx.current_scope is not None
 
     def _get_node_text(self, node: Node, source_bytes: bytes) -> str:
         """Extract text content from a tree-sitter node."""
-        return source_bytes[node.start_byte : node.end_byte].decode("utf-8", errors="replace")
+        text = source_bytes[node.start_byte : node.end_byte]
+        # Strict UTF-8 decoding takes CPython's ASCII fast path; the replacing
+        # decoder is only needed for the rare slice that is not valid UTF-8
+        try:
+            return text.decode()
+        except UnicodeDecodeError:
+            return text.decode("utf-8", errors="replace")
 
     def _file_path_to_dot_notation(self, file_path: str) -> str:
         """Convert file path to dot notation."""
-        path = file_path
-        for ext in self.file_extensions:
-            if path.endswith(ext):
-                path = path[:-len(ext)]
-                break
-        return path.replace("/", ".").replace("\\", ".")
+        return _dot_path(file_path, self.file_extensions)
 
     def _split_qualified_name(self, qualified_name: str) -> tuple[str, str]:
         """Split qualified name into (path, name)."""
-        if "." in qualified_name:
-            parts = qualified_name.rsplit(".", 1)
-            return (parts[0], parts[1])
+        dot = qualified_name.rfind(".")
+        if dot >= 0:
+            return (qualified_name[:dot], qualified_name[dot + 1 :])
         return (qualified_name, qualified_name)
+
@@ -1,6 +1,7 @@
 """Parser registry for managing language-specific parsers."""
 
 from functools import lru_cache
+from pathlib import Path
 
 from code_parser.core import Language
 from code_parser.logging import get_logger
@@ -25,12 +26,17 @@ class ParserRegistry:
     def __init__(self) -> None:
         self._parsers: dict[Language, LanguageParser] = {}
         self._extension_map: dict[str, Language] = {}
+        # Extension -> parser, so a file lookup is a single dict hit
+        self._extension_parsers: dict[str, LanguageParser] = {}
 
     def register(self, parser: LanguageParser) -> None:
         """Register a parser for its language."""
         self._parsers[parser.language] = parser
+        # Extensions are matched case-insensitively (FOO.RS is a Rust file)
         for ext in parser.file_extensions:
+            ext = ext.lower()
             self._extension_map[ext] = parser.language
+            self._extension_parsers[ext] = parser
         logger.debug(
             "parser_registered",
             language=parser.language.value,
@@ -43,11 +49,7 @@ class ParserRegistry:
 
     def get_parser_for_file(self, file_path: str) -> LanguageParser | None:
         """Get parser based on file extension."""
-        ext = self._get_extension(file_path)
-        language = self._extension_map.get(ext)
-        if language:
-            return self._parsers.get(language)
-        return None
+        return self._extension_parsers.get(self._get_extension(file_path))
 
     def get_language_for_file(self, file_path: str) -> Language | None:
         """Get language based on file extension."""
@@ -69,23 +71,28 @@ class ParserRegistry:
         return list(self._extension_map.keys())
 
     def _get_extension(self, file_path: str) -> str:
-        """Extract file extension from path."""
-        # Handle multiple extensions like .test.py
-        parts = file_path.rsplit("/", 1)[-1].split(".")
-        if len(parts) >= 2:
-            return f".{parts[-1]}"
+        """Extract the lowercased file extension from path."""
+        # Only the last suffix counts (.test.py -> .py); a dot in a
+        # directory name is not an extension
+        dot = file_path.rfind(".")
+        if dot > max(file_path.rfind("/"), file_path.rfind("\\")):
+            return file_path[dot:].lower()
         return ""
 
 
-def _create_default_registry() -> ParserRegistry:
-    """Create and configure the default parser registry."""
+def create_parser_registry(parse_cache_dir: Path | None = None) -> ParserRegistry:
+    """
+    Create a registry with all supported parsers.
+
+    parse_cache_dir enables the Kotlin parser's on-disk result cache.
+    """
     registry = ParserRegistry()
 
     # Register all supported parsers
     registry.register(PythonParser())
     registry.register(JavaParser())
     registry.register(JavaScriptParser())
-    registry.register(KotlinParser())
+    registry.register(KotlinParser(cache_dir=parse_cache_dir))
     registry.register(RustParser())
 
     logger.info(
@@ -99,5 +106,5 @@ def _create_default_registry() -> ParserRegistry:
 @lru_cache
 def get_parser_registry() -> ParserRegistry:
     """Get the singleton parser registry instance."""
-    return _create_default_registry()
+    return create_parser_registry()
 
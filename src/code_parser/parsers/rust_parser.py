@@ -11,7 +11,43 @@ from code_parser.core import (
     Symbol,
     SymbolKind,
 )
-from code_parser.parsers.base import LanguageParser, ParseContext
+from code_parser.parsers.base import LanguageParser, ParseContext, _dot_path
+
+# Walk actions returned by node handlers
+_DESCEND = 0  # Visit the node's children
+_SKIP = 1  # Do not visit the node's children
+_ENTER_SCOPE = 2  # Handler pushed a scope; visit only its body child
+_ONLY_BODY = 3  # Visit only the node's body child, without a new scope
+
+# Enum members bound once; attribute access on an Enum class is not free and
+# these are looked up for every symbol and reference
+_KIND_FUNCTION = SymbolKind.FUNCTION
+_KIND_STRUCT = SymbolKind.STRUCT
+_KIND_ENUM = SymbolKind.ENUM
+_KIND_TRAIT = SymbolKind.TRAIT
+_KIND_IMPL = SymbolKind.IMPL
+_KIND_MODULE = SymbolKind.MODULE
+_KIND_IMPORT = SymbolKind.IMPORT
+_REF_CALL = ReferenceType.CALL
+_REF_MEMBER = ReferenceType.MEMBER
+_REF_IMPORT = ReferenceType.IMPORT
+_REF_INHERITANCE = ReferenceType.INHERITANCE
+
+# Shared metadata for symbols without any; Symbol consumers only read metadata
+_EMPTY_METADATA: dict[str, str | int | bool | list] = {}
+
+# Built once: the set is part of the dot-path cache key and caches its hash
+_FILE_EXTENSIONS = frozenset({".rs"})
+
+
+class RustParseContext(ParseContext):
+    """Extended context for Rust parsing."""
+
+    def __init__(self, file_path: str, source_bytes: bytes, dotted_file_path: str) -> None:
+        super().__init__(file_path, source_bytes)
+        # File path in dot notation: prefix of top-level qualified names and
+        # source of file-level references
+        self.dotted_file_path = dotted_file_path
 
 
 class RustParser(LanguageParser):
@@ -25,6 +61,63 @@ class RustParser(LanguageParser):
     def __init__(self) -> None:
         self._language = Language(ts_rust.language())
         self._parser = Parser(self._language)
+        # Node kinds are compared by integer id rather than by type name
+        kind = self._kind_id
+        function_kind = kind("function_item")
+        trait_kind = kind("trait_item")
+        impl_kind = kind("impl_item")
+        mod_kind = kind("mod_item")
+        call_kind = kind("call_expression")
+        self._line_comment_kind = kind("line_comment")
+        self._visibility_modifier_kind = kind("visibility_modifier")
+        self._attribute_item_kind = kind("attribute_item")
+        self._parameter_kind = kind("parameter")
+        # Use declaration children that carry an import path
+        self._use_path_kinds = frozenset(
+            kind(type_name)
+            for type_name in ("use_as_clause", "scoped_use_list", "use_wildcard", "scoped_identifier")
+        )
+        # Field ids, resolved once instead of by name on every lookup
+        field = self._language.field_id_for_name
+        self._name_field = field("name")
+        self._body_field = field("body")
+        self._type_field = field("type")
+        self._trait_field = field("trait")
+        self._return_type_field = field("return_type")
+        self._parameters_field = field("parameters")
+        self._function_field = field("function")
+        self._arguments_field = field("arguments")
+        self._macro_field = field("macro")
+        self._pattern_field = field("pattern")
+        # Node kind -> handler returning a walk action
+        self._handlers = {
+            function_kind: self._process_function,
+            kind("struct_item"): self._process_struct,
+            kind("enum_item"): self._process_enum,
+            trait_kind: self._process_trait,
+            impl_kind: self._process_impl,
+            mod_kind: self._process_mod,
+            kind("use_declaration"): self._process_use,
+            call_kind: self._process_call,
+            kind("macro_invocation"): self._process_macro_call,
+        }
+        # Handlers indexed directly by kind id; ids past the table (ERROR nodes
+        # use 65535) have no handler
+        self._dispatch = tuple(
+            self._handlers.get(kind_id) for kind_id in range(self._language.node_kind_count)
+        )
+        # Node kind -> field id of the only child walked below it
+        self._body_fields = {
+            function_kind: self._body_field,
+            trait_kind: self._body_field,
+            impl_kind: self._body_field,
+            mod_kind: self._body_field,
+            call_kind: self._arguments_field,
+        }
+
+    def _kind_id(self, type_name: str) -> int | None:
+        """Get the grammar's id for a named node type (None if it does not exist)."""
+        return self._language.id_for_node_kind(type_name, True)
 
     @property
     def language(self) -> CodeLanguage:
@@ -32,16 +125,18 @@ class RustParser(LanguageParser):
 
     @property
     def file_extensions(self) -> frozenset[str]:
-        return frozenset({".rs"})
+        return _FILE_EXTENSIONS
 
     def parse(self, source_code: str, file_path: str, content_hash: str) -> ParsedFile:
         """Parse Rust source code and extract symbols and references."""
         source_bytes = source_code.encode("utf-8")
         tree = self._parser.parse(source_bytes)
 
-        ctx = ParseContext(file_path, source_bytes)
+        ctx = RustParseContext(
+            file_path, source_bytes, self._file_path_to_dot_notation(file_path)
+        )
 
-        self._process_node(tree.root_node, ctx)
+        self._walk(tree.root_node, ctx)
 
         return ParsedFile(
             relative_path=file_path,
@@ -52,36 +147,65 @@ class RustParser(LanguageParser):
             errors=tuple(ctx.errors),
         )
 
-    def _process_node(self, node: Node, ctx: ParseContext) -> None:
-        """Recursively process AST nodes."""
-        match node.type:
-            case "function_item":
-                self._process_function(node, ctx)
-            case "struct_item":
-                self._process_struct(node, ctx)
-            case "enum_item":
-                self._process_enum(node, ctx)
-            case "trait_item":
-                self._process_trait(node, ctx)
-            case "impl_item":
-                self._process_impl(node, ctx)
-            case "mod_item":
-                self._process_mod(node, ctx)
-            case "use_declaration":
-                self._process_use(node, ctx)
-            case "call_expression":
-                self._process_call(node, ctx)
-            case "macro_invocation":
-                self._process_macro_call(node, ctx)
-            case _:
-                for child in node.children:
-                    self._process_node(child, ctx)
-
-    def _process_function(self, node: Node, ctx: ParseContext) -> None:
+    def _walk(self, root: Node, ctx: RustParseContext) -> None:
+        """
+        Walk the AST with a single tree cursor, dispatching interesting nodes.
+
+        Handlers return a walk action. Function, trait, impl and mod nodes
+        only have their body (arguments for calls) walked; a scope pushed by
+        a handler is popped once the cursor climbs back out of its node.
+        """
+        dispatch = self._dispatch
+        kind_count = len(dispatch)
+        body_fields = self._body_fields
+        cursor = root.walk()
+        # The loop runs once per visited node; bind the cursor methods once
+        goto_first_child = cursor.goto_first_child
+        goto_next_sibling = cursor.goto_next_sibling
+        goto_parent = cursor.goto_parent
+        depth = 0
+        # (depth, body field id, pushed a scope) for each node walked body-only
+        bodies: list[tuple[int, int, bool]] = []
+        # Depth and body field of the innermost such node (-2 never matches a depth)
+        body_depth, body_field = -2, -1
+
+        while True:
+            action = _DESCEND
+            if body_depth == depth - 1 and cursor.field_id != body_field:
+                # Only the body child is walked
+                action = _SKIP
+            else:
+                node = cursor.node
+                kind_id = node.kind_id
+                handler = dispatch[kind_id] if kind_id < kind_count else None
+                if handler is not None:
+                    action = handler(node, ctx)
+                    if action in (_ENTER_SCOPE, _ONLY_BODY):
+                        body_depth, body_field = depth, body_fields[kind_id]
+                        bodies.append((depth, body_field, action == _ENTER_SCOPE))
+
+            if action != _SKIP and goto_first_child():
+                depth += 1
+                continue
+
+            # Leave the current node, climbing until a sibling is found
+            while True:
+                if body_depth == depth:
+                    _, _, pushed_scope = bodies.pop()
+                    if pushed_scope:
+                        ctx.pop_scope()
+                    body_depth, body_field = bodies[-1][:2] if bodies else (-2, -1)
+                if goto_next_sibling():
+                    break
+                if depth == 0 or not goto_parent():
+                    return
+                depth -= 1
+
+    def _process_function(self, node: Node, ctx: RustParseContext) -> int:
         """Extract function definition."""
-        name_node = node.child_by_field_name("name")
+        name_node = node.child_by_field_id(self._name_field)
         if not name_node:
-            return
+            return _SKIP
 
         name = self._get_node_text(name_node, ctx.source_bytes)
         source_code = self._get_node_text(node, ctx.source_bytes)
@@ -89,46 +213,27 @@ class RustParser(LanguageParser):
         if ctx.current_scope:
             qualified_name = f"{ctx.current_scope}::{name}"
         else:
-            qualified_name = self._build_qualified_name(ctx.file_path, name)
+            qualified_name = f"{ctx.dotted_file_path}.{name}"
 
         signature = self._extract_function_signature(node, ctx.source_bytes)
         
         # Extract position information
         start_line, end_line, start_column, end_column = self._extract_position(node)
         
-        # Extract enhanced metadata
-        metadata: dict[str, str | int | bool | list] = {}
-        
-        # Check for visibility
-        visibility = self._extract_visibility(node, ctx.source_bytes)
-        if visibility:
-            metadata["visibility"] = visibility
-        
-        # Extract attributes
-        attributes = self._extract_attributes(node, ctx.source_bytes)
-        if attributes:
-            metadata["attributes"] = attributes
-        
-        # Extract doc comments
-        doc_comment = self._extract_doc_comment(node, ctx.source_bytes)
-        if doc_comment:
-            metadata["doc_comment"] = doc_comment
-        
-        # Extract return type
+        # Extract return type and parameters
         return_type = self._extract_return_type(node, ctx.source_bytes)
-        if return_type:
-            metadata["return_type"] = return_type
-        
-        # Extract parameters
         parameters = self._extract_parameters(node, ctx.source_bytes)
-        if parameters:
-            metadata["parameters"] = parameters
+
+        # Extract enhanced metadata (visibility, attributes, doc comments)
+        metadata = self._extract_item_metadata(
+            node, ctx.source_bytes, return_type, parameters
+        )
 
         ctx.add_symbol(
             Symbol(
                 name=name,
                 qualified_name=qualified_name,
-                kind=SymbolKind.FUNCTION,
+                kind=_KIND_FUNCTION,
                 source_code=source_code,
                 signature=signature,
                 parent_qualified_name=ctx.current_scope,
@@ -150,22 +255,18 @@ class RustParser(LanguageParser):
                     source_symbol_name=parent_name,
                     target_file_path=fn_path,
                     target_symbol_name=fn_name,
-                    reference_type=ReferenceType.MEMBER,
+                    reference_type=_REF_MEMBER,
                 )
             )
 
         ctx.push_scope(qualified_name)
-        body = node.child_by_field_name("body")
-        if body:
-            for child in body.children:
-                self._process_node(child, ctx)
-        ctx.pop_scope()
+        return _ENTER_SCOPE
 
-    def _process_struct(self, node: Node, ctx: ParseContext) -> None:
+    def _process_struct(self, node: Node, ctx: RustParseContext) -> int:
         """Extract struct definition."""
-        name_node = node.child_by_field_name("name")
+        name_node = node.child_by_field_id(self._name_field)
         if not name_node:
-            return
+            return _SKIP
 
         name = self._get_node_text(name_node, ctx.source_bytes)
         source_code = self._get_node_text(node, ctx.source_bytes)
@@ -173,28 +274,19 @@ class RustParser(LanguageParser):
         if ctx.current_scope:
             qualified_name = f"{ctx.current_scope}::{name}"
         else:
-            qualified_name = self._build_qualified_name(ctx.file_path, name)
+            qualified_name = f"{ctx.dotted_file_path}.{name}"
 
         # Extract position information
         start_line, end_line, start_column, end_column = self._extract_position(node)
         
         # Extract enhanced metadata
-        metadata: dict[str, str | int | bool | list] = {}
-        visibility = self._extract_visibility(node, ctx.source_bytes)
-        if visibility:
-            metadata["visibility"] = visibility
-        attributes = self._extract_attributes(node, ctx.source_bytes)
-        if attributes:
-            metadata["attributes"] = attributes
-        doc_comment = self._extract_doc_comment(node, ctx.source_bytes)
-        if doc_comment:
-            metadata["doc_comment"] = doc_comment
+        metadata = self._extract_item_metadata(node, ctx.source_bytes)
 
         ctx.add_symbol(
             Symbol(
                 name=name,
                 qualified_name=qualified_name,
-                kind=SymbolKind.STRUCT,
+                kind=_KIND_STRUCT,
                 source_code=source_code,
                 parent_qualified_name=ctx.current_scope,
                 metadata=metadata,
@@ -204,12 +296,13 @@ class RustParser(LanguageParser):
                 end_column=end_column,
             )
         )
+        return _SKIP
 
-    def _process_enum(self, node: Node, ctx: ParseContext) -> None:
+    def _process_enum(self, node: Node, ctx: RustParseContext) -> int:
         """Extract enum definition."""
-        name_node = node.child_by_field_name("name")
+        name_node = node.child_by_field_id(self._name_field)
         if not name_node:
-            return
+            return _SKIP
 
         name = self._get_node_text(name_node, ctx.source_bytes)
         source_code = self._get_node_text(node, ctx.source_bytes)
@@ -217,28 +310,19 @@ class RustParser(LanguageParser):
         if ctx.current_scope:
             qualified_name = f"{ctx.current_scope}::{name}"
         else:
-            qualified_name = self._build_qualified_name(ctx.file_path, name)
+            qualified_name = f"{ctx.dotted_file_path}.{name}"
 
         # Extract position information
         start_line, end_line, start_column, end_column = self._extract_position(node)
         
         # Extract enhanced metadata
-        metadata: dict[str, str | int | bool | list] = {}
-        visibility = self._extract_visibility(node, ctx.source_bytes)
-        if visibility:
-            metadata["visibility"] = visibility
-        attributes = self._extract_attributes(node, ctx.source_bytes)
-        if attributes:
-            metadata["attributes"] = attributes
-        doc_comment = self._extract_doc_comment(node, ctx.source_bytes)
-        if doc_comment:
-            metadata["doc_comment"] = doc_comment
+        metadata = self._extract_item_metadata(node, ctx.source_bytes)
 
         ctx.add_symbol(
             Symbol(
                 name=name,
                 qualified_name=qualified_name,
-                kind=SymbolKind.ENUM,
+                kind=_KIND_ENUM,
                 source_code=source_code,
                 parent_qualified_name=ctx.current_scope,
                 metadata=metadata,
@@ -248,12 +332,13 @@ class RustParser(LanguageParser):
                 end_column=end_column,
             )
         )
+        return _SKIP
 
-    def _process_trait(self, node: Node, ctx: ParseContext) -> None:
+    def _process_trait(self, node: Node, ctx: RustParseContext) -> int:
         """Extract trait definition."""
-        name_node = node.child_by_field_name("name")
+        name_node = node.child_by_field_id(self._name_field)
         if not name_node:
-            return
+            return _SKIP
 
         name = self._get_node_text(name_node, ctx.source_bytes)
         source_code = self._get_node_text(node, ctx.source_bytes)
@@ -261,28 +346,19 @@ class RustParser(LanguageParser):
         if ctx.current_scope:
             qualified_name = f"{ctx.current_scope}::{name}"
         else:
-            qualified_name = self._build_qualified_name(ctx.file_path, name)
+            qualified_name = f"{ctx.dotted_file_path}.{name}"
 
         # Extract position information
         start_line, end_line, start_column, end_column = self._extract_position(node)
         
         # Extract enhanced metadata
-        metadata: dict[str, str | int | bool | list] = {}
-        visibility = self._extract_visibility(node, ctx.source_bytes)
-        if visibility:
-            metadata["visibility"] = visibility
-        attributes = self._extract_attributes(node, ctx.source_bytes)
-        if attributes:
-            metadata["attributes"] = attributes
-        doc_comment = self._extract_doc_comment(node, ctx.source_bytes)
-        if doc_comment:
-            metadata["doc_comment"] = doc_comment
+        metadata = self._extract_item_metadata(node, ctx.source_bytes)
 
         ctx.add_symbol(
             Symbol(
                 name=name,
                 qualified_name=qualified_name,
-                kind=SymbolKind.TRAIT,
+                kind=_KIND_TRAIT,
                 source_code=source_code,
                 parent_qualified_name=ctx.current_scope,
                 metadata=metadata,
@@ -294,25 +370,20 @@ class RustParser(LanguageParser):
         )
 
         ctx.push_scope(qualified_name)
-        body = node.child_by_field_name("body")
-        if body:
-            for child in body.children:
-                self._process_node(child, ctx)
-        ctx.pop_scope()
+        return _ENTER_SCOPE
 
-    def _process_impl(self, node: Node, ctx: ParseContext) -> None:
+    def _process_impl(self, node: Node, ctx: RustParseContext) -> int:
         """Extract impl block."""
-        source_code = self._get_node_text(node, ctx.source_bytes)
-
         # Get the type being implemented for
-        type_node = node.child_by_field_name("type")
+        type_node = node.child_by_field_id(self._type_field)
         if not type_node:
-            return
+            return _SKIP
 
+        source_code = self._get_node_text(node, ctx.source_bytes)
         type_name = self._get_node_text(type_node, ctx.source_bytes)
 
         # Check if this is a trait implementation
-        trait_node = node.child_by_field_name("trait")
+        trait_node = node.child_by_field_id(self._trait_field)
         if trait_node:
             trait_name = self._get_node_text(trait_node, ctx.source_bytes)
             impl_name = f"impl {trait_name} for {type_name}"
@@ -321,7 +392,7 @@ class RustParser(LanguageParser):
             if ctx.current_scope:
                 qualified_name = f"{ctx.current_scope}::{impl_name}"
             else:
-                qualified_name = self._build_qualified_name(ctx.file_path, impl_name)
+                qualified_name = f"{ctx.dotted_file_path}.{impl_name}"
 
             source_path, source_name = self._split_qualified_name(qualified_name)
             ctx.add_reference(
@@ -330,7 +401,7 @@ class RustParser(LanguageParser):
                     source_symbol_name=source_name,
                     target_file_path=trait_name,
                     target_symbol_name=trait_name,
-                    reference_type=ReferenceType.INHERITANCE,
+                    reference_type=_REF_INHERITANCE,
                 )
             )
         else:
@@ -338,30 +409,27 @@ class RustParser(LanguageParser):
             if ctx.current_scope:
                 qualified_name = f"{ctx.current_scope}::{impl_name}"
             else:
-                qualified_name = self._build_qualified_name(ctx.file_path, impl_name)
+                qualified_name = f"{ctx.dotted_file_path}.{impl_name}"
 
         ctx.add_symbol(
             Symbol(
                 name=impl_name,
                 qualified_name=qualified_name,
-                kind=SymbolKind.IMPL,
+                kind=_KIND_IMPL,
                 source_code=source_code,
                 parent_qualified_name=ctx.current_scope,
+                metadata=_EMPTY_METADATA,
             )
         )
 
         ctx.push_scope(qualified_name)
-        body = node.child_by_field_name("body")
-        if body:
-            for child in body.children:
-                self._process_node(child, ctx)
-        ctx.pop_scope()
+        return _ENTER_SCOPE
 
-    def _process_mod(self, node: Node, ctx: ParseContext) -> None:
+    def _process_mod(self, node: Node, ctx: RustParseContext) -> int:
         """Extract module definition."""
-        name_node = node.child_by_field_name("name")
+        name_node = node.child_by_field_id(self._name_field)
         if not name_node:
-            return
+            return _SKIP
 
         name = self._get_node_text(name_node, ctx.source_bytes)
         source_code = self._get_node_text(node, ctx.source_bytes)
@@ -369,48 +437,44 @@ class RustParser(LanguageParser):
         if ctx.current_scope:
             qualified_name = f"{ctx.current_scope}::{name}"
         else:
-            qualified_name = self._build_qualified_name(ctx.file_path, name)
+            qualified_name = f"{ctx.dotted_file_path}.{name}"
 
         ctx.add_symbol(
             Symbol(
                 name=name,
                 qualified_name=qualified_name,
-                kind=SymbolKind.MODULE,
+                kind=_KIND_MODULE,
                 source_code=source_code,
                 parent_qualified_name=ctx.current_scope,
+                metadata=_EMPTY_METADATA,
             )
         )
 
         ctx.push_scope(qualified_name)
-        body = node.child_by_field_name("body")
-        if body:
-            for child in body.children:
-                self._process_node(child, ctx)
-        ctx.pop_scope()
+        return _ENTER_SCOPE
 
-    def _process_use(self, node: Node, ctx: ParseContext) -> None:
+    def _process_use(self, node: Node, ctx: RustParseContext) -> int:
         """Extract use statement."""
         source_code = self._get_node_text(node, ctx.source_bytes)
 
         # Find the use path
         for child in node.children:
-            if child.type in ("use_as_clause", "scoped_use_list", "use_wildcard", "scoped_identifier"):
+            if child.kind_id in self._use_path_kinds:
                 import_path = self._extract_use_path(child, ctx.source_bytes)
                 if import_path:
-                    qualified_name = self._build_qualified_name(
-                        ctx.file_path, f"use:{import_path}"
-                    )
+                    qualified_name = f"{ctx.dotted_file_path}.use:{import_path}"
 
                     ctx.add_symbol(
                         Symbol(
                             name=import_path.split("::")[-1],
                             qualified_name=qualified_name,
-                            kind=SymbolKind.IMPORT,
+                            kind=_KIND_IMPORT,
                             source_code=source_code,
+                            metadata=_EMPTY_METADATA,
                         )
                     )
 
-                    source_file_path = self._file_path_to_dot_notation(ctx.file_path)
+                    source_file_path = ctx.dotted_file_path
                     # Rust uses :: as separator
                     if "::" in import_path:
                         target_path = "::".join(import_path.split("::")[:-1])
@@ -425,27 +489,25 @@ class RustParser(LanguageParser):
                             source_symbol_name="<file>",
                             target_file_path=target_path,
                             target_symbol_name=target_name,
-                            reference_type=ReferenceType.IMPORT,
+                            reference_type=_REF_IMPORT,
                         )
                     )
+        return _SKIP
 
     def _extract_use_path(self, node: Node, source_bytes: bytes) -> str | None:
         """Extract the path from a use statement."""
         return self._get_node_text(node, source_bytes).replace(" ", "")
 
-    def _process_call(self, node: Node, ctx: ParseContext) -> None:
+    def _process_call(self, node: Node, ctx: RustParseContext) -> int:
         """Extract function call as reference."""
         if not ctx.current_scope:
-            # Still process arguments for nested calls
-            args = node.child_by_field_name("arguments")
-            if args:
-                for child in args.children:
-                    self._process_node(child, ctx)
-            return
-
-        func_node = node.child_by_field_name("function")
+            # No reference can be recorded here, but the arguments may hold
+            # items (e.g. a fn inside a closure passed to Lazy::new)
+            return _ONLY_BODY
+
+        func_node = node.child_by_field_id(self._function_field)
         if not func_node:
-            return
+            return _SKIP
 
         call_name = self._get_node_text(func_node, ctx.source_bytes)
 
@@ -465,22 +527,19 @@ class RustParser(LanguageParser):
                 source_symbol_name=source_name,
                 target_file_path=target_path,
                 target_symbol_name=target_name,
-                reference_type=ReferenceType.CALL,
+                reference_type=_REF_CALL,
             )
         )
 
         # Process arguments for nested calls
-        args = node.child_by_field_name("arguments")
-        if args:
-            for child in args.children:
-                self._process_node(child, ctx)
+        return _ONLY_BODY
 
-    def _process_macro_call(self, node: Node, ctx: ParseContext) -> None:
+    def _process_macro_call(self, node: Node, ctx: RustParseContext) -> int:
         """Extract macro invocation as reference."""
         if not ctx.current_scope:
-            return
+            return _SKIP
 
-        macro_node = node.child_by_field_name("macro")
+        macro_node = node.child_by_field_id(self._macro_field)
         if macro_node:
             macro_name = self._get_node_text(macro_node, ctx.source_bytes)
             source_path, source_name = self._split_qualified_name(ctx.current_scope)
@@ -491,74 +550,88 @@ class RustParser(LanguageParser):
                     source_symbol_name=source_name,
                     target_file_path=macro_name,
                     target_symbol_name=f"{macro_name}!",
-                    reference_type=ReferenceType.CALL,
+                    reference_type=_REF_CALL,
                 )
             )
+        return _SKIP
 
     def _extract_function_signature(self, node: Node, source_bytes: bytes) -> str:
         """Extract function signature."""
-        body = node.child_by_field_name("body")
+        body = node.child_by_field_id(self._body_field)
         if body:
             return source_bytes[node.start_byte : body.start_byte].decode("utf-8").strip()
         return self._get_node_text(node, source_bytes).split("{")[0].strip()
 
-    def _extract_visibility(self, node: Node, source_bytes: bytes) -> str | None:
-        """Extract visibility modifier (pub, pub(crate), etc.)."""
-        for child in node.children:
-            if child.type == "visibility_modifier":
-                return self._get_node_text(child, source_bytes)
-        return None
-    
-    def _extract_attributes(self, node: Node, source_bytes: bytes) -> list[str]:
-        """Extract attributes (e.g., #[derive(...)], #[test])."""
+    def _extract_item_metadata(
+        self,
+        node: Node,
+        source_bytes: bytes,
+        return_type: str | None = None,
+        parameters: list[dict[str, str | None]] | None = None,
+    ) -> dict[str, str | int | bool | list]:
+        """
+        Extract visibility, attributes and doc comment of an item.
+
+        A function's return type and parameters are added after them. Items
+        with none of these share one empty metadata dict.
+        """
+        visibility = None
         attributes: list[str] = []
+
+        # Single pass over the item's children
         for child in node.children:
-            if child.type == "attribute_item":
+            child_kind = child.kind_id
+            if child_kind == self._visibility_modifier_kind:
+                # Visibility modifier (pub, pub(crate), etc.); the first one wins
+                if visibility is None:
+                    visibility = self._get_node_text(child, source_bytes)
+            elif child_kind == self._attribute_item_kind:
+                # Attributes (e.g., #[derive(...)], #[test])
                 attr_text = self._get_node_text(child, source_bytes)
                 if not attr_text.startswith("#"):
                     attr_text = "#" + attr_text
                 attributes.append(attr_text)
-        return attributes
+
+        doc_comment = self._extract_doc_comment(node, source_bytes)
+        if not (visibility or attributes or doc_comment or return_type or parameters):
+            return _EMPTY_METADATA
+
+        metadata: dict[str, str | int | bool | list] = {}
+        if visibility:
+            metadata["visibility"] = visibility
+        if attributes:
+            metadata["attributes"] = attributes
+        if doc_comment:
+            metadata["doc_comment"] = doc_comment
+        if return_type:
+            metadata["return_type"] = return_type
+        if parameters:
+            metadata["parameters"] = parameters
+        return metadata
     
     def _extract_doc_comment(self, node: Node, source_bytes: bytes) -> str | None:
         """Extract doc comment (/// or //!) preceding a node."""
-        parent = node.parent
-        if not parent:
-            return None
-        
-        # Find the node's index in parent's children
-        node_index = -1
-        for i, child in enumerate(parent.children):
-            if child == node:
-                node_index = i
-                break
-        
-        if node_index <= 0:
-            return None
-        
         # Check previous siblings for doc comments
         doc_lines = []
-        for i in range(node_index - 1, -1, -1):
-            prev_sibling = parent.children[i]
-            if prev_sibling.type == "line_comment":
-                comment_text = self._get_node_text(prev_sibling, source_bytes).strip()
-                if comment_text.startswith("///") or comment_text.startswith("//!"):
-                    # Extract doc comment content
-                    line = comment_text.removeprefix("///").removeprefix("//!").strip()
-                    if line:
-                        doc_lines.insert(0, line)
-                else:
-                    # Stop at first non-doc comment
-                    break
+        prev_sibling = node.prev_sibling
+        while prev_sibling is not None and prev_sibling.kind_id == self._line_comment_kind:
+            comment_text = self._get_node_text(prev_sibling, source_bytes).strip()
+            if comment_text.startswith("///") or comment_text.startswith("//!"):
+                # Extract doc comment content
+                line = comment_text.removeprefix("///").removeprefix("//!").strip()
+                if line:
+                    doc_lines.append(line)
             else:
-                # Stop at first non-comment
+                # Stop at first non-doc comment
                 break
+            prev_sibling = prev_sibling.prev_sibling
         
-        return "\n".join(doc_lines) if doc_lines else None
+        # Lines were collected bottom-up
+        return "\n".join(reversed(doc_lines)) if doc_lines else None
     
     def _extract_return_type(self, node: Node, source_bytes: bytes) -> str | None:
         """Extract return type from a function declaration."""
-        return_type_node = node.child_by_field_name("return_type")
+        return_type_node = node.child_by_field_id(self._return_type_field)
         if return_type_node:
             return self._get_node_text(return_type_node, source_bytes)
         return None
@@ -566,22 +639,17 @@ class RustParser(LanguageParser):
     def _extract_parameters(self, node: Node, source_bytes: bytes) -> list[dict[str, str | None]]:
         """Extract parameter information from a function declaration."""
         parameters: list[dict[str, str | None]] = []
-        params_node = node.child_by_field_name("parameters")
+        params_node = node.child_by_field_id(self._parameters_field)
         if not params_node:
             return parameters
         
         for child in params_node.children:
-            if child.type == "parameter":
-                name_node = child.child_by_field_name("pattern")
-                type_node = child.child_by_field_name("type")
+            if child.kind_id == self._parameter_kind:
+                name_node = child.child_by_field_id(self._pattern_field)
+                type_node = child.child_by_field_id(self._type_field)
                 
-                name = None
-                if name_node:
-                    # Pattern can be identifier or more complex
-                    if name_node.type == "identifier":
-                        name = self._get_node_text(name_node, source_bytes)
-                    else:
-                        name = self._get_node_text(name_node, source_bytes)
+                # Pattern can be identifier or more complex; both keep their text
+                name = self._get_node_text(name_node, source_bytes) if name_node else None
                 
                 param_info: dict[str, str | None] = {
                     "name": name,
@@ -593,25 +661,26 @@ class RustParser(LanguageParser):
 
     def _get_node_text(self, node: Node, source_bytes: bytes) -> str:
         """Extract text from node."""
-        return source_bytes[node.start_byte : node.end_byte].decode("utf-8", errors="replace")
+        text = source_bytes[node.start_byte : node.end_byte]
+        # Strict UTF-8 decoding takes CPython's ASCII fast path; the replacing
+        # decoder is only needed for the rare slice that is not valid UTF-8
+        try:
+            return text.decode()
+        except UnicodeDecodeError:
+            return text.decode("utf-8", errors="replace")
 
     def _file_path_to_dot_notation(self, file_path: str) -> str:
         """Convert file path to dot notation."""
-        path = file_path
-        for ext in self.file_extensions:
-            if path.endswith(ext):
-                path = path[:-len(ext)]
-                break
-        return path.replace("/", ".").replace("\\", ".")
+        return _dot_path(file_path, _FILE_EXTENSIONS)
     
     def _split_qualified_name(self, qualified_name: str) -> tuple[str, str]:
         """Split qualified name into (path, name). Handles both . and :: separators."""
         # Rust uses :: as separator
-        if "::" in qualified_name:
-            parts = qualified_name.rsplit("::", 1)
-            return (parts[0], parts[1])
+        sep = qualified_name.rfind("::")
+        if sep >= 0:
+            return (qualified_name[:sep], qualified_name[sep + 2 :])
         # Fall back to . for file paths
-        if "." in qualified_name:
-            parts = qualified_name.rsplit(".", 1)
-            return (parts[0], parts[1])
+        dot = qualified_name.rfind(".")
+        if dot >= 0:
+            return (qualified_name[:dot], qualified_name[dot + 1 :])
         return (qualified_name, qualified_name)
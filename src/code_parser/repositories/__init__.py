@@ -1,7 +1,7 @@
 """Repository layer - data access abstractions."""
 
 from code_parser.repositories.entry_point_repository import EntryPointRepository
-from code_parser.repositories.file_repository import FileRepository
+from code_parser.repositories.file_repository import FileRecord, FileRepository
 from code_parser.repositories.flow_repository import FlowRepository
 from code_parser.repositories.job_repository import JobRepository
 from code_parser.repositories.org_repository import OrgRepository
@@ -10,6 +10,7 @@ from code_parser.repositories.symbol_repository import SymbolRepository
 
 __all__ = [
     "EntryPointRepository",
+    "FileRecord",
     "FileRepository",
     "FlowRepository",
     "JobRepository",
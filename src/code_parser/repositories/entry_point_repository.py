@@ -3,13 +3,31 @@
 from datetime import datetime
 from typing import Sequence
 
-from sqlalchemy import cast, delete, or_, select
+import orjson
+from sqlalchemy import cast, delete, insert, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.types import Text
-from ulid import ULID
 
 from code_parser.core import ConfirmedEntryPoint, EntryPointCandidate, EntryPointType
 from code_parser.database.models import EntryPointCandidateModel, EntryPointModel
+from code_parser.repositories.ids import bulk_ulids
+from code_parser.repositories.request_cache import invalidates_request_cache, request_cached
+from code_parser.repositories.search import is_plain_search, search_condition
+
+# Candidate batches larger than this are loaded with COPY instead of INSERT
+_COPY_THRESHOLD = 5000
+
+_CANDIDATE_COPY_COLUMNS = [
+    "id",
+    "repo_id",
+    "symbol_id",
+    "file_id",
+    "entry_point_type",
+    "framework",
+    "detection_pattern",
+    "metadata",
+    "confidence_score",
+]
 
 
 class EntryPointRepository:
@@ -18,6 +36,7 @@ class EntryPointRepository:
     def __init__(self, session: AsyncSession) -> None:
         self._session = session
 
+    @invalidates_request_cache
     async def bulk_insert_candidates(
         self, repo_id: str, candidates: Sequence[EntryPointCandidate]
     ) -> None:
@@ -28,22 +47,58 @@ class EntryPointRepository:
             repo_id: Repository ID
             candidates: List of entry point candidates to insert
         """
-        for candidate in candidates:
-            model = EntryPointCandidateModel(
-                id=str(ULID()),
-                repo_id=repo_id,
-                symbol_id=candidate.symbol_id,
-                file_id=candidate.file_id,
-                entry_point_type=candidate.entry_point_type.value,
-                framework=candidate.framework,
-                detection_pattern=candidate.detection_pattern,
-                entry_metadata=candidate.metadata,
-                confidence_score=candidate.confidence_score,
-            )
-            self._session.add(model)
+        if not candidates:
+            return
 
-        await self._session.flush()
+        if len(candidates) > _COPY_THRESHOLD:
+            await self._copy_candidates(repo_id, candidates)
+            return
+
+        rows = [
+            {
+                "id": row_id,
+                "repo_id": repo_id,
+                "symbol_id": candidate.symbol_id,
+                "file_id": candidate.file_id,
+                "entry_point_type": candidate.entry_point_type.value,
+                "framework": candidate.framework,
+                "detection_pattern": candidate.detection_pattern,
+                "entry_metadata": candidate.metadata,
+                "confidence_score": candidate.confidence_score,
+            }
+            for row_id, candidate in zip(bulk_ulids(len(candidates)), candidates, strict=True)
+        ]
+        # One executemany; SQLAlchemy batches it into multi-VALUES INSERTs
+        await self._session.execute(insert(EntryPointCandidateModel), rows)
+
+    async def _copy_candidates(
+        self, repo_id: str, candidates: Sequence[EntryPointCandidate]
+    ) -> None:
+        """Load candidates with asyncpg's binary COPY on the session's connection."""
+        connection = await self._session.connection()
+        raw_connection = await connection.get_raw_connection()
+        records = [
+            (
+                row_id,
+                repo_id,
+                candidate.symbol_id,
+                candidate.file_id,
+                candidate.entry_point_type.value,
+                candidate.framework,
+                candidate.detection_pattern,
+                # COPY bypasses the JSONB type, so serialise here
+                orjson.dumps(candidate.metadata, option=orjson.OPT_NON_STR_KEYS).decode(),
+                candidate.confidence_score,
+            )
+            for row_id, candidate in zip(bulk_ulids(len(candidates)), candidates, strict=True)
+        ]
+        await raw_connection.driver_connection.copy_records_to_table(
+            EntryPointCandidateModel.__tablename__,
+            records=records,
+            columns=_CANDIDATE_COPY_COLUMNS,
+        )
 
+    @invalidates_request_cache
     async def bulk_insert_confirmed(
         self, repo_id: str, confirmed: Sequence[ConfirmedEntryPoint]
     ) -> None:
@@ -54,30 +109,53 @@ class EntryPointRepository:
             repo_id: Repository ID
             confirmed: List of confirmed entry points to insert
         """
-        for entry_point in confirmed:
-            model = EntryPointModel(
-                id=str(ULID()),
-                repo_id=repo_id,
-                symbol_id=entry_point.symbol_id,
-                file_id=entry_point.file_id,
-                entry_point_type=entry_point.entry_point_type.value,
-                framework=entry_point.framework,
-                name=entry_point.name,
-                description=entry_point.description,
-                entry_metadata=entry_point.metadata,
-                ai_confidence=entry_point.ai_confidence,
-                ai_reasoning=entry_point.ai_reasoning,
-            )
-            self._session.add(model)
+        if not confirmed:
+            return
 
-        await self._session.flush()
+        rows = [
+            {
+                "id": row_id,
+                "repo_id": repo_id,
+                "symbol_id": entry_point.symbol_id,
+                "file_id": entry_point.file_id,
+                "entry_point_type": entry_point.entry_point_type.value,
+                "framework": entry_point.framework,
+                "name": entry_point.name,
+                "description": entry_point.description,
+                "entry_metadata": entry_point.metadata,
+                "ai_confidence": entry_point.ai_confidence,
+                "ai_reasoning": entry_point.ai_reasoning,
+            }
+            for row_id, entry_point in zip(bulk_ulids(len(confirmed)), confirmed, strict=True)
+        ]
+        await self._session.execute(insert(EntryPointModel), rows)
+
+    async def list_filtered(
+        self,
+        repo_id: str,
+        *,
+        entry_point_type: EntryPointType | None = None,
+        framework: str | None = None,
+        ids: list[str] | None = None,
+    ) -> Sequence[EntryPointModel]:
+        """
+        Get confirmed entry points for a repository matching all given filters.
+
+        Served by the (repo_id, entry_point_type, framework) lookup index.
+        """
+        query = select(EntryPointModel).where(EntryPointModel.repo_id == repo_id)
+        if entry_point_type is not None:
+            query = query.where(EntryPointModel.entry_point_type == entry_point_type.value)
+        if framework is not None:
+            query = query.where(EntryPointModel.framework == framework)
+        if ids is not None:
+            query = query.where(EntryPointModel.id.in_(ids))
+        result = await self._session.execute(query)
+        return result.scalars().all()
 
-    async def get_by_repo(self, repo_id: str) -> list[EntryPointModel]:
+    async def get_by_repo(self, repo_id: str) -> Sequence[EntryPointModel]:
         """Get all confirmed entry points for a repository."""
-        result = await self._session.execute(
-            select(EntryPointModel).where(EntryPointModel.repo_id == repo_id)
-        )
-        return list(result.scalars().all())
+        return await self.list_filtered(repo_id)
 
     def _search_to_like_pattern(self, search: str) -> str:
         """Convert regex/glob-style pattern to SQL LIKE pattern for fallback.
@@ -93,16 +171,27 @@ class EntryPointRepository:
         search: str | None = None,
         limit: int = 100,
         offset: int = 0,
-    ) -> list[EntryPointModel]:
+    ) -> Sequence[EntryPointModel]:
         """
         List entry points for a repo with optional search on name, description, and metadata.
 
-        Uses regex (~*) when possible; falls back to ILIKE if regex is invalid.
+        Plain terms are matched with ILIKE (served by the trigram indexes).
+        Terms with regex metacharacters use regex (~*); falls back to ILIKE
+        if the regex is invalid.
         Metadata (path, method, etc.) is included so path-based searches work.
         """
         query = select(EntryPointModel).where(EntryPointModel.repo_id == repo_id)
 
-        if search and search.strip():
+        if search and search.strip() and is_plain_search(search.strip()):
+            query = query.where(
+                search_condition(
+                    search.strip(),
+                    EntryPointModel.name,
+                    EntryPointModel.description,
+                    cast(EntryPointModel.entry_metadata, Text),
+                )
+            )
+        elif search and search.strip():
             search = search.strip()
             metadata_as_text = cast(EntryPointModel.entry_metadata, Text)
             regex_conditions = or_(
@@ -115,7 +204,7 @@ class EntryPointRepository:
             try:
                 query = query.order_by(EntryPointModel.detected_at.desc()).limit(limit).offset(offset)
                 result = await self._session.execute(query)
-                return list(result.scalars().all())
+                return result.scalars().all()
             except Exception:
                 # Invalid regex (e.g. unescaped special chars) - fallback to ILIKE
                 like_pattern = self._search_to_like_pattern(search)
@@ -129,50 +218,33 @@ class EntryPointRepository:
                     like_conditions,
                 ).order_by(EntryPointModel.detected_at.desc()).limit(limit).offset(offset)
                 result = await self._session.execute(query)
-                return list(result.scalars().all())
+                return result.scalars().all()
 
         query = query.order_by(EntryPointModel.detected_at.desc()).limit(limit).offset(offset)
         result = await self._session.execute(query)
-        return list(result.scalars().all())
+        return result.scalars().all()
 
     async def get_by_ids(
         self, repo_id: str, entry_point_ids: list[str]
-    ) -> list[EntryPointModel]:
+    ) -> Sequence[EntryPointModel]:
         """Get multiple entry points by their IDs."""
         if not entry_point_ids:
             return []
-        result = await self._session.execute(
-            select(EntryPointModel).where(
-                EntryPointModel.repo_id == repo_id,
-                EntryPointModel.id.in_(entry_point_ids),
-            )
-        )
-        return list(result.scalars().all())
+        return await self.list_filtered(repo_id, ids=entry_point_ids)
 
     async def get_by_type(
         self, repo_id: str, entry_point_type: EntryPointType
-    ) -> list[EntryPointModel]:
+    ) -> Sequence[EntryPointModel]:
         """Get entry points by type for a repository."""
-        result = await self._session.execute(
-            select(EntryPointModel).where(
-                EntryPointModel.repo_id == repo_id,
-                EntryPointModel.entry_point_type == entry_point_type.value,
-            )
-        )
-        return list(result.scalars().all())
+        return await self.list_filtered(repo_id, entry_point_type=entry_point_type)
 
     async def get_by_framework(
         self, repo_id: str, framework: str
-    ) -> list[EntryPointModel]:
+    ) -> Sequence[EntryPointModel]:
         """Get entry points by framework for a repository."""
-        result = await self._session.execute(
-            select(EntryPointModel).where(
-                EntryPointModel.repo_id == repo_id,
-                EntryPointModel.framework == framework,
-            )
-        )
-        return list(result.scalars().all())
+        return await self.list_filtered(repo_id, framework=framework)
 
+    @request_cached
     async def get_by_id(
         self, repo_id: str, entry_point_id: str
     ) -> EntryPointModel | None:
@@ -187,15 +259,16 @@ class EntryPointRepository:
 
     async def get_candidates_by_repo(
         self, repo_id: str
-    ) -> list[EntryPointCandidateModel]:
+    ) -> Sequence[EntryPointCandidateModel]:
         """Get all candidates for a repository."""
         result = await self._session.execute(
             select(EntryPointCandidateModel).where(
                 EntryPointCandidateModel.repo_id == repo_id
             )
         )
-        return list(result.scalars().all())
+        return result.scalars().all()
 
+    @invalidates_request_cache
     async def delete_by_repo(self, repo_id: str) -> None:
         """
         Delete all entry points and candidates for a repository.
@@ -1,11 +1,33 @@
 """Repository for managing parsed files."""
 
+from collections.abc import AsyncIterator, Sequence
+from dataclasses import dataclass
+
 from ulid import ULID
-from sqlalchemy import delete, select
+from sqlalchemy import delete, func, null, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import defer
 
 from code_parser.core import Language
 from code_parser.database.models import FileModel
+from code_parser.repositories.ids import bulk_ulids
+from code_parser.repositories.request_cache import invalidates_request_cache, request_cached
+from code_parser.repositories.search import search_condition
+
+# Rows per INSERT statement in upsert_many
+_UPSERT_CHUNK_SIZE = 1000
+
+
+@dataclass(frozen=True, slots=True)
+class FileRecord:
+    """A file row to write with FileRepository.upsert_many."""
+
+    relative_path: str
+    language: Language
+    content_hash: str
+    content: str | None = None
+    folder_structure: dict | None = None
 
 
 class FileRepository:
@@ -14,6 +36,7 @@ class FileRepository:
     def __init__(self, session: AsyncSession) -> None:
         self._session = session
 
+    @invalidates_request_cache
     async def upsert(
         self,
         repo_id: str,
@@ -36,40 +59,80 @@ class FileRepository:
             
         Returns the file ID.
         """
-        # Check if file exists
-        result = await self._session.execute(
-            select(FileModel).where(
-                FileModel.repo_id == repo_id,
-                FileModel.relative_path == relative_path,
-            )
-        )
-        existing = result.scalar_one_or_none()
-
-        if existing:
-            existing.content_hash = content_hash
-            existing.language = language.value
-            if content is not None:
-                existing.content = content
-            if folder_structure is not None:
-                existing.folder_structure = folder_structure
-            await self._session.flush()
-            return existing.id
-
-        # Create new file
-        file_id = str(ULID())
-        model = FileModel(
-            id=file_id,
+        # Single INSERT ... ON CONFLICT against ix_files_repo_path; content and
+        # folder_structure keep their stored values when not supplied.
+        stmt = pg_insert(FileModel).values(
+            id=str(ULID()),
             repo_id=repo_id,
             relative_path=relative_path,
             language=language.value,
             content_hash=content_hash,
             content=content,
-            folder_structure=folder_structure,
+            # null() so an omitted structure is SQL NULL rather than JSON 'null'
+            folder_structure=null() if folder_structure is None else folder_structure,
         )
-        self._session.add(model)
-        await self._session.flush()
-        return file_id
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[FileModel.repo_id, FileModel.relative_path],
+            set_={
+                "content_hash": stmt.excluded.content_hash,
+                "language": stmt.excluded.language,
+                "content": func.coalesce(stmt.excluded.content, FileModel.content),
+                "folder_structure": func.coalesce(
+                    stmt.excluded.folder_structure, FileModel.folder_structure
+                ),
+                "updated_at": func.now(),
+            },
+        ).returning(FileModel.id)
+        result = await self._session.execute(stmt)
+        return result.scalar_one()
+
+    @invalidates_request_cache
+    async def upsert_many(
+        self, repo_id: str, files: Sequence[FileRecord]
+    ) -> dict[str, str]:
+        """
+        Insert or update many file records, same semantics as upsert.
+
+        Issues one INSERT ... ON CONFLICT per chunk of rows instead of one
+        statement per file.
 
+        Returns a mapping of relative_path to file ID.
+        """
+        file_ids: dict[str, str] = {}
+        for start in range(0, len(files), _UPSERT_CHUNK_SIZE):
+            chunk = files[start : start + _UPSERT_CHUNK_SIZE]
+            rows = [
+                {
+                    "id": file_id,
+                    "repo_id": repo_id,
+                    "relative_path": f.relative_path,
+                    "language": f.language.value,
+                    "content_hash": f.content_hash,
+                    "content": f.content,
+                    "folder_structure": (
+                        null() if f.folder_structure is None else f.folder_structure
+                    ),
+                }
+                for file_id, f in zip(bulk_ulids(len(chunk)), chunk, strict=True)
+            ]
+            stmt = pg_insert(FileModel).values(rows)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[FileModel.repo_id, FileModel.relative_path],
+                set_={
+                    "content_hash": stmt.excluded.content_hash,
+                    "language": stmt.excluded.language,
+                    "content": func.coalesce(stmt.excluded.content, FileModel.content),
+                    "folder_structure": func.coalesce(
+                        stmt.excluded.folder_structure, FileModel.folder_structure
+                    ),
+                    "updated_at": func.now(),
+                },
+            ).returning(FileModel.id, FileModel.relative_path)
+            result = await self._session.execute(stmt)
+            file_ids.update((path, file_id) for file_id, path in result)
+        return file_ids
+
+    @request_cached
     async def get_by_id(self, file_id: str) -> FileModel | None:
         """Get file by ID."""
         result = await self._session.execute(
@@ -77,20 +140,20 @@ class FileRepository:
         )
         return result.scalar_one_or_none()
 
+    @request_cached
     async def get_content_hash(self, repo_id: str, relative_path: str) -> str | None:
         """Get the content hash for a file (for incremental parsing)."""
-        result = await self._session.execute(
+        # Index-only scan on ix_files_repo_path (content_hash is INCLUDEd)
+        return await self._session.scalar(
             select(FileModel.content_hash).where(
                 FileModel.repo_id == repo_id,
                 FileModel.relative_path == relative_path,
             )
         )
-        row = result.one_or_none()
-        return row[0] if row else None
 
     async def list_by_repo(
         self, repo_id: str, limit: int = 1000, offset: int = 0
-    ) -> list[FileModel]:
+    ) -> Sequence[FileModel]:
         """List all files in a repository."""
         result = await self._session.execute(
             select(FileModel)
@@ -99,7 +162,25 @@ class FileRepository:
             .limit(limit)
             .offset(offset)
         )
-        return list(result.scalars())
+        return result.scalars().all()
+
+    async def iter_by_repo(
+        self, repo_id: str, batch_size: int = 200
+    ) -> AsyncIterator[FileModel]:
+        """
+        Stream all files in a repository ordered by path.
+
+        Uses a server-side cursor fetching `batch_size` rows at a time, so
+        memory stays bounded regardless of repository size.
+        """
+        result = await self._session.stream_scalars(
+            select(FileModel)
+            .where(FileModel.repo_id == repo_id)
+            .order_by(FileModel.relative_path)
+            .execution_options(yield_per=batch_size)
+        )
+        async for model in result:
+            yield model
 
     async def list_by_repo_with_search(
         self,
@@ -107,19 +188,27 @@ class FileRepository:
         search: str | None = None,
         limit: int = 1000,
         offset: int = 0,
-    ) -> list[FileModel]:
+    ) -> Sequence[FileModel]:
         """
         List files in a repo with optional regex search on relative_path.
+
+        Plain search terms are matched with ILIKE so the trigram index applies.
+        File content is not loaded; use get_by_id for the full row.
         """
-        query = select(FileModel).where(FileModel.repo_id == repo_id)
+        query = (
+            select(FileModel)
+            .options(defer(FileModel.content, raiseload=True))
+            .where(FileModel.repo_id == repo_id)
+        )
 
         if search:
-            query = query.where(FileModel.relative_path.op("~*")(search))
+            query = query.where(search_condition(search, FileModel.relative_path))
 
         query = query.order_by(FileModel.relative_path).limit(limit).offset(offset)
         result = await self._session.execute(query)
-        return list(result.scalars())
+        return result.scalars().all()
 
+    @invalidates_request_cache
     async def delete_by_repo(self, repo_id: str) -> int:
         """Delete all files for a repository. Returns count deleted."""
         result = await self._session.execute(
@@ -1,6 +1,7 @@
 """Repository for managing entry point flow documentation."""
 
-from sqlalchemy import delete, select
+from sqlalchemy import delete, func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from ulid import ULID
 
@@ -29,12 +30,9 @@ class FlowRepository:
         """
         Create or replace flow documentation for an entry point.
         
-        If a flow already exists for this entry point, it will be deleted
-        and replaced with the new one.
+        If a flow already exists for this entry point, its contents are
+        replaced in place (single INSERT ... ON CONFLICT on entry_point_id).
         """
-        # Delete existing flow if it exists
-        await self.delete_by_entry_point_id(flow.entry_point_id)
-
         # Convert core model to database model
         steps_json = [
             {
@@ -57,7 +55,7 @@ class FlowRepository:
             for step in flow.steps
         ]
 
-        model = EntryPointFlowModel(
+        stmt = pg_insert(EntryPointFlowModel).values(
             id=str(ULID()),
             entry_point_id=flow.entry_point_id,
             repo_id=flow.repo_id,
@@ -69,8 +67,22 @@ class FlowRepository:
             iterations_completed=flow.iterations_completed,
             symbol_ids_analyzed=flow.symbol_ids_analyzed,
         )
-        self._session.add(model)
-        await self._session.flush()
+        excluded = stmt.excluded
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[EntryPointFlowModel.entry_point_id],
+            set_={
+                "repo_id": excluded.repo_id,
+                "flow_name": excluded.flow_name,
+                "technical_summary": excluded.technical_summary,
+                "file_paths": excluded.file_paths,
+                "steps": excluded.steps,
+                "max_depth_analyzed": excluded.max_depth_analyzed,
+                "iterations_completed": excluded.iterations_completed,
+                "symbol_ids_analyzed": excluded.symbol_ids_analyzed,
+                "updated_at": func.now(),
+            },
+        )
+        await self._session.execute(stmt)
 
     async def delete_by_entry_point_id(self, entry_point_id: str) -> None:
         """Delete flow documentation for an entry point."""
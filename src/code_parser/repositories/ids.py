@@ -0,0 +1,27 @@
+"""ULID generation helpers for bulk inserts."""
+
+import base64
+import os
+
+from ulid import ULID
+
+# RFC 4648 base32 alphabet -> Crockford base32 alphabet used by ULIDs
+_CROCKFORD = bytes.maketrans(
+    b"ABCDEFGHIJKLMNOPQRSTUVWXYZ234567",
+    b"0123456789ABCDEFGHJKMNPQRSTVWXYZ",
+)
+
+
+def bulk_ulids(count: int) -> list[str]:
+    """
+    Generate `count` ULID strings sharing the current millisecond timestamp.
+
+    Draws all randomness with a single os.urandom call and encodes it in one
+    pass: 10 random bytes are exactly 16 base32 characters, so the encoded
+    block splits cleanly into per-ID tails.
+    """
+    if count <= 0:
+        return []
+    prefix = str(ULID())[:10]
+    tails = base64.b32encode(os.urandom(10 * count)).translate(_CROCKFORD).decode()
+    return [prefix + tails[i : i + 16] for i in range(0, 16 * count, 16)]
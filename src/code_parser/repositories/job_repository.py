@@ -1,15 +1,17 @@
 """Repository for managing parsing jobs (PostgreSQL-based queue)."""
 
-from datetime import datetime
-
 from ulid import ULID
-from sqlalchemy import text, select, update
+from sqlalchemy import func, text, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from code_parser.core import ParsingJob, RepositoryStatus
 from code_parser.database.models import ParsingJobModel
 
 
+# Status column value -> enum member (avoids Enum.__call__ per row)
+_STATUS_BY_VALUE = {status.value: status for status in RepositoryStatus}
+
+
 class JobRepository:
     """
     Data access layer for the parsing job queue.
@@ -67,7 +69,7 @@ class JobRepository:
         return ParsingJob(
             id=row.id,
             repo_id=row.repo_id,
-            status=RepositoryStatus(row.status),
+            status=_STATUS_BY_VALUE[row.status],
             created_at=row.created_at,
             started_at=row.started_at,
             completed_at=row.completed_at,
@@ -82,7 +84,7 @@ class JobRepository:
             .where(ParsingJobModel.id == job_id)
             .values(
                 status=RepositoryStatus.COMPLETED.value,
-                completed_at=datetime.utcnow(),
+                completed_at=func.now(),
             )
         )
 
@@ -93,7 +95,7 @@ class JobRepository:
             .where(ParsingJobModel.id == job_id)
             .values(
                 status=RepositoryStatus.FAILED.value,
-                completed_at=datetime.utcnow(),
+                completed_at=func.now(),
                 error_message=error_message,
             )
         )
@@ -106,26 +108,27 @@ class JobRepository:
         model = result.scalar_one_or_none()
         return self._to_domain(model) if model else None
 
-    async def get_pending_count(self) -> int:
-        """Get count of pending jobs."""
-        result = await self._session.execute(
-            text("SELECT COUNT(*) FROM parsing_jobs WHERE status = 'pending'")
-        )
-        return result.scalar() or 0
+    async def get_status_counts(self) -> dict[str, int]:
+        """
+        Get pending and running job counts in one query.
 
-    async def get_running_count(self) -> int:
-        """Get count of running jobs."""
+        Statuses with no jobs are omitted; index with .get(status, 0).
+        """
         result = await self._session.execute(
-            text("SELECT COUNT(*) FROM parsing_jobs WHERE status = 'parsing'")
+            text("""
+                SELECT status, COUNT(*) AS n FROM parsing_jobs
+                WHERE status IN ('pending', 'parsing')
+                GROUP BY status
+            """)
         )
-        return result.scalar() or 0
+        return {row.status: row.n for row in result}
 
     def _to_domain(self, model: ParsingJobModel) -> ParsingJob:
         """Convert ORM model to domain entity."""
         return ParsingJob(
             id=model.id,
             repo_id=model.repo_id,
-            status=RepositoryStatus(model.status),
+            status=_STATUS_BY_VALUE[model.status],
             created_at=model.created_at,
             started_at=model.started_at,
             completed_at=model.completed_at,
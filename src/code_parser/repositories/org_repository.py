@@ -1,11 +1,12 @@
 """Repository for managing organizations."""
 
 from ulid import ULID
-from sqlalchemy import select
+from sqlalchemy import delete, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from code_parser.core import Organization
 from code_parser.database.models import OrganizationModel
+from code_parser.repositories.request_cache import invalidates_request_cache, request_cached
 
 
 class OrgRepository:
@@ -14,6 +15,7 @@ class OrgRepository:
     def __init__(self, session: AsyncSession) -> None:
         self._session = session
 
+    @invalidates_request_cache
     async def create(self, name: str, description: str | None = None) -> Organization:
         """Create a new organization."""
         org_id = str(ULID())
@@ -27,6 +29,7 @@ class OrgRepository:
         await self._session.refresh(model)
         return self._to_domain(model)
 
+    @request_cached
     async def get_by_id(self, org_id: str) -> Organization | None:
         """Get organization by ID."""
         result = await self._session.execute(
@@ -35,6 +38,7 @@ class OrgRepository:
         model = result.scalar_one_or_none()
         return self._to_domain(model) if model else None
 
+    @request_cached
     async def get_by_name(self, name: str) -> Organization | None:
         """Get organization by name."""
         result = await self._session.execute(
@@ -55,17 +59,16 @@ class OrgRepository:
         )
         return [self._to_domain(model) for model in result.scalars()]
 
+    @invalidates_request_cache
     async def delete(self, org_id: str) -> bool:
         """Delete an organization and all associated data (cascades)."""
+        # Child rows are removed by the ON DELETE CASCADE foreign keys
         result = await self._session.execute(
-            select(OrganizationModel).where(OrganizationModel.id == org_id)
+            delete(OrganizationModel).where(OrganizationModel.id == org_id).returning(OrganizationModel.id)
         )
-        model = result.scalar_one_or_none()
-        if model:
-            await self._session.delete(model)
-            return True
-        return False
+        return result.scalar_one_or_none() is not None
 
+    @invalidates_request_cache
     async def update_ai_config(
         self, org_id: str, config: dict
     ) -> Organization | None:
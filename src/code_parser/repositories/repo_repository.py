@@ -1,11 +1,35 @@
 """Repository for managing code repositories."""
 
+from typing import Any
+
 from ulid import ULID
-from sqlalchemy import or_, select, update
+from sqlalchemy import Result, delete, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from code_parser.core import Repository, RepositoryStatus
 from code_parser.database.models import RepositoryModel
+from code_parser.repositories.request_cache import invalidates_request_cache, request_cached
+from code_parser.repositories.search import search_condition
+
+
+# Plain dict lookup is much cheaper than the Enum constructor per row
+_STATUS_BY_VALUE = {status.value: status for status in RepositoryStatus}
+
+# Columns loaded by list queries; repo_tree is only added where callers use it
+_LIST_COLUMNS = (
+    RepositoryModel.id,
+    RepositoryModel.name,
+    RepositoryModel.root_path,
+    RepositoryModel.status,
+    RepositoryModel.org_id,
+    RepositoryModel.description,
+    RepositoryModel.total_files,
+    RepositoryModel.parsed_files,
+    RepositoryModel.created_at,
+    RepositoryModel.updated_at,
+    RepositoryModel.error_message,
+    RepositoryModel.languages,
+)
 
 
 class RepoRepository:
@@ -14,6 +38,7 @@ class RepoRepository:
     def __init__(self, session: AsyncSession) -> None:
         self._session = session
 
+    @invalidates_request_cache
     async def create(self, name: str, root_path: str, org_id: str) -> Repository:
         """Create a new repository record."""
         repo_id = str(ULID())
@@ -29,6 +54,7 @@ class RepoRepository:
 
         return self._to_domain(model)
 
+    @request_cached
     async def get_by_id(self, repo_id: str) -> Repository | None:
         """Get repository by ID."""
         result = await self._session.execute(
@@ -37,6 +63,7 @@ class RepoRepository:
         model = result.scalar_one_or_none()
         return self._to_domain(model) if model else None
 
+    @request_cached
     async def get_by_id_and_org(self, repo_id: str, org_id: str) -> Repository | None:
         """Get repository by ID scoped to an organization."""
         result = await self._session.execute(
@@ -48,6 +75,7 @@ class RepoRepository:
         model = result.scalar_one_or_none()
         return self._to_domain(model) if model else None
 
+    @request_cached
     async def get_by_path(self, root_path: str, org_id: str | None = None) -> Repository | None:
         """Get repository by root path, optionally scoped to an org."""
         query = select(RepositoryModel).where(RepositoryModel.root_path == root_path)
@@ -62,12 +90,12 @@ class RepoRepository:
     ) -> list[Repository]:
         """List all repositories with pagination."""
         result = await self._session.execute(
-            select(RepositoryModel)
+            select(*_LIST_COLUMNS, RepositoryModel.repo_tree)
             .order_by(RepositoryModel.created_at.desc())
             .limit(limit)
             .offset(offset)
         )
-        return [self._to_domain(model) for model in result.scalars()]
+        return self._rows_to_domain(result)
 
     async def list_by_org(
         self,
@@ -78,6 +106,8 @@ class RepoRepository:
     ) -> list[Repository]:
         """
         List repositories for an organization with optional regex search.
+
+        The repo_tree column is not loaded (left None); use get_by_id for it.
         
         Args:
             org_id: Organization ID
@@ -85,23 +115,33 @@ class RepoRepository:
             limit: Maximum results
             offset: Pagination offset
         """
-        query = (
-            select(RepositoryModel)
-            .where(RepositoryModel.org_id == org_id)
-        )
+        query = select(*_LIST_COLUMNS).where(RepositoryModel.org_id == org_id)
 
         if search:
-            # Use PostgreSQL ~ operator for regex matching on name and description
+            # ILIKE for plain terms, ~* regex otherwise
             query = query.where(
-                or_(
-                    RepositoryModel.name.op("~*")(search),
-                    RepositoryModel.description.op("~*")(search),
-                )
+                search_condition(search, RepositoryModel.name, RepositoryModel.description)
             )
 
         query = query.order_by(RepositoryModel.created_at.desc()).limit(limit).offset(offset)
         result = await self._session.execute(query)
-        return [self._to_domain(model) for model in result.scalars()]
+        return self._rows_to_domain(result)
+
+    @invalidates_request_cache
+    async def update_fields(self, repo_id: str, **changes: Any) -> None:
+        """
+        Update several repository columns in a single UPDATE.
+
+        Keys are RepositoryModel attribute names, e.g.
+        update_fields(repo_id, status="completed", languages=["python"]).
+        """
+        if not changes:
+            return
+        await self._session.execute(
+            update(RepositoryModel)
+            .where(RepositoryModel.id == repo_id)
+            .values(**changes)
+        )
 
     async def update_status(
         self,
@@ -113,57 +153,50 @@ class RepoRepository:
         values: dict = {"status": status.value}
         if error_message is not None:
             values["error_message"] = error_message
-
-        await self._session.execute(
-            update(RepositoryModel)
-            .where(RepositoryModel.id == repo_id)
-            .values(**values)
-        )
+        await self.update_fields(repo_id, **values)
 
     async def update_progress(
         self, repo_id: str, total_files: int, parsed_files: int
     ) -> None:
         """Update parsing progress counters."""
-        await self._session.execute(
-            update(RepositoryModel)
-            .where(RepositoryModel.id == repo_id)
-            .values(total_files=total_files, parsed_files=parsed_files)
-        )
+        await self.update_fields(repo_id, total_files=total_files, parsed_files=parsed_files)
 
     async def update_repo_tree(self, repo_id: str, repo_tree: dict) -> None:
         """Update the repository tree structure."""
-        await self._session.execute(
-            update(RepositoryModel)
-            .where(RepositoryModel.id == repo_id)
-            .values(repo_tree=repo_tree)
-        )
+        await self.update_fields(repo_id, repo_tree=repo_tree)
 
     async def update_languages(self, repo_id: str, languages: list[str]) -> None:
         """Update the detected languages for the repository."""
-        await self._session.execute(
-            update(RepositoryModel)
-            .where(RepositoryModel.id == repo_id)
-            .values(languages=languages)
-        )
+        await self.update_fields(repo_id, languages=languages)
 
     async def update_description(self, repo_id: str, description: str) -> None:
         """Update the repository description."""
-        await self._session.execute(
-            update(RepositoryModel)
-            .where(RepositoryModel.id == repo_id)
-            .values(description=description)
-        )
+        await self.update_fields(repo_id, description=description)
 
+    @invalidates_request_cache
     async def delete(self, repo_id: str) -> bool:
         """Delete a repository and all associated data (cascades)."""
+        # Child rows are removed by the ON DELETE CASCADE foreign keys
         result = await self._session.execute(
-            select(RepositoryModel).where(RepositoryModel.id == repo_id)
+            delete(RepositoryModel).where(RepositoryModel.id == repo_id).returning(RepositoryModel.id)
         )
-        model = result.scalar_one_or_none()
-        if model:
-            await self._session.delete(model)
-            return True
-        return False
+        return result.scalar_one_or_none() is not None
+
+    def _rows_to_domain(self, result: Result) -> list[Repository]:
+        """
+        Convert column-selected rows to domain entities.
+
+        Used by list queries, which select plain columns (keys match the
+        Repository fields) instead of ORM entities to skip identity-map and
+        instrumentation overhead per row.
+        """
+        repos = []
+        for row in result.mappings():
+            values = dict(row)
+            values["status"] = _STATUS_BY_VALUE[values["status"]]
+            values["languages"] = values["languages"] or []
+            repos.append(Repository(**values))
+        return repos
 
     def _to_domain(self, model: RepositoryModel) -> Repository:
         """Convert ORM model to domain entity."""
@@ -171,7 +204,7 @@ class RepoRepository:
             id=model.id,
             name=model.name,
             root_path=model.root_path,
-            status=RepositoryStatus(model.status),
+            status=_STATUS_BY_VALUE[model.status],
             org_id=model.org_id,
             description=model.description,
             total_files=model.total_files,
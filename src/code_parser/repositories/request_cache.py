@@ -0,0 +1,67 @@
+"""Request-scoped cache for repeated repository reads.
+
+API requests often look up the same org or repository several times
+(verification, business logic, serialisation). Inside a
+request_cache_scope(), methods decorated with @request_cached return the
+result of the first identical call on the same session instead of
+querying again. Methods decorated with @invalidates_request_cache clear
+the cache, so reads after a write in the same request see fresh data.
+
+Outside a scope (workers, scripts) both decorators are pass-throughs.
+"""
+
+from collections.abc import Awaitable, Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+from typing import Any
+
+_cache: ContextVar[dict[tuple, Any] | None] = ContextVar("request_cache", default=None)
+
+
+@contextmanager
+def request_cache_scope() -> Iterator[None]:
+    """Enable the repository read cache for the enclosed request."""
+    token = _cache.set({})
+    try:
+        yield
+    finally:
+        _cache.reset(token)
+
+
+def request_cached[T](
+    fn: Callable[..., Awaitable[T]],
+) -> Callable[..., Awaitable[T]]:
+    """Cache a read-only repository method for the current request scope."""
+    qualname = fn.__qualname__
+
+    @wraps(fn)
+    async def wrapper(self: Any, *args: Any, **kwargs: Any) -> T:
+        cache = _cache.get()
+        if cache is None:
+            return await fn(self, *args, **kwargs)
+        key = (qualname, self._session, args, tuple(sorted(kwargs.items())))
+        if key in cache:
+            return cache[key]
+        result = await fn(self, *args, **kwargs)
+        cache[key] = result
+        return result
+
+    return wrapper
+
+
+def invalidates_request_cache[T](
+    fn: Callable[..., Awaitable[T]],
+) -> Callable[..., Awaitable[T]]:
+    """Clear the current request's read cache after a write method runs."""
+
+    @wraps(fn)
+    async def wrapper(*args: Any, **kwargs: Any) -> T:
+        try:
+            return await fn(*args, **kwargs)
+        finally:
+            cache = _cache.get()
+            if cache:
+                cache.clear()
+
+    return wrapper
@@ -0,0 +1,34 @@
+"""Shared search predicates for list endpoints."""
+
+import re
+
+from sqlalchemy import ColumnElement, or_
+
+# Characters that make a search term a regex rather than a plain substring
+_REGEX_METACHARS = re.compile(r"[.^$*+?{}\[\]\\|()]")
+
+
+def is_plain_search(search: str) -> bool:
+    """True if the search term has no regex metacharacters."""
+    return _REGEX_METACHARS.search(search) is None
+
+
+def substring_pattern(search: str) -> str:
+    """ILIKE pattern matching `search` literally anywhere in the value."""
+    escaped = search.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
+
+def search_condition(search: str, *columns: ColumnElement) -> ColumnElement[bool]:
+    """
+    Case-insensitive match of `search` against any of `columns`.
+
+    Plain terms use ILIKE, which can be served by the pg_trgm GIN indexes;
+    anything with regex metacharacters keeps the ~* regex semantics.
+    """
+    if is_plain_search(search):
+        pattern = substring_pattern(search)
+        conditions = [column.ilike(pattern) for column in columns]
+    else:
+        conditions = [column.op("~*")(search) for column in columns]
+    return conditions[0] if len(conditions) == 1 else or_(*conditions)
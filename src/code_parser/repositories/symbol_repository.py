@@ -1,11 +1,14 @@
 """Repository for managing symbols and references (call graph)."""
 
-from ulid import ULID
-from sqlalchemy import delete, select, text
+from sqlalchemy import delete, insert, select, text
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from code_parser.core import ParsedFile, Reference, ReferenceType, Symbol, SymbolKind
 from code_parser.database.models import ReferenceModel, SymbolModel
+from code_parser.logging import get_logger
+from code_parser.repositories.ids import bulk_ulids
+
+logger = get_logger(__name__)
 
 
 class SymbolRepository:
@@ -33,13 +36,14 @@ class SymbolRepository:
 
         # Map qualified names to symbol IDs for reference resolution
         qualified_name_to_id: dict[str, str] = {}
+        symbol_rows: list[dict] = []
 
         # Insert symbols with validation
-        for symbol in parsed_file.symbols:
+        for symbol, symbol_id in zip(
+            parsed_file.symbols, bulk_ulids(len(parsed_file.symbols)), strict=True
+        ):
             # Validate symbol before insertion
             if not symbol.name or not symbol.qualified_name:
-                from code_parser.logging import get_logger
-                logger = get_logger(__name__)
                 logger.warning(
                     "skipping_invalid_symbol",
                     file_id=file_id,
@@ -48,7 +52,6 @@ class SymbolRepository:
                 )
                 continue
             
-            symbol_id = str(ULID())
             qualified_name_to_id[symbol.qualified_name] = symbol_id
 
             # Find parent symbol ID
@@ -56,66 +59,74 @@ class SymbolRepository:
             if symbol.parent_qualified_name:
                 parent_id = qualified_name_to_id.get(symbol.parent_qualified_name)
 
-            model = SymbolModel(
-                id=symbol_id,
-                file_id=file_id,
-                repo_id=repo_id,
-                name=symbol.name,
-                qualified_name=symbol.qualified_name,
-                kind=symbol.kind.value,
-                source_code=symbol.source_code,
-                signature=symbol.signature,
-                parent_symbol_id=parent_id,
-                extra_data=dict(symbol.metadata),
-                start_line=symbol.start_line,
-                end_line=symbol.end_line,
-                start_column=symbol.start_column,
-                end_column=symbol.end_column,
-            )
-            self._session.add(model)
-
-        await self._session.flush()
+            symbol_rows.append({
+                "id": symbol_id,
+                "file_id": file_id,
+                "repo_id": repo_id,
+                "name": symbol.name,
+                "qualified_name": symbol.qualified_name,
+                "kind": symbol.kind.value,
+                "source_code": symbol.source_code,
+                "signature": symbol.signature,
+                "parent_symbol_id": parent_id,
+                "extra_data": dict(symbol.metadata),
+                "start_line": symbol.start_line,
+                "end_line": symbol.end_line,
+                "start_column": symbol.start_column,
+                "end_column": symbol.end_column,
+            })
+
+        # Parents always precede their children, so one executemany
+        # satisfies the parent_symbol_id foreign key
+        if symbol_rows:
+            await self._session.execute(insert(SymbolModel), symbol_rows)
 
         # Insert references
-        for ref in parsed_file.references:
-            # Get normalized values using helper methods
-            source_path = ref.get_source_path()
-            source_name = ref.get_source_name()
-            target_path = ref.get_target_path()
-            target_name = ref.get_target_name()
-            
-            # Find source symbol by building its qualified name
-            source_qualified = f"{source_path}.{source_name}"
-            source_id = qualified_name_to_id.get(source_qualified)
-            if not source_id:
-                # Try with legacy qualified name if available
-                if ref.source_qualified_name:
-                    source_id = qualified_name_to_id.get(ref.source_qualified_name)
-            if not source_id:
-                # Try just the path (for file-level imports)
-                source_id = qualified_name_to_id.get(source_path)
-            if not source_id:
+        ref_rows: list[dict] = []
+        # Bound once: the normalising getters are called for every reference
+        get_source_path = Reference.get_source_path
+        get_source_name = Reference.get_source_name
+        get_target_path = Reference.get_target_path
+        get_target_name = Reference.get_target_name
+        for ref, ref_id in zip(
+            parsed_file.references, bulk_ulids(len(parsed_file.references)), strict=True
+        ):
+            source_path = get_source_path(ref)
+            source_name = get_source_name(ref)
+
+            # Find source symbol: built qualified name, then the legacy
+            # qualified name, then just the path (file-level imports)
+            for key in (
+                f"{source_path}.{source_name}",
+                ref.source_qualified_name,
+                source_path,
+            ):
+                if key and (source_id := qualified_name_to_id.get(key)):
+                    break
+            else:
                 # Source symbol not found in this file, skip
                 continue
 
             # Try to resolve target within the same repo
+            target_path = get_target_path(ref)
+            target_name = get_target_name(ref)
             target_qualified = f"{target_path}.{target_name}"
             target_id = qualified_name_to_id.get(target_qualified)
 
-            ref_model = ReferenceModel(
-                id=str(ULID()),
-                repo_id=repo_id,
-                source_symbol_id=source_id,
-                target_symbol_id=target_id,
-                source_file_path=source_path,
-                source_symbol_name=source_name,
-                target_file_path=target_path,
-                target_symbol_name=target_name,
-                reference_type=ref.reference_type.value,
-            )
-            self._session.add(ref_model)
-
-        await self._session.flush()
+            ref_rows.append({
+                "id": ref_id,
+                "repo_id": repo_id,
+                "source_symbol_id": source_id,
+                "target_symbol_id": target_id,
+                "source_file_path": source_path,
+                "source_symbol_name": source_name,
+                "target_file_path": target_path,
+                "target_symbol_name": target_name,
+                "reference_type": ref.reference_type.value,
+            })
+
+        if ref_rows:
+            await self._session.execute(insert(ReferenceModel), ref_rows)
 
     async def resolve_cross_file_references(self, repo_id: str) -> int:
         """
@@ -127,28 +138,27 @@ class SymbolRepository:
         # Match symbols by name where file path matches
         # target_file_path: "com.toasttab.service.MyClass" 
         # -> matches file: "...kotlin/com/toasttab/service/MyClass.kt"
+        # The symbols/files join runs once in the subquery, driven by the
+        # (repo_id, name) symbol index. DISTINCT ON keeps one candidate per
+        # reference (lowest symbol id) so repeated runs resolve identically.
         result = await self._session.execute(
             text("""
                 UPDATE "references" r
-                SET target_symbol_id = (
-                    SELECT s.id 
-                    FROM symbols s
-                    JOIN files f ON s.file_id = f.id
-                    WHERE s.repo_id = :repo_id
-                      AND s.name = r.target_symbol_name
-                      AND f.relative_path LIKE '%' || replace(r.target_file_path, '.', '/') || '%'
-                    LIMIT 1
-                )
-                WHERE r.repo_id = :repo_id
-                  AND r.target_symbol_id IS NULL
-                  AND EXISTS (
-                      SELECT 1 
-                      FROM symbols s
-                      JOIN files f ON s.file_id = f.id
-                      WHERE s.repo_id = :repo_id
-                        AND s.name = r.target_symbol_name
-                        AND f.relative_path LIKE '%' || replace(r.target_file_path, '.', '/') || '%'
-                  )
+                SET target_symbol_id = sub.sid
+                FROM (
+                    SELECT DISTINCT ON (r2.id) r2.id AS rid, s.id AS sid
+                    FROM "references" r2
+                    JOIN symbols s
+                      ON s.repo_id = :repo_id
+                     AND s.name = r2.target_symbol_name
+                    JOIN files f
+                      ON s.file_id = f.id
+                     AND f.relative_path LIKE '%' || replace(r2.target_file_path, '.', '/') || '%'
+                    WHERE r2.repo_id = :repo_id
+                      AND r2.target_symbol_id IS NULL
+                    ORDER BY r2.id, s.id
+                ) sub
+                WHERE r.id = sub.rid
             """),
             {"repo_id": repo_id},
         )
@@ -234,8 +244,40 @@ class SymbolRepository:
         For external references, includes target_file_path and target_symbol_name
         for direct use with get_symbol_details API.
         """
-        result = await self._session.execute(
-            text("""
+        if max_depth <= 2:
+            # Shallow traversals (the usual UI request) avoid the recursive
+            # CTE: level 2 is a plain IN over the level-1 targets
+            downstream = """
+                SELECT
+                    r.target_symbol_id as symbol_id,
+                    r.target_file_path,
+                    r.target_symbol_name,
+                    r.reference_type,
+                    1 as depth
+                FROM "references" r
+                WHERE r.source_symbol_id = :symbol_id
+            """
+            if max_depth == 2:
+                downstream += """
+                    UNION ALL
+
+                    SELECT
+                        r.target_symbol_id,
+                        r.target_file_path,
+                        r.target_symbol_name,
+                        r.reference_type,
+                        2
+                    FROM "references" r
+                    WHERE r.source_symbol_id IN (
+                        SELECT target_symbol_id
+                        FROM "references"
+                        WHERE source_symbol_id = :symbol_id
+                          AND target_symbol_id IS NOT NULL
+                    )
+                """
+            cte = f"WITH downstream AS ({downstream})"
+        else:
+            cte = """
                 WITH RECURSIVE downstream AS (
                     SELECT 
                         r.target_symbol_id as symbol_id,
@@ -259,6 +301,10 @@ class SymbolRepository:
                     WHERE d.depth < :max_depth
                       AND d.symbol_id IS NOT NULL
                 )
+            """
+
+        result = await self._session.execute(
+            text(cte + """
                 SELECT DISTINCT
                     s.id,
                     s.name,
@@ -304,8 +350,34 @@ class SymbolRepository:
         Returns symbols that call the given symbol,
         traversing the call graph up to max_depth levels.
         """
-        result = await self._session.execute(
-            text("""
+        if max_depth <= 2:
+            # Same shallow specialisation as get_downstream
+            upstream = """
+                SELECT
+                    r.source_symbol_id as symbol_id,
+                    r.reference_type,
+                    1 as depth
+                FROM "references" r
+                WHERE r.target_symbol_id = :symbol_id
+            """
+            if max_depth == 2:
+                upstream += """
+                    UNION ALL
+
+                    SELECT
+                        r.source_symbol_id,
+                        r.reference_type,
+                        2
+                    FROM "references" r
+                    WHERE r.target_symbol_id IN (
+                        SELECT source_symbol_id
+                        FROM "references"
+                        WHERE target_symbol_id = :symbol_id
+                    )
+                """
+            cte = f"WITH upstream AS ({upstream})"
+        else:
+            cte = """
                 WITH RECURSIVE upstream AS (
                     SELECT 
                         r.source_symbol_id as symbol_id,
@@ -324,6 +396,10 @@ class SymbolRepository:
                     JOIN upstream u ON r.target_symbol_id = u.symbol_id
                     WHERE u.depth < :max_depth
                 )
+            """
+
+        result = await self._session.execute(
+            text(cte + """
                 SELECT DISTINCT
                     s.id,
                     s.name,
@@ -77,9 +77,7 @@ class EntryPointService:
             await self._entry_point_repo.delete_by_repo(repo_id)
             await self._session.commit()
 
-        # Get all files for repository
-        files = await self._file_repo.list_by_repo(repo_id, limit=10000)
-        logger.info("entry_point_detection_started", repo_id=repo_id, file_count=len(files))
+        logger.info("entry_point_detection_started", repo_id=repo_id)
 
         # STEP 1: AI analyzes repo structure and suggests potential file paths
         ai_suggested_file_paths = await self._step2_ai_file_path_detection(
@@ -92,11 +90,14 @@ class EntryPointService:
             ai_suggested_paths=len(ai_suggested_file_paths),
         )
 
-        # Build file map from AI-suggested paths
-        files_to_analyze = {
-            f.relative_path: f for f in files 
-            if f.relative_path in ai_suggested_file_paths
-        }
+        # Build file map from AI-suggested paths, streaming the repo's files
+        # so only the selected ones are kept in memory
+        files_to_analyze = {}
+        file_count = 0
+        async for f in self._file_repo.iter_by_repo(repo_id):
+            file_count += 1
+            if f.relative_path in ai_suggested_file_paths:
+                files_to_analyze[f.relative_path] = f
         
         # Cap at reasonable limit to avoid excessive AI calls
         MAX_FILES_FOR_AI = 60
@@ -113,6 +114,7 @@ class EntryPointService:
         logger.info(
             "files_selected_for_analysis",
             repo_id=repo_id,
+            file_count=file_count,
             ai_suggested_paths=len(ai_suggested_file_paths),
             files_to_analyze=len(files_to_analyze),
         )
@@ -1,63 +1,32 @@
 """Parsing orchestration service."""
 
 import asyncio
-from concurrent.futures import ProcessPoolExecutor
-from functools import partial
+from pathlib import Path
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from code_parser.config import get_settings
 from code_parser.core import ParsedFile, RepositoryStatus
 from code_parser.logging import get_logger
-from code_parser.parsers import get_parser_registry
-from code_parser.repositories import FileRepository, RepoRepository, SymbolRepository
+from code_parser.parsers import parse_files
+from code_parser.parsers.kotlin_parser import prune_parse_cache
+from code_parser.repositories import (
+    FileRecord,
+    FileRepository,
+    RepoRepository,
+    SymbolRepository,
+)
 from code_parser.services.file_discovery import (
     DiscoveredFile,
     build_folder_structure,
     build_repo_tree,
     discover_files,
-    read_file_content,
     validate_repo_tree,
 )
 
 logger = get_logger(__name__)
 
 
-def _parse_file_in_process(
-    file_path: str,
-    relative_path: str,
-) -> ParsedFile | None:
-    """
-    Parse a single file (runs in separate process).
-    
-    This function is designed to be called via ProcessPoolExecutor
-    for CPU-bound parsing work.
-    """
-    try:
-        registry = get_parser_registry()
-        parser = registry.get_parser_for_file(relative_path)
-
-        if not parser:
-            return None
-
-        content, content_hash = read_file_content(file_path)
-        return parser.parse(content, relative_path, content_hash)
-
-    except Exception as e:
-        # Return a ParsedFile with error
-        from code_parser.core import Language, ParsedFile
-
-        lang = Language.from_extension(relative_path.rsplit(".", 1)[-1]) or Language.PYTHON
-        return ParsedFile(
-            relative_path=relative_path,
-            language=lang,
-            content_hash="",
-            symbols=(),
-            references=(),
-            errors=(str(e),),
-        )
-
-
 class ParsingService:
     """
     Orchestrates the parsing of entire repositories.
@@ -73,6 +42,12 @@ class ParsingService:
         self._session = session
         self._settings = get_settings()
         self._max_workers = max_workers or self._settings.worker_count
+        # Resolved once so worker processes share one absolute cache location
+        self._parse_cache_dir = (
+            Path(self._settings.parse_cache_dir).resolve()
+            if self._settings.parse_cache_dir
+            else None
+        )
         self._repo_repository = RepoRepository(session)
         self._file_repository = FileRepository(session)
         self._symbol_repository = SymbolRepository(session)
@@ -107,17 +82,24 @@ class ParsingService:
                 logger.warning("invalid_repo_tree", repo_id=repo_id, tree_type=type(repo_tree).__name__)
                 repo_tree = {}
             
-            await self._repo_repository.update_repo_tree(repo_id, repo_tree)
+            await self._repo_repository.update_fields(
+                repo_id, repo_tree=repo_tree, total_files=total_files, parsed_files=0
+            )
             logger.info(
                 "repo_tree_updated",
                 repo_id=repo_id,
                 file_count=total_files,
                 tree_valid=validate_repo_tree(repo_tree),
             )
-            
-            await self._repo_repository.update_progress(repo_id, total_files, 0)
             await self._session.commit()
 
+            if self._parse_cache_dir is not None:
+                await asyncio.to_thread(
+                    prune_parse_cache,
+                    self._parse_cache_dir,
+                    self._settings.parse_cache_max_bytes,
+                )
+
             # Parse files in parallel
             parsed_count = 0
             batch_size = self._settings.max_files_per_batch
@@ -128,7 +110,8 @@ class ParsingService:
                 parsed_files = await self._parse_batch(batch)
 
                 # Persist parsed results
-                for discovered, parsed in zip(batch, parsed_files):
+                to_persist: list[tuple[FileRecord, ParsedFile]] = []
+                for discovered, parsed in zip(batch, parsed_files, strict=True):
                     if parsed and not parsed.has_errors:
                         # Track detected languages
                         detected_languages.add(parsed.language.value)
@@ -137,9 +120,11 @@ class ParsingService:
                         folder_structure = build_folder_structure(
                             discovered.relative_path, files
                         )
-                        await self._persist_parsed_file(
-                            repo_id, parsed, folder_structure, discovered.absolute_path
+                        record = self._build_file_record(
+                            parsed, folder_structure, discovered.absolute_path
                         )
+                        if record:
+                            to_persist.append((record, parsed))
                         parsed_count += 1
                     elif parsed and parsed.has_errors:
                         logger.warning(
@@ -148,19 +133,14 @@ class ParsingService:
                             errors=parsed.errors,
                         )
 
+                await self._persist_parsed_files(repo_id, to_persist)
+
                 # Update progress
                 await self._repo_repository.update_progress(
                     repo_id, total_files, min(i + batch_size, total_files)
                 )
                 await self._session.commit()
             
-            # Update detected languages
-            if detected_languages:
-                await self._repo_repository.update_languages(
-                    repo_id, sorted(list(detected_languages))
-                )
-                await self._session.commit()
-
             # Resolve cross-file references
             resolved_count = await self._symbol_repository.resolve_cross_file_references(
                 repo_id
@@ -171,8 +151,11 @@ class ParsingService:
                 resolved_count=resolved_count,
             )
 
-            # Mark as completed
-            await self._repo_repository.update_status(repo_id, RepositoryStatus.COMPLETED)
+            # Mark as completed, recording detected languages in the same UPDATE
+            completion: dict = {"status": RepositoryStatus.COMPLETED.value}
+            if detected_languages:
+                completion["languages"] = sorted(detected_languages)
+            await self._repo_repository.update_fields(repo_id, **completion)
             await self._session.commit()
 
             logger.info(
@@ -194,50 +177,25 @@ class ParsingService:
     async def _parse_batch(
         self, files: list[DiscoveredFile]
     ) -> list[ParsedFile | None]:
-        """Parse a batch of files in parallel using process pool."""
-        loop = asyncio.get_event_loop()
-
-        with ProcessPoolExecutor(max_workers=self._max_workers) as executor:
-            tasks = [
-                loop.run_in_executor(
-                    executor,
-                    partial(
-                        _parse_file_in_process,
-                        f.absolute_path,
-                        f.relative_path,
-                    ),
-                )
-                for f in files
-            ]
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-
-        # Convert exceptions to None
-        parsed: list[ParsedFile | None] = []
-        for i, result in enumerate(results):
-            if isinstance(result, Exception):
-                logger.warning(
-                    "file_parse_exception",
-                    path=files[i].relative_path,
-                    error=str(result),
-                )
-                parsed.append(None)
-            else:
-                parsed.append(result)
-
-        return parsed
+        """Parse a batch of files in parallel worker processes."""
+        jobs = [(f.absolute_path, f.relative_path) for f in files]
+        # The pool blocks while it runs; keep it off the event loop
+        return await asyncio.to_thread(
+            parse_files, jobs, self._max_workers, self._parse_cache_dir
+        )
 
-    async def _persist_parsed_file(
-        self, repo_id: str, parsed: ParsedFile, folder_structure: dict, absolute_path: str
-    ) -> None:
-        """Persist a parsed file's symbols and references."""
+    def _build_file_record(
+        self, parsed: ParsedFile, folder_structure: dict, absolute_path: str
+    ) -> FileRecord | None:
+        """Validate a parsed file and build the file row to persist for it."""
         # Validate parsed file
         if not parsed.relative_path:
             logger.warning("invalid_parsed_file", reason="missing_relative_path")
-            return
+            return None
         
         if not parsed.content_hash:
             logger.warning("invalid_parsed_file", reason="missing_content_hash", path=parsed.relative_path)
-            return
+            return None
         
         # Read file content to store
         content = None
@@ -264,39 +222,51 @@ class ParsingService:
                 error=str(e),
             )
         
-        # Upsert file record
+        return FileRecord(
+            relative_path=parsed.relative_path,
+            language=parsed.language,
+            content_hash=parsed.content_hash,
+            content=content,
+            folder_structure=folder_structure,
+        )
+
+    async def _persist_parsed_files(
+        self, repo_id: str, batch: list[tuple[FileRecord, ParsedFile]]
+    ) -> None:
+        """Persist a batch of parsed files' records, symbols and references."""
+        if not batch:
+            return
+
+        # Upsert all file records in one round-trip
         try:
-            file_id = await self._file_repository.upsert(
-                repo_id=repo_id,
-                relative_path=parsed.relative_path,
-                language=parsed.language,
-                content_hash=parsed.content_hash,
-                content=content,
-                folder_structure=folder_structure,
+            file_ids = await self._file_repository.upsert_many(
+                repo_id, [record for record, _ in batch]
             )
         except Exception as e:
             logger.error(
-                "failed_to_persist_file",
-                path=parsed.relative_path,
+                "failed_to_persist_files",
+                paths=[record.relative_path for record, _ in batch],
                 error=str(e),
             )
             raise
 
         # Bulk insert symbols and references
-        try:
-            await self._symbol_repository.bulk_insert_from_parsed_file(
-                repo_id=repo_id,
-                file_id=file_id,
-                parsed_file=parsed,
-            )
-        except Exception as e:
-            logger.error(
-                "failed_to_persist_symbols",
-                path=parsed.relative_path,
-                file_id=file_id,
-                error=str(e),
-            )
-            raise
+        for record, parsed in batch:
+            file_id = file_ids[record.relative_path]
+            try:
+                await self._symbol_repository.bulk_insert_from_parsed_file(
+                    repo_id=repo_id,
+                    file_id=file_id,
+                    parsed_file=parsed,
+                )
+            except Exception as e:
+                logger.error(
+                    "failed_to_persist_symbols",
+                    path=parsed.relative_path,
+                    file_id=file_id,
+                    error=str(e),
+                )
+                raise
 
     async def should_reparse_file(
         self, repo_id: str, relative_path: str, new_hash: str
@@ -142,3 +142,36 @@ fn main() {
 }
 '''
 
+
+
+@pytest.fixture
+def sample_kotlin_code() -> str:
+    """Sample Kotlin code for testing parsers."""
+    return '''
+package com.example.app
+
+import com.example.svc.Svc
+import com.example.util.Helper
+
+class Controller(private val helper: Helper) {
+    fun handle() {
+        helper.assist()
+        helper.assist()
+        local()
+    }
+
+    fun local() {}
+
+    companion object {
+        fun create(): Controller = Controller(Helper())
+    }
+}
+
+object Registry {
+    fun register() {}
+}
+
+fun topLevel() {
+    Svc.boot()
+}
+'''
@@ -1,14 +1,39 @@
 """Tests for language parsers."""
 
+import hashlib
+import os
+from dataclasses import replace
+
 import pytest
 
 from code_parser.core import Language, ReferenceType, SymbolKind
+from code_parser.parsers import SourceEdit, kotlin_parser, parse_files
 from code_parser.parsers.python_parser import PythonParser
 from code_parser.parsers.java_parser import JavaParser
 from code_parser.parsers.javascript_parser import JavaScriptParser
+from code_parser.parsers.kotlin_parser import KotlinParser
 from code_parser.parsers.rust_parser import RustParser
 
 
+def _replace_edit(source: str, old: str, new: str) -> tuple[str, SourceEdit]:
+    """Replace the first `old` in ASCII `source` and describe the edit."""
+    start = source.index(old)
+    new_source = source[:start] + new + source[start + len(old) :]
+
+    def point(text: str, offset: int) -> tuple[int, int]:
+        return (text.count("\n", 0, offset), offset - text.rfind("\n", 0, offset) - 1)
+
+    edit = SourceEdit(
+        start_byte=start,
+        old_end_byte=start + len(old),
+        new_end_byte=start + len(new),
+        start_point=point(source, start),
+        old_end_point=point(source, start + len(old)),
+        new_end_point=point(new_source, start + len(new)),
+    )
+    return new_source, edit
+
+
 class TestPythonParser:
     """Tests for Python parser."""
 
@@ -72,6 +97,49 @@ def callee():
         assert len(call_refs) >= 1
         assert any(r.target_qualified_name == "callee" for r in call_refs)
 
+    def test_parse_docstrings(self, parser: PythonParser):
+        code = """
+def triple():
+    \"\"\"  Triple quoted.  \"\"\"
+
+def single():
+    'Single quoted.'
+"""
+        result = parser.parse(code, "test.py", "abc123")
+
+        docstrings = {s.name: s.metadata["docstring"] for s in result.symbols}
+        assert docstrings == {"triple": "Triple quoted.", "single": "Single quoted."}
+
+    def test_parse_incremental_matches_full_parse(
+        self, parser: PythonParser, sample_python_code: str
+    ):
+        new_source, edit = _replace_edit(
+            sample_python_code, "return data.strip()", "return self._normalize(data)"
+        )
+        _, tree = parser.parse_incremental(sample_python_code, "sample.py", "h1", edit, None)
+
+        result, _ = parser.parse_incremental(new_source, "sample.py", "h2", edit, tree)
+
+        assert result == parser.parse(new_source, "sample.py", "h2")
+        assert any(r.target_symbol_name == "_normalize" for r in result.references)
+
+    def test_parse_path_matches_parse(
+        self, parser: PythonParser, sample_python_code: str, tmp_path
+    ):
+        path = tmp_path / "sample.py"
+        path.write_text(sample_python_code)
+        content_hash = hashlib.sha256(sample_python_code.encode()).hexdigest()
+
+        result = parser.parse_path(str(path), "sample.py")
+
+        assert result == parser.parse(sample_python_code, "sample.py", content_hash)
+
+    def test_parse_files_error_language(self, tmp_path):
+        results = parse_files([(str(tmp_path / "missing.py"), "missing.py")])
+
+        assert results[0].language == Language.PYTHON
+        assert results[0].has_errors
+
     def test_parse_inheritance(self, parser: PythonParser, sample_python_code: str):
         result = parser.parse(sample_python_code, "sample.py", "abc123")
 
@@ -137,6 +205,250 @@ class TestJavaScriptParser:
         func_symbols = [s for s in result.symbols if s.kind == SymbolKind.FUNCTION]
         assert any(s.name == "formatResult" for s in func_symbols)
 
+    def test_parse_jsdoc(self, parser: JavaScriptParser):
+        code = """
+// plain comment
+/**
+ * Adds two numbers.
+ * @param a first
+ */
+function add(a, b) {
+    return a + b;
+}
+"""
+        result = parser.parse(code, "math.js", "abc123")
+
+        func = next(s for s in result.symbols if s.name == "add")
+        assert func.metadata["jsdoc"] == "Adds two numbers.\n@param a first"
+
+
+class TestKotlinParser:
+    """Tests for Kotlin parser."""
+
+    PATH = "src/main/kotlin/com/example/app/Controller.kt"
+    MODULE = "src.main.kotlin.com.example.app.Controller"
+
+    @pytest.fixture
+    def parser(self) -> KotlinParser:
+        return KotlinParser()
+
+    def test_language(self, parser: KotlinParser):
+        assert parser.language == Language.KOTLIN
+
+    def test_file_extensions(self, parser: KotlinParser):
+        assert ".kt" in parser.file_extensions
+        assert ".kts" in parser.file_extensions
+
+    def test_parse_class(self, parser: KotlinParser, sample_kotlin_code: str):
+        result = parser.parse(sample_kotlin_code, self.PATH, "abc123")
+
+        classes = {s.name: s for s in result.symbols if s.kind == SymbolKind.CLASS}
+        assert classes["Controller"].qualified_name == f"{self.MODULE}.Controller"
+
+        methods = {s.name: s for s in result.symbols if s.kind == SymbolKind.METHOD}
+        assert methods["handle"].parent_qualified_name == f"{self.MODULE}.Controller"
+        assert methods["local"].parent_qualified_name == f"{self.MODULE}.Controller"
+
+    def test_parse_object(self, parser: KotlinParser, sample_kotlin_code: str):
+        result = parser.parse(sample_kotlin_code, self.PATH, "abc123")
+
+        registry = next(s for s in result.symbols if s.name == "Registry")
+        assert registry.metadata["is_object"] is True
+        register = next(s for s in result.symbols if s.name == "register")
+        assert register.parent_qualified_name == f"{self.MODULE}.Registry"
+
+    def test_parse_companion_object(self, parser: KotlinParser, sample_kotlin_code: str):
+        result = parser.parse(sample_kotlin_code, self.PATH, "abc123")
+
+        companion = next(s for s in result.symbols if s.name == "Companion")
+        assert companion.metadata["is_companion"] is True
+        assert companion.parent_qualified_name == f"{self.MODULE}.Controller"
+        create = next(s for s in result.symbols if s.name == "create")
+        assert create.parent_qualified_name == f"{self.MODULE}.Controller.Companion"
+
+    def test_parse_top_level_function(self, parser: KotlinParser, sample_kotlin_code: str):
+        result = parser.parse(sample_kotlin_code, self.PATH, "abc123")
+
+        functions = [s for s in result.symbols if s.kind == SymbolKind.FUNCTION]
+        assert [s.name for s in functions] == ["topLevel"]
+
+    def test_parse_imports(self, parser: KotlinParser, sample_kotlin_code: str):
+        result = parser.parse(sample_kotlin_code, self.PATH, "abc123")
+
+        import_symbols = [s.name for s in result.symbols if s.kind == SymbolKind.IMPORT]
+        assert import_symbols == ["Svc", "Helper"]
+        import_refs = {
+            (r.target_file_path, r.target_symbol_name)
+            for r in result.references
+            if r.reference_type == ReferenceType.IMPORT
+        }
+        assert import_refs == {("com.example.svc", "Svc"), ("com.example.util", "Helper")}
+
+    def test_parse_call_references(self, parser: KotlinParser, sample_kotlin_code: str):
+        result = parser.parse(sample_kotlin_code, self.PATH, "abc123")
+
+        calls = {
+            (r.source_symbol_name, r.target_file_path, r.target_symbol_name)
+            for r in result.references
+            if r.reference_type == ReferenceType.CALL
+        }
+        # Constructor parameter type, sibling method and imported object
+        assert ("handle", "com.example.util.Helper", "assist") in calls
+        assert ("handle", f"{self.MODULE}.Controller", "local") in calls
+        assert ("topLevel", "com.example.svc.Svc", "boot") in calls
+
+    TYPED_PROPERTY_CODE = """
+package com.example.app
+
+import com.example.svc.Svc
+
+class Runner {
+    val s: Svc = Svc()
+
+    fun go() {
+        s.run()
+    }
+}
+"""
+
+    def test_parse_typed_property_call(self, parser: KotlinParser):
+        result = parser.parse(self.TYPED_PROPERTY_CODE, self.PATH, "abc123")
+
+        calls = {
+            (r.source_symbol_name, r.target_file_path, r.target_symbol_name)
+            for r in result.references
+            if r.reference_type == ReferenceType.CALL
+        }
+        assert ("go", "com.example.svc.Svc", "run") in calls
+
+    def test_parse_incremental_matches_full_parse(
+        self, parser: KotlinParser, sample_kotlin_code: str
+    ):
+        new_source, edit = _replace_edit(
+            sample_kotlin_code, "        local()\n", "        Svc.boot()\n"
+        )
+        _, tree = parser.parse_incremental(sample_kotlin_code, self.PATH, "h1", edit, None)
+
+        result, new_tree = parser.parse_incremental(new_source, self.PATH, "h2", edit, tree)
+
+        assert result == parser.parse(new_source, self.PATH, "h2")
+        assert ("handle", "com.example.svc.Svc", "boot") in {
+            (r.source_symbol_name, r.target_file_path, r.target_symbol_name)
+            for r in result.references
+        }
+        assert new_tree.root_node.end_byte == len(new_source)
+
+    def test_cache_disabled_by_default(
+        self,
+        parser: KotlinParser,
+        sample_kotlin_code: str,
+        tmp_path,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        monkeypatch.chdir(tmp_path)
+
+        parser.parse(sample_kotlin_code, self.PATH, "abc123")
+
+        assert not any(tmp_path.iterdir())
+
+    def test_cache_round_trip(
+        self, sample_kotlin_code: str, tmp_path, monkeypatch: pytest.MonkeyPatch
+    ):
+        parsed = KotlinParser(cache_dir=tmp_path).parse(sample_kotlin_code, self.PATH, "abc123")
+
+        # A fresh parser answers from the cache without running tree-sitter
+        def fail(*_args):
+            raise AssertionError("cache miss")
+
+        cached_parser = KotlinParser(cache_dir=tmp_path)
+        monkeypatch.setattr(cached_parser, "_parse_source", fail)
+        assert cached_parser.parse(sample_kotlin_code, self.PATH, "abc123") == parsed
+
+    def test_cache_misses_on_changed_source(self, sample_kotlin_code: str, tmp_path):
+        KotlinParser(cache_dir=tmp_path).parse(sample_kotlin_code, self.PATH, "abc123")
+
+        # Same path and caller-supplied hash, different source
+        result = KotlinParser(cache_dir=tmp_path).parse(
+            self.TYPED_PROPERTY_CODE, self.PATH, "abc123"
+        )
+
+        assert [s.name for s in result.symbols if s.kind == SymbolKind.CLASS] == ["Runner"]
+
+    def test_cache_misses_on_other_path_or_hash(self, sample_kotlin_code: str, tmp_path):
+        parser = KotlinParser(cache_dir=tmp_path)
+        parser.parse(sample_kotlin_code, self.PATH, "abc123")
+
+        moved = parser.parse(sample_kotlin_code, "Other.kt", "abc123")
+        rehashed = parser.parse(sample_kotlin_code, self.PATH, "def456")
+
+        assert moved.relative_path == "Other.kt"
+        assert all(s.qualified_name.startswith("Other.") for s in moved.symbols)
+        assert rehashed.content_hash == "def456"
+
+    def test_prune_parse_cache(self, tmp_path):
+        parser = KotlinParser(cache_dir=tmp_path)
+        entries = []
+        for i in range(3):
+            before = set(tmp_path.glob("*/*.pkl"))
+            parser.parse(f"fun f{i}() {{}}\n", f"F{i}.kt", f"hash{i}")
+            (entry,) = set(tmp_path.glob("*/*.pkl")) - before
+            os.utime(entry, (i, i))
+            entries.append(entry)
+        newest_size = entries[-1].stat().st_size
+
+        removed = kotlin_parser.prune_parse_cache(tmp_path, newest_size)
+
+        assert removed == 2
+        assert list(tmp_path.glob("*/*.pkl")) == [entries[-1]]
+
+    def test_cache_ignores_older_format(self, tmp_path, monkeypatch: pytest.MonkeyPatch):
+        # Fill the cache the way a build with the previous format would
+        # have, leaving the typed-property call unresolved
+        parse_source = KotlinParser._parse_source
+        monkeypatch.setattr(kotlin_parser, "_CACHE_FORMAT", kotlin_parser._CACHE_FORMAT - 1)
+        monkeypatch.setattr(
+            KotlinParser,
+            "_parse_source",
+            lambda self, *args: replace(parse_source(self, *args), references=()),
+        )
+        KotlinParser(cache_dir=tmp_path).parse(self.TYPED_PROPERTY_CODE, self.PATH, "abc123")
+        assert any(tmp_path.rglob("*.pkl"))
+        monkeypatch.undo()
+
+        result = KotlinParser(cache_dir=tmp_path).parse(
+            self.TYPED_PROPERTY_CODE, self.PATH, "abc123"
+        )
+
+        assert any(r.target_symbol_name == "run" for r in result.references)
+
+    def test_duplicate_calls_recorded_once(self, parser: KotlinParser, sample_kotlin_code: str):
+        result = parser.parse(sample_kotlin_code, self.PATH, "abc123")
+
+        assist_calls = [r for r in result.references if r.target_symbol_name == "assist"]
+        assert len(assist_calls) == 1
+
+    def test_late_import_rewalk(
+        self, parser: KotlinParser, sample_kotlin_code: str, monkeypatch: pytest.MonkeyPatch
+    ):
+        expected = parser.parse(sample_kotlin_code, self.PATH, "abc123")
+
+        # The grammar never yields an import after a declaration, so flag the
+        # first walk as having seen one to force the second walk
+        walk = KotlinParser._walk
+        walks = []
+
+        def flag_late_import(self, root, ctx):
+            walks.append(ctx.imports_complete)
+            walk(self, root, ctx)
+            if not ctx.imports_complete:
+                ctx.late_import = True
+
+        monkeypatch.setattr(KotlinParser, "_walk", flag_late_import)
+        result = parser.parse(sample_kotlin_code, self.PATH, "abc123")
+
+        assert walks == [False, True]
+        assert result == expected
+
 
 class TestRustParser:
     """Tests for Rust parser."""
@@ -171,3 +483,75 @@ class TestRustParser:
         func_names = [s.name for s in func_symbols]
         assert "process_config" in func_names or "main" in func_names
 
+    def test_parse_doc_comment(self, parser: RustParser):
+        code = """
+// plain comment
+/// Adds two numbers.
+///
+/// Wraps on overflow.
+pub fn add(a: u32, b: u32) -> u32 {
+    a.wrapping_add(b)
+}
+"""
+        result = parser.parse(code, "math.rs", "abc123")
+
+        func = next(s for s in result.symbols if s.name == "add")
+        assert func.metadata["doc_comment"] == "Adds two numbers.\nWraps on overflow."
+
+
+class TestParseFiles:
+    """Tests for parallel parsing of files on disk."""
+
+    @pytest.fixture
+    def sources(self, tmp_path) -> list[tuple[str, str]]:
+        files = {
+            "pkg/a.py": "def a():\n    return 1\n",
+            "src/B.kt": "class B {\n    fun b() {}\n}\n",
+            "notes.txt": "not source code\n",
+            "src/c.rs": "fn c() {}\n",
+            "pkg/d.py": "class D:\n    pass\n",
+        }
+        jobs = []
+        for relative_path, content in files.items():
+            path = tmp_path / relative_path
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(content)
+            jobs.append((str(path), relative_path))
+        return jobs
+
+    def test_results_in_input_order(self, sources: list[tuple[str, str]]):
+        results = parse_files(sources, max_workers=2)
+
+        assert [r.relative_path if r else None for r in results] == [
+            "pkg/a.py",
+            "src/B.kt",
+            None,
+            "src/c.rs",
+            "pkg/d.py",
+        ]
+        assert results[1].language == Language.KOTLIN
+        assert [s.name for s in results[1].symbols] == ["B", "b"]
+
+    def test_workers_match_in_process(self, sources: list[tuple[str, str]]):
+        assert parse_files(sources, max_workers=2) == parse_files(sources, max_workers=1)
+
+    def test_failing_file_yields_error(self, tmp_path):
+        missing = tmp_path / "Missing.kt"
+
+        results = parse_files([(str(missing), "Missing.kt")])
+
+        assert len(results) == 1
+        assert results[0].relative_path == "Missing.kt"
+        assert results[0].language == Language.KOTLIN
+        assert results[0].has_errors
+        assert results[0].symbols == ()
+
+    def test_empty_kotlin_file(self, tmp_path):
+        path = tmp_path / "Empty.kt"
+        path.write_bytes(b"")
+
+        result = KotlinParser().parse_path(str(path), "Empty.kt")
+
+        assert not result.has_errors
+        assert result.symbols == ()
+        assert result.content_hash == hashlib.sha256(b"").hexdigest()
@@ -0,0 +1,99 @@
+"""Tests for the request-scoped repository read cache."""
+
+import pytest
+
+from code_parser.repositories.request_cache import (
+    invalidates_request_cache,
+    request_cache_scope,
+    request_cached,
+)
+
+
+class CountingRepository:
+    """Repository stand-in that counts the reads reaching its body."""
+
+    def __init__(self, session: object) -> None:
+        self._session = session
+        self.reads = 0
+
+    @request_cached
+    async def get(self, key: str, *, fresh: bool = False) -> tuple[str, bool, int]:
+        self.reads += 1
+        return key, fresh, self.reads
+
+    @invalidates_request_cache
+    async def update(self, key: str) -> str:
+        return key
+
+    @invalidates_request_cache
+    async def fail_update(self) -> None:
+        raise RuntimeError("write failed")
+
+
+class TestRequestCache:
+    """Tests for request_cached and invalidates_request_cache."""
+
+    @pytest.fixture
+    def repo(self) -> CountingRepository:
+        return CountingRepository(session=object())
+
+    async def test_repeated_read_hits_cache(self, repo: CountingRepository):
+        with request_cache_scope():
+            first = await repo.get("a")
+            second = await repo.get("a")
+
+        assert first == second == ("a", False, 1)
+        assert repo.reads == 1
+
+    async def test_arguments_are_part_of_key(self, repo: CountingRepository):
+        with request_cache_scope():
+            await repo.get("a")
+            await repo.get("b")
+            await repo.get("a", fresh=True)
+
+        assert repo.reads == 3
+
+    async def test_key_includes_session(self):
+        session = object()
+        repo = CountingRepository(session)
+        same_session = CountingRepository(session)
+        other_session = CountingRepository(object())
+
+        with request_cache_scope():
+            await repo.get("a")
+            assert await same_session.get("a") == ("a", False, 1)
+            assert await other_session.get("a") == ("a", False, 1)
+
+        assert (repo.reads, same_session.reads, other_session.reads) == (1, 0, 1)
+
+    async def test_write_clears_cache(self, repo: CountingRepository):
+        with request_cache_scope():
+            await repo.get("a")
+            assert await repo.update("a") == "a"
+            await repo.get("a")
+
+        assert repo.reads == 2
+
+    async def test_failed_write_clears_cache(self, repo: CountingRepository):
+        with request_cache_scope():
+            await repo.get("a")
+            with pytest.raises(RuntimeError):
+                await repo.fail_update()
+            await repo.get("a")
+
+        assert repo.reads == 2
+
+    async def test_pass_through_outside_scope(self, repo: CountingRepository):
+        await repo.get("a")
+        await repo.get("a")
+        assert await repo.update("a") == "a"
+
+        assert repo.reads == 2
+
+    async def test_scope_does_not_outlive_request(self, repo: CountingRepository):
+        with request_cache_scope():
+            await repo.get("a")
+        with request_cache_scope():
+            await repo.get("a")
+
+        assert repo.reads == 2